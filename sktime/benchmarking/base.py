@@ -69,6 +69,24 @@ class BaseResults:
         """Loads predictions for all datasets and strategies iteratively"""
         raise NotImplementedError()
 
+    def load_all_predictions(self, cv_folds, train_or_test):
+        """Loads predictions for all cv folds, datasets and strategies
+        iteratively
+
+        Parameters
+        ----------
+        cv_folds : list of int
+        train_or_test : str
+
+        Yields
+        ------
+        cv_fold : int
+        result : _PredictionsWrapper
+        """
+        for cv_fold in cv_folds:
+            for result in self.load_predictions(cv_fold, train_or_test):
+                yield cv_fold, result
+
     def check_predictions_exist(self, strategy, dataset_name, cv_fold, train_or_test):
         raise NotImplementedError()
 
@@ -83,6 +101,20 @@ class BaseResults:
     def check_fitted_strategy_exists(self, strategy, dataset_name, cv_fold):
         raise NotImplementedError()
 
+    def register_existing(self, strategy_name, dataset_name):
+        """Register results which already exist, e.g. when the orchestrator
+        skips a unit whose predictions and fitted strategy were saved in an
+        earlier run.
+
+        Parameters
+        ----------
+        strategy_name : str
+            Name of strategy
+        dataset_name : str
+            Name of dataset
+        """
+        self._append_key(strategy_name, dataset_name)
+
     def _append_key(self, strategy_name, dataset_name):
         """Append names of datasets and strategies to results objects during
         orchestration"""
@@ -81,30 +81,29 @@ class Evaluator:
             )
 
         # load all predictions
-        for cv_fold in cv_folds:
-            for result in self.results.load_predictions(
-                cv_fold=cv_fold, train_or_test=train_or_test
-            ):
-                # unwrap result object
-                strategy_name = result.strategy_name
-                dataset_name = result.dataset_name
-                # index = result.index
-                y_true = result.y_true
-                y_pred = result.y_pred
-                # y_proba = result.y_proba
-
-                # compute metric
-                mean, stderr = metric.compute(y_true, y_pred)
-
-                # store results
-                metric_dict = {
-                    "dataset": dataset_name,
-                    "strategy": strategy_name,
-                    "cv_fold": cv_fold,
-                    self._get_column_name(metric.name, suffix="mean"): mean,
-                    self._get_column_name(metric.name, suffix="stderr"): stderr,
-                }
-                self._metric_dicts.append(metric_dict)
+        for cv_fold, result in self.results.load_all_predictions(
+            cv_folds=cv_folds, train_or_test=train_or_test
+        ):
+            # unwrap result object
+            strategy_name = result.strategy_name
+            dataset_name = result.dataset_name
+            # index = result.index
+            y_true = result.y_true
+            y_pred = result.y_pred
+            # y_proba = result.y_proba
+
+            # compute metric
+            mean, stderr = metric.compute(y_true, y_pred)
+
+            # store results
+            metric_dict = {
+                "dataset": dataset_name,
+                "strategy": strategy_name,
+                "cv_fold": cv_fold,
+                self._get_column_name(metric.name, suffix="mean"): mean,
+                self._get_column_name(metric.name, suffix="stderr"): stderr,
+            }
+            self._metric_dicts.append(metric_dict)
 
         # update metrics dataframe with computed metrics
         metrics = pd.DataFrame(self._metric_dicts)
@@ -2,6 +2,12 @@ __all__ = ["PairwiseMetric", "AggregateMetric"]
 __author__ = ["Viktor Kazakov", "Markus Löning"]
 
 import numpy as np
+import pandas as pd
+from sklearn.metrics import accuracy_score
+from sklearn.metrics import mean_absolute_error
+from sklearn.metrics import mean_squared_error
+from sklearn.metrics import zero_one_loss
+from sklearn.utils import check_random_state
 
 from sktime.benchmarking.base import BaseMetric
 
@@ -28,14 +34,37 @@ class PairwiseMetric(BaseMetric):
 
 
 class AggregateMetric(BaseMetric):
-
-    def __init__(self, func, method="jackknife", name=None, **kwargs):
-        allowed_methods = ("jackknife",)
+    """Metric computed over all instances, with its standard error estimated
+    by resampling
+
+    Parameters
+    ----------
+    func : callable
+        Metric function with signature `func(y_true, y_pred, **kwargs)`.
+        The metric must not depend on the order of the instances.
+    method : str, optional (default="jackknife")
+        Method to estimate the standard error, either "jackknife" or
+        "bootstrap".
+    name : str, optional (default=None)
+        Name of the metric, defaults to the name of `func`.
+    n_resamples : int, optional (default=1000)
+        Number of bootstrap resamples, only used if `method="bootstrap"`.
+    random_state : int, RandomState instance or None, optional (default=None)
+        Random state of the bootstrap resampling.
+    kwargs : dict
+        Keyword arguments passed to `func`.
+    """
+
+    def __init__(self, func, method="jackknife", name=None,
+                 n_resamples=1000, random_state=None, **kwargs):
+        allowed_methods = ("jackknife", "bootstrap")
         if method not in allowed_methods:
             raise NotImplementedError(
                 f"Provided method is not implemented yet. "
                 f"Currently only: {allowed_methods} are implemented")
         self.method = method
+        self.n_resamples = n_resamples
+        self.random_state = random_state
 
         name = func.__name__ if name is None else name
         self.func = func
@@ -45,6 +74,10 @@ class AggregateMetric(BaseMetric):
     def compute(self, y_true, y_pred):
         """Compute metric and standard error
 
+        For metrics which are means of pointwise metrics, such as the
+        accuracy or the mean squared error, the resampled metrics are
+        computed from the pointwise metrics in O(n) time.
+
         References:
         -----------
         .. [1] Efron and Stein, (1981), "The jackknife estimate of variance."
@@ -60,24 +93,80 @@ class AggregateMetric(BaseMetric):
         .. [4] Jackknife resampling
         <https://en.wikipedia.org/wiki/Jackknife_resampling>
         """
+        y_true = np.asarray(y_true)
+        y_pred = np.asarray(y_pred)
+
         # compute aggregate metric
         mean = self.func(y_true, y_pred, **self.kwargs)
 
-        # compute stderr based on jackknifed metrics
-        n_instances = len(y_true)
-        index = np.arange(n_instances)
+        pointwise_metric = self._compute_pointwise_metric(y_true, y_pred)
+        if self.method == "bootstrap":
+            # compute stderr based on bootstrapped metrics
+            boot_metric = self._compute_bootstrap_metric(
+                y_true, y_pred, pointwise_metric)
+            return mean, np.std(boot_metric, ddof=1)
 
-        # get jackknife samples of index
-        jack_idx = self._jackknife_resampling(index)
+        # compute stderr based on jackknifed metrics
+        jack_metric = self._compute_jackknife_metric(
+            y_true, y_pred, pointwise_metric)
+        jack_stderr = self._compute_jackknife_stderr(jack_metric)
+        return mean, jack_stderr
 
-        # compute metrics on jackknife samples
-        jack_pointwise_metric = np.array(
-            [self.func(y_true[idx], y_pred[idx], **self.kwargs)
-             for idx in jack_idx])
+    def _compute_pointwise_metric(self, y_true, y_pred):
+        """Compute pointwise metrics whose mean is the metric, or return None
+        if the metric is not such a mean"""
+        pointwise_func = _POINTWISE_METRICS.get(self.func)
+        if pointwise_func is None or self.kwargs or y_true.ndim != 1:
+            return None
+        return pointwise_func(y_true, y_pred).astype(np.float64)
+
+    def _compute_jackknife_metric(self, y_true, y_pred, pointwise_metric):
+        """Compute metrics on jackknife samples"""
+        n_instances = y_true.shape[0]
+        if pointwise_metric is not None:
+            total = np.sum(pointwise_metric)
+            return (total - pointwise_metric) / (n_instances - 1)
+
+        # the metric of a jackknife sample only depends on the pair of true
+        # and predicted values left out, so that it is only computed once
+        # for each distinct pair
+        if y_true.ndim == 1 and y_pred.ndim == 1:
+            true_codes = pd.factorize(y_true)[0] + 1
+            pred_codes, pred_uniques = pd.factorize(y_pred)
+            pair_codes = true_codes * (len(pred_uniques) + 1) + pred_codes + 1
+            _, left_out, inverse = np.unique(
+                pair_codes, return_index=True, return_inverse=True)
+        else:
+            left_out = np.arange(n_instances)
+            inverse = left_out
 
-        # compute standard error over jackknifed metrics
-        jack_stderr = self._compute_jackknife_stderr(jack_pointwise_metric)
-        return mean, jack_stderr
+        index = np.arange(n_instances)
+        batch_size = max(1, _MAX_BATCH_SIZE // n_instances)
+        jack_metric = np.empty(len(left_out))
+        for start in range(0, len(left_out), batch_size):
+            batch = left_out[start:start + batch_size]
+            jack_idx = self._jackknife_resampling(index, left_out=batch)
+            jack_metric[start:start + len(batch)] = [
+                self.func(y_true[idx], y_pred[idx], **self.kwargs)
+                for idx in jack_idx]
+        return jack_metric[inverse]
+
+    def _compute_bootstrap_metric(self, y_true, y_pred, pointwise_metric):
+        """Compute metrics on bootstrap samples"""
+        n_instances = y_true.shape[0]
+        rng = check_random_state(self.random_state)
+        batch_size = max(1, _MAX_BATCH_SIZE // n_instances)
+        boot_metric = np.empty(self.n_resamples)
+        for start in range(0, self.n_resamples, batch_size):
+            n_samples = min(batch_size, self.n_resamples - start)
+            boot_idx = rng.randint(n_instances, size=(n_samples, n_instances))
+            if pointwise_metric is not None:
+                values = np.mean(pointwise_metric[boot_idx], axis=1)
+            else:
+                values = [self.func(y_true[idx], y_pred[idx], **self.kwargs)
+                          for idx in boot_idx]
+            boot_metric[start:start + n_samples] = values
+        return boot_metric
 
     @staticmethod
     def _compute_jackknife_stderr(x):
@@ -92,7 +181,7 @@ class AggregateMetric(BaseMetric):
         return np.sqrt(n_instances - 1) * np.std(x)
 
     @staticmethod
-    def _jackknife_resampling(x):
+    def _jackknife_resampling(x, left_out=None):
         """Performs jackknife resampling on numpy arrays.
 
         Jackknife resampling is a technique to generate 'n' deterministic
@@ -111,6 +200,9 @@ class AggregateMetric(BaseMetric):
             Original sample (1-D array) from which the jackknife resamples
             will be
             generated.
+        left_out : numpy.ndarray, optional (default=None)
+            Indices of the measurements removed from the resamples to
+            generate, by default all resamples are generated.
 
         Returns
         -------
@@ -125,13 +217,22 @@ class AggregateMetric(BaseMetric):
         http://docs.astropy.org/en/stable/_modules/astropy/stats/jackknife.html
         """
         n_instances = x.shape[0]
+        if left_out is None:
+            left_out = np.arange(n_instances)
+
+        # skip the left out measurement by shifting the indices from it on
+        index = np.arange(n_instances - 1)
+        index = index + (index >= np.asarray(left_out)[:, np.newaxis])
+        return x[index]
 
-        # preallocate array
-        dtype = x.dtype
-        resamples = np.empty([n_instances, n_instances - 1], dtype=dtype)
 
-        # jackknife resampling
-        for i in range(n_instances):
-            resamples[i] = np.delete(x, i)
+# functions of pointwise metrics whose mean gives the metric
+_POINTWISE_METRICS = {
+    accuracy_score: lambda y_true, y_pred: y_true == y_pred,
+    zero_one_loss: lambda y_true, y_pred: y_true != y_pred,
+    mean_squared_error: lambda y_true, y_pred: (y_true - y_pred) ** 2,
+    mean_absolute_error: lambda y_true, y_pred: np.abs(y_true - y_pred),
+}
 
-        return resamples
+# maximum number of elements of the index arrays of a batch of resamples
+_MAX_BATCH_SIZE = 10 ** 7
@@ -2,11 +2,16 @@
 __all__ = ["Orchestrator"]
 __author__ = ["Viktor Kazakov", "Markus Löning"]
 
+import logging
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+
+import pandas as pd
+from joblib import effective_n_jobs
 from sklearn.base import clone
 from sktime.benchmarking.tasks import TSCTask
 from sktime.benchmarking.tasks import TSRTask
-import pandas as pd
-import logging
 
 log = logging.getLogger()
 console = logging.StreamHandler()
@@ -119,8 +124,28 @@ class Orchestrator:
         save_fitted_strategies=True,
         overwrite_fitted_strategies=False,
         verbose=False,
+        n_jobs=None,
     ):
-        """Fit and predict"""
+        """Fit and predict
+
+        Each combination of dataset, strategy and cv fold is a separate unit
+        of work, whose results are saved as soon as it is done, so that an
+        interrupted run can be resumed without re-running completed units.
+
+        Parameters
+        ----------
+        overwrite_predictions : bool, optional (default=False)
+        predict_on_train : bool, optional (default=False)
+        save_fitted_strategies : bool, optional (default=True)
+        overwrite_fitted_strategies : bool, optional (default=False)
+        verbose : bool, optional (default=False)
+        n_jobs : int or None, optional (default=None)
+            The number of worker processes to run the units of work in
+            parallel. ``None`` means 1 unless in a
+            :obj:`joblib.parallel_backend` context. ``-1`` means using all
+            processors. The units are run largest dataset first and each
+            worker keeps the dataset it last loaded in memory.
+        """
 
         # check that for fitted strategies overwrite option is only set when
         # save option is set
@@ -134,108 +159,148 @@ class Orchestrator:
                 f"{save_fitted_strategies}"
             )
 
-        # fitting and prediction
-        for task, dataset, data, strategy, cv_fold, train_idx, test_idx in self._iter():
-
-            # check which results already exist
-            train_pred_exist = self.results.check_predictions_exist(
-                strategy.name, dataset.name, cv_fold, train_or_test="train"
-            )
-            test_pred_exist = self.results.check_predictions_exist(
-                strategy.name, dataset.name, cv_fold, train_or_test="test"
-            )
-            fitted_stategy_exists = self.results.check_fitted_strategy_exists(
-                strategy.name, dataset.name, cv_fold
-            )
+        units = self._get_units(
+            overwrite_predictions,
+            predict_on_train,
+            save_fitted_strategies,
+            overwrite_fitted_strategies,
+        )
 
-            # skip if overwrite is set to False for both predictions and
-            # strategies and all results exist
-            if (
-                not overwrite_predictions
-                and test_pred_exist
-                and (train_pred_exist or not predict_on_train)
-                and not overwrite_fitted_strategies
-                and (fitted_stategy_exists or not save_fitted_strategies)
-            ):
-                log.warn(
-                    f"Skipping strategy: {strategy.name} on CV-fold: "
-                    f"{cv_fold} of dataset: {dataset.name}"
-                )
-                continue
+        # the run id makes sure that data cached in previous runs, which forked
+        # workers inherit, are not used
+        run_id = uuid.uuid4().hex
+        n_jobs = effective_n_jobs(n_jobs)
+        try:
+            if n_jobs == 1:
+                for unit in units:
+                    result = _fit_predict_one(run_id, *unit[1:])
+                    self._save_unit(unit, result, verbose)
+            else:
+                # a private pool, rather than the executor shared with joblib,
+                # which must not be shut down or resized by the orchestrator
+                with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                    futures = {
+                        executor.submit(_fit_predict_one, run_id, *unit[1:]): unit
+                        for unit in units
+                    }
+                    try:
+                        for future in as_completed(futures):
+                            self._save_unit(futures[future], future.result(), verbose)
+                    except BaseException:
+                        for future in futures:
+                            future.cancel()
+                        raise
+        finally:
+            _DATA_CACHE.clear()
 
-            # split data into training and test sets
-            train = data.iloc[train_idx]
-            test = data.iloc[test_idx]
+        # save results as master file
+        self.results.save()
 
-            # fit strategy
-            self._print_progress(
-                dataset.name, strategy.name, cv_fold, "train", "fit", verbose
-            )
-            fit_estimator_start_time = pd.Timestamp.now()
-            strategy.fit(task, train)
-            fit_estimator_end_time = pd.Timestamp.now()
-
-            # save fitted strategy if save fitted strategies is set to True
-            # and overwrite is set to True or the
-            # fitted strategy does not already exist
-            if save_fitted_strategies and (
-                overwrite_fitted_strategies or not fitted_stategy_exists
-            ):
-                self.results.save_fitted_strategy(
-                    strategy, dataset_name=dataset.name, cv_fold=cv_fold
-                )
+    def _get_units(
+        self,
+        overwrite_predictions,
+        predict_on_train,
+        save_fitted_strategies,
+        overwrite_fitted_strategies,
+    ):
+        """Units of work which remain to be done, largest dataset first"""
+        units = []
+        costs = []
+        for dataset_index, (task, dataset) in enumerate(zip(self.tasks, self.datasets)):
+            # load data to split it and to estimate the cost of fitting on it
+            data = dataset.load()
+            y = data[task.target]
+            splits = list(self.cv.split(data, y))
+            cost = _estimate_cost(data, task)
+            del data, y
+
+            for strategy_index, strategy in enumerate(self.strategies):
+                for cv_fold, (train_idx, test_idx) in enumerate(splits):
+                    # check which results already exist
+                    train_pred_exist = self.results.check_predictions_exist(
+                        strategy.name, dataset.name, cv_fold, train_or_test="train"
+                    )
+                    test_pred_exist = self.results.check_predictions_exist(
+                        strategy.name, dataset.name, cv_fold, train_or_test="test"
+                    )
+                    fitted_stategy_exists = self.results.check_fitted_strategy_exists(
+                        strategy.name, dataset.name, cv_fold
+                    )
+
+                    # skip if overwrite is set to False for both predictions
+                    # and strategies and all results exist
+                    if (
+                        not overwrite_predictions
+                        and test_pred_exist
+                        and (train_pred_exist or not predict_on_train)
+                        and not overwrite_fitted_strategies
+                        and (fitted_stategy_exists or not save_fitted_strategies)
+                    ):
+                        log.warn(
+                            f"Skipping strategy: {strategy.name} on CV-fold: "
+                            f"{cv_fold} of dataset: {dataset.name}"
+                        )
+                        # register the existing results
+                        self.results.register_existing(strategy.name, dataset.name)
+                        continue
 
-            # optionally, predict on training set if predict on train is set
-            # to True and and overwrite is set to True
-            # or the predicted values do not already exist
-            if predict_on_train and (overwrite_predictions or not train_pred_exist):
-                y_true = train.loc[:, task.target]
-                predict_estimator_start_time = pd.Timestamp.now()
-                y_pred = strategy.predict(train)
-                predict_estimator_end_time = pd.Timestamp.now()
-
-                y_proba = self._predict_proba_one(strategy, task, train, y_true, y_pred)
-                self.results.save_predictions(
-                    strategy_name=strategy.name,
-                    dataset_name=dataset.name,
-                    index=train_idx,
-                    y_true=y_true,
-                    y_pred=y_pred,
-                    y_proba=y_proba,
-                    cv_fold=cv_fold,
-                    fit_estimator_start_time=fit_estimator_start_time,
-                    fit_estimator_end_time=fit_estimator_end_time,
-                    predict_estimator_start_time=predict_estimator_start_time,
-                    predict_estimator_end_time=predict_estimator_end_time,
-                    train_or_test="train",
-                )
+                    # for each fold, clone strategy to avoid updating
+                    # already fitted strategies
+                    units.append(
+                        (
+                            (dataset_index + 1, strategy_index + 1, cv_fold),
+                            dataset_index,
+                            task,
+                            dataset,
+                            clone(strategy),
+                            train_idx,
+                            test_idx,
+                            predict_on_train
+                            and (overwrite_predictions or not train_pred_exist),
+                            overwrite_predictions or not test_pred_exist,
+                            save_fitted_strategies
+                            and (
+                                overwrite_fitted_strategies or not fitted_stategy_exists
+                            ),
+                        )
+                    )
+                    costs.append(cost)
+
+        # run the units on the largest datasets first, so that they do not
+        # finish last, sorting is stable so that the units of a dataset stay
+        # together
+        order = sorted(range(len(units)), key=lambda i: -costs[i])
+        return [units[i] for i in order]
+
+    def _save_unit(self, unit, result, verbose):
+        """Save the fitted strategy and predictions of a unit of work"""
+        counters, _, task, dataset, strategy, _, _, _, _, save_fitted_strategy = unit
+        (
+            fitted_strategy,
+            fit_estimator_start_time,
+            fit_estimator_end_time,
+            predictions,
+        ) = result
+        self._dataset_counter, self._strategy_counter, cv_fold = counters
+        self._print_progress(
+            dataset.name, strategy.name, cv_fold, "train", "fit", verbose
+        )
 
-            # predict on test set if overwrite predictions is set to True or
-            # predictions do not already exist
-            if overwrite_predictions or not test_pred_exist:
-                y_true = test.loc[:, task.target]
-                predict_estimator_start_time = pd.Timestamp.now()
-                y_pred = strategy.predict(test)
-                predict_estimator_end_time = pd.Timestamp.now()
-
-                y_proba = self._predict_proba_one(strategy, task, test, y_true, y_pred)
-                self.results.save_predictions(
-                    dataset_name=dataset.name,
-                    strategy_name=strategy.name,
-                    index=test_idx,
-                    y_true=y_true,
-                    y_pred=y_pred,
-                    y_proba=y_proba,
-                    cv_fold=cv_fold,
-                    fit_estimator_start_time=fit_estimator_start_time,
-                    fit_estimator_end_time=fit_estimator_end_time,
-                    predict_estimator_start_time=predict_estimator_start_time,
-                    predict_estimator_end_time=predict_estimator_end_time,
-                    train_or_test="test",
-                )
+        if save_fitted_strategy:
+            self.results.save_fitted_strategy(
+                fitted_strategy, dataset_name=dataset.name, cv_fold=cv_fold
+            )
 
-        # save results as master file
-        self.results.save()
+        for train_or_test, prediction in predictions.items():
+            self.results.save_predictions(
+                strategy_name=strategy.name,
+                dataset_name=dataset.name,
+                cv_fold=cv_fold,
+                fit_estimator_start_time=fit_estimator_start_time,
+                fit_estimator_end_time=fit_estimator_end_time,
+                train_or_test=train_or_test,
+                **prediction,
+            )
 
     @staticmethod
     def _predict_proba_one(strategy, task, data, y_true, y_pred):
@@ -350,3 +415,83 @@ class Orchestrator:
                 f"of dataset: {self._dataset_counter}/{self.n_datasets} - "
                 f"{dataset_name}{on_train}"
             )
+
+
+# data of the most recently loaded dataset, so that a worker process loads a
+# dataset only once for consecutive units of work on it
+_DATA_CACHE = {}
+
+
+def _load_data(run_id, dataset_index, dataset):
+    """Load the data of a dataset, or get them from the cache"""
+    key = (run_id, dataset_index)
+    if key not in _DATA_CACHE:
+        _DATA_CACHE.clear()
+        _DATA_CACHE[key] = dataset.load()
+    return _DATA_CACHE[key]
+
+
+def _estimate_cost(data, task):
+    """Estimate the cost of fitting and predicting on a dataset by its number
+    of values"""
+    X = data.drop(columns=task.target)
+    if X.shape[1] == 0 or len(X) == 0:
+        return 0
+    first = X.iloc[0]
+    n_values = sum(
+        len(value) if isinstance(value, (pd.Series, list)) else 1 for value in first
+    )
+    return len(X) * n_values
+
+
+def _fit_predict_one(
+    run_id,
+    dataset_index,
+    task,
+    dataset,
+    strategy,
+    train_idx,
+    test_idx,
+    predict_on_train,
+    predict_on_test,
+    return_strategy,
+):
+    """Fit a strategy on the training set of a cv fold and predict the
+    training and/or test set"""
+    data = _load_data(run_id, dataset_index, dataset)
+
+    # fit strategy
+    train = data.iloc[train_idx]
+    fit_estimator_start_time = pd.Timestamp.now()
+    strategy.fit(task, train)
+    fit_estimator_end_time = pd.Timestamp.now()
+
+    predictions = {}
+    for train_or_test, index, predict in (
+        ("train", train_idx, predict_on_train),
+        ("test", test_idx, predict_on_test),
+    ):
+        if not predict:
+            continue
+        split = data.iloc[index]
+        y_true = split.loc[:, task.target]
+        predict_estimator_start_time = pd.Timestamp.now()
+        y_pred = strategy.predict(split)
+        predict_estimator_end_time = pd.Timestamp.now()
+
+        y_proba = Orchestrator._predict_proba_one(strategy, task, split, y_true, y_pred)
+        predictions[train_or_test] = {
+            "index": index,
+            "y_true": y_true,
+            "y_pred": y_pred,
+            "y_proba": y_proba,
+            "predict_estimator_start_time": predict_estimator_start_time,
+            "predict_estimator_end_time": predict_estimator_end_time,
+        }
+
+    return (
+        strategy if return_strategy else None,
+        fit_estimator_start_time,
+        fit_estimator_end_time,
+        predictions,
+    )
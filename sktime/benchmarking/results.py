@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
-__all__ = ["HDDResults", "RAMResults"]
+__all__ = ["HDDResults", "RAMResults", "ColumnarResults"]
 __author__ = ["Viktor Kazakov", "Markus Löning"]
 
+import json
 import os
 
 import numpy as np
@@ -169,7 +170,11 @@ class HDDResults(HDDBaseResults):
                 "predict_estimator_end_time": predict_estimator_end_time,
             }
         )
-        results.to_csv(key, index=False, header=True)
+        # write to a temporary file first, so that an interrupted run does not
+        # leave incomplete predictions which would be skipped when resuming
+        tmp = key + ".tmp"
+        results.to_csv(tmp, index=False, header=True)
+        os.replace(tmp, key)
         self._append_key(strategy_name, dataset_name)
 
     def load_predictions(self, cv_fold, train_or_test):
@@ -212,7 +217,9 @@ class HDDResults(HDDBaseResults):
             )
             + ".pickle"
         )
-        strategy.save(path)
+        tmp = path + ".tmp"
+        strategy.save(tmp)
+        os.replace(tmp, path)
         self._append_key(strategy.name, dataset_name)
 
     def load_fitted_strategy(self, strategy_name, dataset_name, cv_fold):
@@ -261,3 +268,262 @@ class HDDResults(HDDBaseResults):
             os.makedirs(filepath)
         filename = f"{strategy_name}_{train_or_test}_{cv_fold}"
         return os.path.join(filepath, filename)
+
+
+class ColumnarResults(HDDResults):
+    """Results stored in a single append-only binary store on the hard drive.
+
+    The arrays of the predictions (index, y_true, y_pred and, if available,
+    y_proba) of all strategies, datasets and cv folds are appended to one
+    binary data file, and their locations and the fit and predict timings are
+    appended as one line per prediction to an index file. All predictions can
+    so be loaded with a single read of the index and a single memory-mapping
+    of the data file. Saving the predictions of the same strategy, dataset
+    and cv fold again supersedes the previously saved ones. Fitted strategies
+    are saved as for :class:`HDDResults`.
+
+    Arrays of objects, such as class labels, are stored as arrays of their
+    common type, e.g. strings. Only a single process may save predictions to
+    the store at a time.
+
+    Parameters
+    ----------
+    path : str
+        Directory in which the results are stored.
+    """
+
+    _DATA_FILENAME = "predictions.bin"
+    _INDEX_FILENAME = "predictions.index"
+
+    # offsets of arrays in the data file are aligned to this number of bytes
+    _ALIGNMENT = 64
+
+    def __init__(self, path):
+        super(ColumnarResults, self).__init__(path=path)
+        self._reset_index()
+
+    def __getstate__(self):
+        # the cached index is not part of the saved results object
+        state = self.__dict__.copy()
+        del state["_entries"], state["_index_offset"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._reset_index()
+
+    def _reset_index(self):
+        self._entries = {}
+        self._index_offset = 0
+
+    @property
+    def _data_file(self):
+        return os.path.join(self.path, self._DATA_FILENAME)
+
+    @property
+    def _index_file(self):
+        return os.path.join(self.path, self._INDEX_FILENAME)
+
+    def save_predictions(
+        self,
+        strategy_name,
+        dataset_name,
+        y_true,
+        y_pred,
+        y_proba,
+        index,
+        cv_fold,
+        train_or_test,
+        fit_estimator_start_time=None,
+        fit_estimator_end_time=None,
+        predict_estimator_start_time=None,
+        predict_estimator_end_time=None,
+    ):
+        """
+        Saves the predictions of trained estimators.
+
+        Parameters
+        ----------
+        strategy_name : string
+            Name of fitted strategy
+        dataset_name: string
+            Name of dataset on which the strategy is fitted
+        y_true : numpy array
+            array with true labels
+        y_pred : numpy array
+            array of predicted labels
+        y_proba : numpy array or None
+            array of probabilities associated with the predicted values
+        index : numpy array
+            dataset indeces of the y_true data points
+        fit_estimator_start_time : pandas timestamp (default=None)
+            timestamp when fitting the estimator began
+        fit_estimator_end_time : pandas timestamp (default=None)
+            timestamp when fitting the estimator ended
+        predict_estimator_start_time : pandas timestamp (default=None)
+            timestamp when the estimator began making predictions
+        predict_estimator_end_time : pandas timestamp (default=None)
+            timestamp when the estimator finished making predictions
+        """
+        arrays = {"index": index, "y_true": y_true, "y_pred": y_pred}
+        if y_proba is not None:
+            arrays["y_proba"] = y_proba
+        arrays = {name: _to_storable_array(name, a) for name, a in arrays.items()}
+
+        os.makedirs(self.path, exist_ok=True)
+
+        # write the arrays before their index entry, so that an interrupted
+        # write leaves no entry pointing to incomplete data
+        locations = {}
+        with open(self._data_file, "ab") as f:
+            offset = f.seek(0, os.SEEK_END)
+            for name, a in arrays.items():
+                padding = -offset % self._ALIGNMENT
+                f.write(b"\0" * padding)
+                offset += padding
+                f.write(a.tobytes())
+                locations[name] = [a.dtype.str, list(a.shape), offset]
+                offset += a.nbytes
+            f.flush()
+            os.fsync(f.fileno())
+
+        entry = {
+            "strategy_name": strategy_name,
+            "dataset_name": dataset_name,
+            "cv_fold": int(cv_fold),
+            "train_or_test": train_or_test,
+            "arrays": locations,
+            "fit_estimator_start_time": _to_nanoseconds(fit_estimator_start_time),
+            "fit_estimator_end_time": _to_nanoseconds(fit_estimator_end_time),
+            "predict_estimator_start_time": _to_nanoseconds(
+                predict_estimator_start_time
+            ),
+            "predict_estimator_end_time": _to_nanoseconds(predict_estimator_end_time),
+        }
+        _truncate_incomplete_line(self._index_file)
+        with open(self._index_file, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._append_key(strategy_name, dataset_name)
+
+    def _update_index(self):
+        """Read the index entries appended since the index was last read"""
+        if not os.path.isfile(self._index_file):
+            self._reset_index()
+            return
+        if os.path.getsize(self._index_file) < self._index_offset:
+            # the store has been replaced
+            self._reset_index()
+
+        with open(self._index_file, "rb") as f:
+            f.seek(self._index_offset)
+            for line in f:
+                # skip an incomplete last line of an interrupted write
+                if not line.endswith(b"\n"):
+                    break
+                self._index_offset += len(line)
+                entry = json.loads(line)
+                key = (
+                    entry["strategy_name"],
+                    entry["dataset_name"],
+                    entry["cv_fold"],
+                    entry["train_or_test"],
+                )
+                self._entries[key] = entry
+
+    def check_predictions_exist(
+        self, strategy_name, dataset_name, cv_fold, train_or_test
+    ):
+        self._update_index()
+        return (strategy_name, dataset_name, cv_fold, train_or_test) in self._entries
+
+    def load_predictions(self, cv_fold, train_or_test):
+        """Loads predictions for all datasets and strategies iteratively"""
+        for _, result in self.load_all_predictions([cv_fold], train_or_test):
+            yield result
+
+    def load_all_predictions(self, cv_folds, train_or_test):
+        """Loads predictions for all cv folds, datasets and strategies
+        iteratively with a single read of the store
+
+        Parameters
+        ----------
+        cv_folds : list of int
+        train_or_test : str
+
+        Yields
+        ------
+        cv_fold : int
+        result : _PredictionsWrapper
+        """
+        self._update_index()
+        if not self._entries:
+            # nothing has been saved yet
+            return
+        data = np.memmap(self._data_file, dtype=np.uint8, mode="r")
+        for cv_fold in cv_folds:
+            for strategy_name, dataset_name in self._iter():
+                entry = self._entries[
+                    (strategy_name, dataset_name, int(cv_fold), train_or_test)
+                ]
+                arrays = {
+                    name: np.ndarray(
+                        shape=tuple(shape), dtype=dtype, buffer=data, offset=offset
+                    )
+                    for name, (dtype, shape, offset) in entry["arrays"].items()
+                }
+                yield cv_fold, _PredictionsWrapper(
+                    strategy_name,
+                    dataset_name,
+                    arrays["index"],
+                    arrays["y_true"],
+                    arrays["y_pred"],
+                    _from_nanoseconds(entry["fit_estimator_start_time"]),
+                    _from_nanoseconds(entry["fit_estimator_end_time"]),
+                    _from_nanoseconds(entry["predict_estimator_start_time"]),
+                    _from_nanoseconds(entry["predict_estimator_end_time"]),
+                    arrays.get("y_proba"),
+                )
+
+
+def _truncate_incomplete_line(path, chunk_size=4096):
+    """Remove the incomplete last line an interrupted write left in a file"""
+    if not os.path.isfile(path):
+        return
+    with open(path, "rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - chunk_size)
+            f.seek(start)
+            last_newline = f.read(position - start).rfind(b"\n")
+            if last_newline >= 0:
+                position = start + last_newline + 1
+                break
+            position = start
+        if position < end:
+            f.truncate(position)
+
+
+def _to_storable_array(name, a):
+    """Convert array to an array with a fixed-size dtype"""
+    a = np.asarray(a)
+    if a.dtype == object:
+        # infer the common type of the objects, e.g. strings
+        a = np.asarray(a.tolist())
+    if a.dtype.hasobject:
+        raise ValueError(
+            f"`{name}` must have values of a common type to be stored, but "
+            f"found values of types: {set(type(value) for value in a.ravel())}"
+        )
+    return np.ascontiguousarray(a)
+
+
+def _to_nanoseconds(timestamp):
+    return None if timestamp is None else pd.Timestamp(timestamp).value
+
+
+def _from_nanoseconds(value):
+    return None if value is None else pd.Timestamp(value)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+from sklearn.metrics import accuracy_score
+from sklearn.metrics import f1_score
+from sklearn.metrics import mean_squared_error
+from sklearn.metrics import r2_score
+
+from sktime.benchmarking.metrics import AggregateMetric
+
+
+def _jackknife_stderr(func, y_true, y_pred, **kwargs):
+    # re-evaluate the metric on every leave-one-out sample
+    n_instances = len(y_true)
+    jack_metric = np.array(
+        [
+            func(np.delete(y_true, i), np.delete(y_pred, i), **kwargs)
+            for i in range(n_instances)
+        ]
+    )
+    return np.sqrt(n_instances - 1) * np.std(jack_metric)
+
+
+def _make_classification_predictions(n_instances=50):
+    rng = np.random.RandomState(42)
+    y_true = rng.choice(["a", "b", "c"], size=n_instances).astype(object)
+    y_pred = np.where(rng.uniform(size=n_instances) < 0.7, y_true, "a")
+    return y_true, y_pred
+
+
+def _make_regression_predictions(n_instances=50):
+    rng = np.random.RandomState(42)
+    y_true = rng.normal(size=n_instances)
+    y_pred = y_true + rng.normal(scale=0.5, size=n_instances)
+    return y_true, y_pred
+
+
+@pytest.mark.parametrize(
+    "func, kwargs, make_predictions",
+    [
+        (accuracy_score, {}, _make_classification_predictions),
+        (f1_score, {"average": "macro"}, _make_classification_predictions),
+        (mean_squared_error, {}, _make_regression_predictions),
+        (r2_score, {}, _make_regression_predictions),
+    ],
+)
+def test_jackknife_stderr(func, kwargs, make_predictions):
+    y_true, y_pred = make_predictions()
+    metric = AggregateMetric(func, **kwargs)
+    mean, stderr = metric.compute(y_true, y_pred)
+
+    np.testing.assert_allclose(mean, func(y_true, y_pred, **kwargs))
+    np.testing.assert_allclose(
+        stderr, _jackknife_stderr(func, y_true, y_pred, **kwargs)
+    )
+
+
+@pytest.mark.parametrize("func", [accuracy_score, f1_score])
+def test_bootstrap_stderr(func):
+    y_true, y_pred = _make_classification_predictions(n_instances=200)
+    kwargs = {"average": "macro"} if func is f1_score else {}
+    metric = AggregateMetric(
+        func, method="bootstrap", n_resamples=500, random_state=1, **kwargs
+    )
+    mean, stderr = metric.compute(y_true, y_pred)
+
+    # bootstrap resamples are reproducible and the standard errors are close
+    # to the jackknife ones
+    assert metric.compute(y_true, y_pred) == (mean, stderr)
+    expected = _jackknife_stderr(func, y_true, y_pred, **kwargs)
+    np.testing.assert_allclose(stderr, expected, rtol=0.2)
@@ -5,6 +5,8 @@ import os
 
 import numpy as np
 import pytest
+from joblib import Parallel
+from joblib import delayed
 
 # get data path for testing dataset loading from hard drive
 import sktime
@@ -22,6 +24,7 @@ from sktime.benchmarking.evaluation import Evaluator
 from sktime.benchmarking.metrics import AggregateMetric
 from sktime.benchmarking.metrics import PairwiseMetric
 from sktime.benchmarking.orchestration import Orchestrator
+from sktime.benchmarking.results import ColumnarResults
 from sktime.benchmarking.results import HDDResults
 from sktime.benchmarking.results import RAMResults
 from sktime.benchmarking.strategies import TSCStrategy
@@ -100,7 +103,7 @@ def test_automated_orchestration_vs_manual(data_loader):
 @pytest.mark.parametrize(
     "metric_func", [accuracy_score, f1_score]  # pairwise metric  # composite metric
 )
-@pytest.mark.parametrize("results_cls", [RAMResults, HDDResults])
+@pytest.mark.parametrize("results_cls", [RAMResults, HDDResults, ColumnarResults])
 @pytest.mark.parametrize(
     "estimator",
     [
@@ -119,7 +122,7 @@ def test_single_dataset_single_strategy_against_sklearn(
     strategy = TSCStrategy(clf)
 
     # result backend
-    if results_cls in [HDDResults]:
+    if results_cls in [HDDResults, ColumnarResults]:
         # for hard drive results, create temporary directory using pytest's
         # tmpdir fixture
         tempdir = tmpdir.mkdir("results/")
@@ -204,3 +207,82 @@ def test_stat():
     np.testing.assert_equal(
         [rank_array, sign_array], [rank_array_test, sign_array_test]
     )
+
+
+def _load_all_predictions(results, n_splits):
+    return {
+        (result.strategy_name, result.dataset_name, cv_fold): result.y_pred
+        for cv_fold in range(n_splits)
+        for result in results.load_predictions(cv_fold=cv_fold, train_or_test="test")
+    }
+
+
+def test_parallel_and_resumed_fit_predict(tmpdir):
+    datasets = [
+        RAMDataset(dataset=load_arrow_head(), name="ArrowHead"),
+        UEADataset(path=DATAPATH, name="GunPoint", target_name="class_val"),
+    ]
+    tasks = [TSCTask(target="class_val") for _ in datasets]
+    strategies = [
+        TSCStrategy(
+            make_reduction_pipeline(DummyClassifier(strategy="most_frequent")),
+            name="dummy",
+        ),
+        TSCStrategy(
+            make_reduction_pipeline(
+                RandomForestClassifier(n_estimators=2, random_state=1)
+            ),
+            name="rf",
+        ),
+    ]
+    cv = StratifiedKFold(n_splits=3, random_state=1, shuffle=True)
+
+    def fit_predict(path, n_jobs):
+        results = HDDResults(path=str(path))
+        orchestrator = Orchestrator(
+            datasets=datasets,
+            tasks=tasks,
+            strategies=strategies,
+            cv=cv,
+            results=results,
+        )
+        orchestrator.fit_predict(n_jobs=n_jobs)
+        return results
+
+    expected = _load_all_predictions(fit_predict(tmpdir.mkdir("sequential"), 1), 3)
+    path = tmpdir.mkdir("parallel")
+    actual = _load_all_predictions(fit_predict(path, 2), 3)
+    assert actual.keys() == expected.keys()
+    for key in expected:
+        np.testing.assert_array_equal(actual[key], expected[key])
+
+    # only the missing results are computed when resuming
+    missing = os.path.join(path, "rf", "GunPoint", "rf_test_1.csv")
+    existing = os.path.join(path, "dummy", "ArrowHead", "dummy_test_0.csv")
+    os.remove(missing)
+    mtime = os.path.getmtime(existing)
+    actual = _load_all_predictions(fit_predict(path, 2), 3)
+    assert os.path.isfile(missing)
+    assert os.path.getmtime(existing) == mtime
+    np.testing.assert_array_equal(
+        actual["rf", "GunPoint", 1], expected["rf", "GunPoint", 1]
+    )
+
+
+def test_joblib_parallel_after_parallel_fit_predict(tmpdir):
+    orchestrator = Orchestrator(
+        datasets=[RAMDataset(dataset=load_arrow_head(), name="ArrowHead")],
+        tasks=[TSCTask(target="class_val")],
+        strategies=[
+            TSCStrategy(
+                make_reduction_pipeline(DummyClassifier(strategy="most_frequent")),
+                name="dummy",
+            )
+        ],
+        cv=SingleSplit(random_state=1),
+        results=HDDResults(path=str(tmpdir)),
+    )
+    orchestrator.fit_predict(n_jobs=2)
+
+    # the orchestrator leaves the executor shared by joblib usable
+    assert Parallel(n_jobs=2)(delayed(abs)(i) for i in [-1, -2]) == [1, 2]
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from joblib import load
+
+from sktime.benchmarking.results import ColumnarResults
+from sktime.benchmarking.results import RAMResults
+from sktime.series_as_features.model_selection import PresplitFilesCV
+
+
+def _make_predictions(seed):
+    rng = np.random.RandomState(seed)
+    y_proba = rng.uniform(size=(10, 3))
+    return {
+        "index": np.arange(seed, seed + 10),
+        "y_true": rng.choice(["a", "b", "c"], size=10).astype(object),
+        "y_pred": np.array(["a", "b", "c"], dtype=object)[y_proba.argmax(axis=1)],
+        "y_proba": y_proba,
+        "fit_estimator_start_time": pd.Timestamp.now(),
+        "fit_estimator_end_time": pd.Timestamp.now(),
+        "predict_estimator_start_time": pd.Timestamp.now(),
+        "predict_estimator_end_time": pd.Timestamp.now(),
+    }
+
+
+def _save_predictions(results_list, n_folds):
+    keys = [
+        (strategy_name, dataset_name, cv_fold)
+        for cv_fold in range(n_folds)
+        for strategy_name in ["s1", "s2"]
+        for dataset_name in ["d1", "d2"]
+    ]
+    for seed, (strategy_name, dataset_name, cv_fold) in enumerate(keys):
+        predictions = _make_predictions(seed)
+        for results in results_list:
+            results.save_predictions(
+                strategy_name=strategy_name,
+                dataset_name=dataset_name,
+                cv_fold=cv_fold,
+                train_or_test="test",
+                **predictions,
+            )
+
+
+def _assert_results_equal(actual, expected):
+    attributes = [
+        "strategy_name",
+        "dataset_name",
+        "index",
+        "y_true",
+        "y_pred",
+        "y_proba",
+        "fit_estimator_start_time",
+        "predict_estimator_end_time",
+    ]
+    for attribute in attributes:
+        np.testing.assert_array_equal(
+            getattr(actual, attribute), getattr(expected, attribute)
+        )
+
+
+def test_columnar_results_against_ram_results(tmpdir):
+    n_folds = 3
+    results = ColumnarResults(path=str(tmpdir))
+    expected = RAMResults()
+    _save_predictions([results, expected], n_folds)
+
+    # overwrite predictions
+    predictions = _make_predictions(100)
+    for r in [results, expected]:
+        r.save_predictions(
+            strategy_name="s2",
+            dataset_name="d1",
+            cv_fold=1,
+            train_or_test="test",
+            **predictions,
+        )
+
+    assert results.check_predictions_exist("s1", "d2", 2, "test")
+    assert not results.check_predictions_exist("s1", "d2", 2, "train")
+    assert not results.check_predictions_exist("s1", "d2", n_folds, "test")
+
+    actual = list(results.load_all_predictions(range(n_folds), "test"))
+    assert len(actual) == n_folds * 4
+    for cv_fold in range(n_folds):
+        loaded = [result for fold, result in actual if fold == cv_fold]
+        for a, e in zip(loaded, expected.load_predictions(cv_fold, "test")):
+            _assert_results_equal(a, e)
+        for a, e in zip(
+            results.load_predictions(cv_fold, "test"),
+            expected.load_predictions(cv_fold, "test"),
+        ):
+            _assert_results_equal(a, e)
+
+
+def test_columnar_results_resume(tmpdir):
+    results = ColumnarResults(path=str(tmpdir))
+    results.cv = PresplitFilesCV()
+    _save_predictions([results], 1)
+    results.save()
+
+    # an interrupted write of an index entry is ignored
+    with open(os.path.join(str(tmpdir), ColumnarResults._INDEX_FILENAME), "a") as f:
+        f.write('{"strategy_name": "s1", "data')
+
+    loaded = load(os.path.join(str(tmpdir), "results.pickle"))
+    assert loaded.check_predictions_exist("s2", "d2", 0, "test")
+    assert len(list(loaded.load_predictions(0, "test"))) == 4
+    for a, e in zip(
+        loaded.load_predictions(0, "test"), results.load_predictions(0, "test")
+    ):
+        _assert_results_equal(a, e)
+
+
+def test_columnar_results_save_after_interrupted_write(tmpdir):
+    results = ColumnarResults(path=str(tmpdir))
+    results.cv = PresplitFilesCV()
+    _save_predictions([results], 1)
+    results.save()
+    with open(os.path.join(str(tmpdir), ColumnarResults._INDEX_FILENAME), "a") as f:
+        f.write('{"strategy_name": "s1", "data')
+
+    # the incomplete entry is removed before the next one is appended
+    loaded = load(os.path.join(str(tmpdir), "results.pickle"))
+    predictions = _make_predictions(100)
+    loaded.save_predictions(
+        strategy_name="s1",
+        dataset_name="d2",
+        cv_fold=0,
+        train_or_test="test",
+        **predictions,
+    )
+
+    reloaded = load(os.path.join(str(tmpdir), "results.pickle"))
+    actual = {
+        (result.strategy_name, result.dataset_name): result
+        for result in reloaded.load_predictions(0, "test")
+    }
+    assert len(actual) == 4
+    np.testing.assert_array_equal(actual["s1", "d2"].y_proba, predictions["y_proba"])
+    for expected in results.load_predictions(0, "test"):
+        if (expected.strategy_name, expected.dataset_name) != ("s1", "d2"):
+            _assert_results_equal(
+                actual[expected.strategy_name, expected.dataset_name], expected
+            )
+
+
+def test_columnar_results_invalid_values(tmpdir):
+    results = ColumnarResults(path=str(tmpdir))
+    predictions = _make_predictions(0)
+    predictions["y_true"] = np.array([{"a": 1}] * 10, dtype=object)
+    with pytest.raises(ValueError, match="common type"):
+        results.save_predictions(
+            strategy_name="s1",
+            dataset_name="d1",
+            cv_fold=0,
+            train_or_test="test",
+            **predictions,
+        )
+
+
+def test_register_existing():
+    results = RAMResults()
+    results.register_existing("strategy", "dataset")
+    results.register_existing("strategy", "dataset")
+    assert results.strategy_names == ["strategy"]
+    assert results.dataset_names == ["dataset"]
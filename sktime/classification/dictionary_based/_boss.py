@@ -7,11 +7,13 @@ BOSS and a BOSS ensemble
 __author__ = "Matthew Middlehurst"
 __all__ = ["BOSSEnsemble", "IndividualBOSS", "boss_distance"]
 
+import numbers
 import sys
 from itertools import compress
 
 import numpy as np
 from joblib import Parallel, delayed
+from scipy.sparse import csr_matrix
 from sklearn.utils import check_random_state
 from sklearn.utils.multiclass import class_distribution
 
@@ -274,53 +276,29 @@ class BOSSEnsemble(BaseClassifier):
 
     def _get_train_probs(self, X):
         num_inst = X.shape[0]
-        results = np.zeros((num_inst, self.n_classes))
-        divisor = np.ones(self.n_classes) * self.n_estimators
-        for i in range(num_inst):
-            sums = np.zeros(self.n_classes)
-
-            preds = Parallel(n_jobs=self.n_jobs)(
-                delayed(clf._train_predict)(
-                    i,
-                )
-                for clf in self.classifiers
-            )
+        sums = np.zeros((num_inst, self.n_classes))
 
-            for c in preds:
-                sums[self.class_dictionary.get(c, -1)] += 1
+        preds = Parallel(n_jobs=self.n_jobs)(
+            delayed(clf._train_predictions)() for clf in self.classifiers
+        )
 
-            dists = sums / divisor
-            for n in range(self.n_classes):
-                results[i][n] = dists[n]
+        for clf_preds in preds:
+            for i, c in enumerate(clf_preds):
+                sums[i, self.class_dictionary.get(c, -1)] += 1
 
-        return results
+        return sums / (np.ones(self.n_classes) * self.n_estimators)
 
     def _individual_train_acc(self, boss, y, train_size, lowest_acc):
         correct = 0
         required_correct = int(lowest_acc * train_size)
 
-        if self.n_jobs > 1:
-            c = Parallel(n_jobs=self.n_jobs)(
-                delayed(boss._train_predict)(
-                    i,
-                )
-                for i in range(train_size)
-            )
-
-            for i in range(train_size):
-                if correct + train_size - i < required_correct:
-                    return -1
-                elif c[i] == y[i]:
-                    correct += 1
-        else:
-            for i in range(train_size):
-                if correct + train_size - i < required_correct:
-                    return -1
-
-                c = boss._train_predict(i)
+        c = boss._train_predictions()
 
-                if c == y[i]:
-                    correct += 1
+        for i in range(train_size):
+            if correct + train_size - i < required_correct:
+                return -1
+            elif c[i] == y[i]:
+                correct += 1
 
         return correct / train_size
 
@@ -359,6 +337,7 @@ class IndividualBOSS(BaseClassifier):
             remove_repeat_words=True,
             bigrams=False,
             save_words=save_words,
+            return_sparse=True,
             n_jobs=n_jobs,
         )
         self.transformed_data = []
@@ -377,7 +356,7 @@ class IndividualBOSS(BaseClassifier):
         sfa = self.transformer.fit_transform(X)
         self.transformed_data = sfa[0]
 
-        self.class_vals = y
+        self.class_vals = np.asarray(y)
         self.num_classes = np.unique(y).shape[0]
         self.classes_ = class_distribution(np.asarray(y).reshape(-1, 1))[0][0]
         for index, classVal in enumerate(self.classes_):
@@ -392,15 +371,9 @@ class IndividualBOSS(BaseClassifier):
 
         test_bags = self.transformer.transform(X)
         test_bags = test_bags[0]
+        distances = _boss_distance_matrix(test_bags, self.transformed_data)
 
-        classes = Parallel(n_jobs=self.n_jobs)(
-            delayed(self._test_nn)(
-                test_bag,
-            )
-            for test_bag in test_bags
-        )
-
-        return np.array(classes)
+        return self.class_vals[_nearest_neighbours(distances, self.random_state)]
 
     def predict_proba(self, X):
         preds = self.predict(X)
@@ -411,37 +384,13 @@ class IndividualBOSS(BaseClassifier):
 
         return dists
 
-    def _test_nn(self, test_bag):
-        rng = check_random_state(self.random_state)
-
-        best_dist = sys.float_info.max
-        nn = None
-
-        for n, bag in enumerate(self.transformed_data):
-            dist = boss_distance(test_bag, bag, best_dist)
-
-            if dist < best_dist or (dist == best_dist and rng.random() < 0.5):
-                best_dist = dist
-                nn = self.class_vals[n]
-
-        return nn
-
-    def _train_predict(self, train_num):
-        test_bag = self.transformed_data[train_num]
-        best_dist = sys.float_info.max
-        nn = None
-
-        for n, bag in enumerate(self.transformed_data):
-            if n == train_num:
-                continue
-
-            dist = boss_distance(test_bag, bag, best_dist)
-
-            if dist < best_dist:
-                best_dist = dist
-                nn = self.class_vals[n]
+    def _train_predictions(self):
+        """Leave-one-out predictions of the training cases, with ties broken
+        by the first of the closest training cases"""
+        distances = _boss_distance_matrix(self.transformed_data, self.transformed_data)
+        np.fill_diagonal(distances, np.inf)
 
-        return nn
+        return self.class_vals[np.argmin(distances, axis=1)]
 
     def _shorten_bags(self, word_len):
         new_boss = IndividualBOSS(
@@ -498,3 +447,81 @@ def boss_distance(first, second, best_dist=sys.float_info.max):
         )
 
     return dist
+
+
+def _nearest_neighbours(distances, random_state=None):
+    """Indices of the nearest neighbours of the rows of a distance matrix
+
+    Ties are broken as in a search over the columns in order, in which a
+    column as close as the closest one so far replaces it if a random number
+    is below 0.5. A random number is drawn for each such column, the random
+    state is reset for each row if it is an integer.
+
+    Parameters
+    ----------
+    distances : np.ndarray of shape (n_cases, n_neighbours)
+    random_state : int, RandomState instance or None
+
+    Returns
+    -------
+    indices : np.ndarray of shape (n_cases,)
+    """
+    rng = check_random_state(random_state)
+    n_neighbours = distances.shape[1]
+
+    closest = np.minimum.accumulate(distances, axis=1)
+    ties = np.zeros(distances.shape, dtype=bool)
+    ties[:, 1:] = distances[:, 1:] == closest[:, :-1]
+
+    draws = np.ones(distances.shape)
+    if isinstance(random_state, numbers.Integral):
+        # each row uses the same random numbers, in the order of its ties
+        ranks = np.cumsum(ties, axis=1) - 1
+        values = rng.random_sample(ranks[:, -1].max() + 1 if ties.any() else 0)
+        draws[ties] = values[ranks[ties]]
+    else:
+        draws[ties] = rng.random_sample(np.count_nonzero(ties))
+
+    # the ties with the closest column that replace it
+    replaced = ties & (draws < 0.5) & (distances == closest[:, -1:])
+    last_replaced = n_neighbours - 1 - np.argmax(replaced[:, ::-1], axis=1)
+    return np.where(replaced.any(axis=1), last_replaced, np.argmin(distances, axis=1))
+
+
+def _boss_distance_matrix(first, second):
+    """BOSS distances between all the bags of first and second
+
+    The distances are those of boss_distance, computed with sparse matrix
+    products as the sum over the words of the first bag of
+    a ** 2 - 2 * a * b + b ** 2.
+
+    Parameters
+    ----------
+    first : scipy CSR matrix of shape (n_first, n_words) of word counts
+    second : scipy CSR matrix of shape (n_second, n_words) of word counts
+
+    Returns
+    -------
+    distances : np.ndarray of shape (n_first, n_second)
+    """
+    # the bags of data transformed after the training data may have more
+    # columns for words missing from the vocabulary
+    n_words = max(first.shape[1], second.shape[1])
+    first = _pad_columns(first, n_words).astype(np.float64)
+    second = _pad_columns(second, n_words).astype(np.float64)
+
+    in_first = first.copy()
+    in_first.data[:] = 1
+
+    distances = (
+        in_first @ second.multiply(second).T - 2 * (first @ second.T)
+    ).toarray()
+    distances += np.asarray(first.multiply(first).sum(axis=1))
+    return distances
+
+
+def _pad_columns(X, n_columns):
+    """Add empty columns to the right of the CSR matrix X"""
+    if X.shape[1] == n_columns:
+        return X
+    return csr_matrix((X.data, X.indices, X.indptr), shape=(X.shape[0], n_columns))
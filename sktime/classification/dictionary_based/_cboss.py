@@ -284,33 +284,22 @@ class ContractableBOSS(BaseClassifier):
 
     def _get_train_probs(self, X):
         num_inst = X.shape[0]
-        results = np.zeros((num_inst, self.n_classes))
-        for i in range(num_inst):
-            divisor = 0
-            sums = np.zeros(self.n_classes)
-
-            cls_idx = []
-            for n, clf in enumerate(self.classifiers):
-                idx = np.where(clf.subsample == i)
-                if len(idx[0]) > 0:
-                    cls_idx.append([n, idx[0][0]])
-
-            preds = Parallel(n_jobs=self.n_jobs)(
-                delayed(self.classifiers[cls[0]]._train_predict)(
-                    cls[1],
-                )
-                for cls in cls_idx
-            )
+        sums = np.zeros((num_inst, self.n_classes))
+        divisors = np.zeros(num_inst)
 
-            for n, pred in enumerate(preds):
-                sums[self.class_dictionary.get(pred, -1)] += self.weights[cls_idx[n][0]]
-                divisor += self.weights[cls_idx[n][0]]
+        preds = Parallel(n_jobs=self.n_jobs)(
+            delayed(clf._train_predictions)() for clf in self.classifiers
+        )
 
-            results[i] = (
-                np.ones(self.n_classes) * (1 / self.n_classes)
-                if divisor == 0
-                else sums / (np.ones(self.n_classes) * divisor)
-            )
+        # each classifier predicts the cases of its subsample
+        for n, clf in enumerate(self.classifiers):
+            for i, pred in zip(clf.subsample, preds[n]):
+                sums[i, self.class_dictionary.get(pred, -1)] += self.weights[n]
+                divisors[i] += self.weights[n]
+
+        results = np.ones((num_inst, self.n_classes)) * (1 / self.n_classes)
+        predicted = divisors > 0
+        results[predicted] = sums[predicted] / divisors[predicted, np.newaxis]
 
         return results
 
@@ -318,27 +307,12 @@ class ContractableBOSS(BaseClassifier):
         correct = 0
         required_correct = int(lowest_acc * train_size)
 
-        if self.n_jobs > 1:
-            c = Parallel(n_jobs=self.n_jobs)(
-                delayed(boss._train_predict)(
-                    i,
-                )
-                for i in range(train_size)
-            )
-
-            for i in range(train_size):
-                if correct + train_size - i < required_correct:
-                    return -1
-                elif c[i] == y[i]:
-                    correct += 1
-        else:
-            for i in range(train_size):
-                if correct + train_size - i < required_correct:
-                    return -1
-
-                c = boss._train_predict(i)
+        c = boss._train_predictions()
 
-                if c == y[i]:
-                    correct += 1
+        for i in range(train_size):
+            if correct + train_size - i < required_correct:
+                return -1
+            elif c[i] == y[i]:
+                correct += 1
 
         return correct / train_size
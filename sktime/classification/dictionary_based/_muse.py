@@ -10,10 +10,9 @@ __all__ = ["MUSE"]
 import math
 import numpy as np
 from numba import njit
-from sklearn.feature_extraction import DictVectorizer
+from scipy.sparse import hstack
 from sklearn.feature_selection import chi2
 from sklearn.linear_model import LogisticRegression
-from sklearn.pipeline import make_pipeline
 from sklearn.utils.multiclass import class_distribution
 
 # from sklearn.preprocessing import StandardScaler
@@ -135,6 +134,7 @@ class MUSE(BaseClassifier):
         self.highest_bits = []
 
         self.SFA_transformers = []
+        self.relevant_features = []
         self.clf = None
         self.classes_ = []
 
@@ -172,9 +172,10 @@ class MUSE(BaseClassifier):
         self.highest_bits = np.zeros(self.n_dims)
 
         self.SFA_transformers = [[] for _ in range(self.n_dims)]
+        self.relevant_features = [[] for _ in range(self.n_dims)]
 
-        # the words of all dimensions and all time series
-        all_words = [dict() for _ in range(X.shape[0])]
+        # the bags of all dimensions and window sizes of all time series
+        bags = []
 
         # On each dimension, perform SFA
         for ind, column in enumerate(self.col_names):
@@ -215,6 +216,7 @@ class MUSE(BaseClassifier):
                     remove_repeat_words=False,
                     lower_bounding=False,
                     save_words=False,
+                    return_sparse=True,
                 )
 
                 sfa_words = transformer.fit_transform(X_dim, y)
@@ -223,47 +225,28 @@ class MUSE(BaseClassifier):
                 bag = sfa_words[0]
 
                 # chi-squared test to keep only relevant features
-                relevant_features = {}
-                apply_chi_squared = self.p_threshold < 1
-                if apply_chi_squared:
-                    vectorizer = DictVectorizer(sparse=True, dtype=np.int32, sort=False)
-                    bag_vec = vectorizer.fit_transform(bag)
-
-                    chi2_statistics, p = chi2(bag_vec, y)
-                    relevant_features_idx = np.where(p <= self.p_threshold)[0]
-                    relevant_features = set(
-                        np.array(vectorizer.feature_names_)[relevant_features_idx]
-                    )
+                if self.p_threshold < 1:
+                    chi2_statistics, p = chi2(bag, y)
+                    relevant_features = np.where(p <= self.p_threshold)[0]
+                else:
+                    relevant_features = np.arange(bag.shape[1])
 
                 # merging bag-of-patterns of different window_sizes
-                # to single bag-of-patterns with prefix indicating
-                # the used window-length
-                highest = np.int32(self.highest_bits[ind])
-                for j in range(len(bag)):
-                    for (key, value) in bag[j].items():
-                        # chi-squared test
-                        if (not apply_chi_squared) or (key in relevant_features):
-                            # append the prefices to the words to
-                            # distinguish between window-sizes
-                            word = MUSE.shift_left(
-                                key, highest, ind, self.highest_dim_bit, window_size
-                            )
-                            all_words[j][word] = value
-
-        self.clf = make_pipeline(
-            DictVectorizer(sparse=True, sort=False),
-            # StandardScaler(with_mean=True, copy=False),
-            LogisticRegression(
-                max_iter=5000,
-                solver="liblinear",
-                dual=True,
-                # class_weight="balanced",
-                penalty="l2",
-                random_state=self.random_state,
-            ),
+                # and dimensions to single bag-of-patterns, with the columns
+                # of each after those of the previous ones
+                self.relevant_features[ind].append(relevant_features)
+                bags.append(bag[:, relevant_features])
+
+        self.clf = LogisticRegression(
+            max_iter=5000,
+            solver="liblinear",
+            dual=True,
+            # class_weight="balanced",
+            penalty="l2",
+            random_state=self.random_state,
         )
 
-        self.clf.fit(all_words, y)
+        self.clf.fit(hstack(bags, format="csr"), y)
         self._is_fitted = True
         return self
 
@@ -282,33 +265,21 @@ class MUSE(BaseClassifier):
         if self.use_first_order_differences:
             X = self.add_first_order_differences(X)
 
-        bag_all_words = [dict() for _ in range(len(X))]
+        bags = []
 
         # On each dimension, perform SFA
         for ind, column in enumerate(self.col_names):
             X_dim = X[[column]]
             X_dim = from_nested_to_3d_numpy(X_dim)
 
-            for i, window_size in enumerate(self.window_sizes[ind]):
+            for i in range(len(self.window_sizes[ind])):
 
-                # SFA transform
+                # SFA transform, keeping the columns of the relevant words of
+                # the training data
                 sfa_words = self.SFA_transformers[ind][i].transform(X_dim)
-                bag = sfa_words[0]
+                bags.append(sfa_words[0][:, self.relevant_features[ind][i]])
 
-                # merging bag-of-patterns of different window_sizes
-                # to single bag-of-patterns with prefix indicating
-                # the used window-length
-                highest = np.int32(self.highest_bits[ind])
-                for j in range(len(bag)):
-                    for (key, value) in bag[j].items():
-                        # append the prefices to the words to distinguish
-                        # between window-sizes
-                        word = MUSE.shift_left(
-                            key, highest, ind, self.highest_dim_bit, window_size
-                        )
-                        bag_all_words[j][word] = value
-
-        return bag_all_words
+        return hstack(bags, format="csr")
 
     def add_first_order_differences(self, X):
         X_copy = X.copy()
@@ -9,15 +9,18 @@ __all__ = ["TemporalDictionaryEnsemble", "IndividualTDE", "histogram_intersectio
 
 import math
 import time
-from collections import defaultdict
 
 import numpy as np
 from joblib import Parallel, delayed
+from numba import njit
+from numba import prange
+from scipy.sparse import hstack
 from sklearn.gaussian_process import GaussianProcessRegressor
 from sklearn.utils import check_random_state
 from sklearn.utils.multiclass import class_distribution
 
 from sktime.classification.base import BaseClassifier
+from sktime.classification.dictionary_based._boss import _nearest_neighbours
 from sktime.transformations.panel.dictionary_based import SFA
 from sktime.utils.validation.panel import check_X
 from sktime.utils.validation.panel import check_X_y
@@ -341,33 +344,22 @@ class TemporalDictionaryEnsemble(BaseClassifier):
 
     def _get_train_probs(self, X):
         num_inst = X.shape[0]
-        results = np.zeros((num_inst, self.n_classes))
-        for i in range(num_inst):
-            divisor = 0
-            sums = np.zeros(self.n_classes)
-
-            cls_idx = []
-            for n, clf in enumerate(self.classifiers):
-                idx = np.where(clf.subsample == i)
-                if len(idx[0]) > 0:
-                    cls_idx.append([n, idx[0][0]])
-
-            preds = Parallel(n_jobs=self.n_jobs)(
-                delayed(self.classifiers[cls[0]]._train_predict)(
-                    cls[1],
-                )
-                for cls in cls_idx
-            )
+        sums = np.zeros((num_inst, self.n_classes))
+        divisors = np.zeros(num_inst)
 
-            for n, pred in enumerate(preds):
-                sums[self.class_dictionary.get(pred, -1)] += self.weights[cls_idx[n][0]]
-                divisor += self.weights[cls_idx[n][0]]
+        preds = Parallel(n_jobs=self.n_jobs)(
+            delayed(clf._train_predictions)() for clf in self.classifiers
+        )
 
-            results[i] = (
-                np.ones(self.n_classes) * (1 / self.n_classes)
-                if divisor == 0
-                else sums / (np.ones(self.n_classes) * divisor)
-            )
+        # each classifier predicts the cases of its subsample
+        for n, clf in enumerate(self.classifiers):
+            for i, pred in zip(clf.subsample, preds[n]):
+                sums[i, self.class_dictionary.get(pred, -1)] += self.weights[n]
+                divisors[i] += self.weights[n]
+
+        results = np.ones((num_inst, self.n_classes)) * (1 / self.n_classes)
+        predicted = divisors > 0
+        results[predicted] = sums[predicted] / divisors[predicted, np.newaxis]
 
         return results
 
@@ -375,28 +367,13 @@ class TemporalDictionaryEnsemble(BaseClassifier):
         correct = 0
         required_correct = int(lowest_acc * train_size)
 
-        if self.n_jobs > 1:
-            c = Parallel(n_jobs=self.n_jobs)(
-                delayed(tde._train_predict)(
-                    i,
-                )
-                for i in range(train_size)
-            )
+        c = tde._train_predictions()
 
-            for i in range(train_size):
-                if correct + train_size - i < required_correct:
-                    return -1
-                elif c[i] == y[i]:
-                    correct += 1
-        else:
-            for i in range(train_size):
-                if correct + train_size - i < required_correct:
-                    return -1
-
-                c = tde._train_predict(i)
-
-                if c == y[i]:
-                    correct += 1
+        for i in range(train_size):
+            if correct + train_size - i < required_correct:
+                return -1
+            elif c[i] == y[i]:
+                correct += 1
 
         return correct / train_size
 
@@ -453,7 +430,7 @@ class IndividualTDE(BaseClassifier):
         X, y = check_X_y(X, y, coerce_to_numpy=True)
 
         self.n_instances, self.n_dims, self.series_length = X.shape
-        self.class_vals = y
+        self.class_vals = np.asarray(y)
         self.num_classes = np.unique(y).shape[0]
         self.classes_ = class_distribution(np.asarray(y).reshape(-1, 1))[0][0]
         for index, classVal in enumerate(self.classes_):
@@ -463,18 +440,14 @@ class IndividualTDE(BaseClassifier):
         if self.n_dims > 1:
             self.dims, self.transformers = self._select_dims(X, y)
 
-            words = [defaultdict(int) for _ in range(self.n_instances)]
-
+            # the words of each dimension have their own columns
+            dim_bags = []
             for i, dim in enumerate(self.dims):
                 X_dim = X[:, dim, :].reshape(self.n_instances, 1, self.series_length)
                 dim_words = self.transformers[i].transform(X_dim, y)
-                dim_words = dim_words[0]
-
-                for i in range(self.n_instances):
-                    for word, count in dim_words[i].items():
-                        words[i][word << self.highest_dim_bit | dim] = count
+                dim_bags.append(dim_words[0])
 
-            self.transformed_data = words
+            self.transformed_data = hstack(dim_bags, format="csr")
         else:
             self.transformers.append(
                 SFA(
@@ -487,6 +460,7 @@ class IndividualTDE(BaseClassifier):
                     bigrams=self.bigrams,
                     remove_repeat_words=True,
                     save_words=False,
+                    return_sparse=True,
                     n_jobs=self.n_jobs,
                 )
             )
@@ -502,30 +476,24 @@ class IndividualTDE(BaseClassifier):
         num_cases = X.shape[0]
 
         if self.n_dims > 1:
-            words = [defaultdict(int) for _ in range(num_cases)]
-
+            dim_bags = []
             for i, dim in enumerate(self.dims):
                 X_dim = X[:, dim, :].reshape(num_cases, 1, self.series_length)
                 dim_words = self.transformers[i].transform(X_dim)
-                dim_words = dim_words[0]
 
-                for i in range(num_cases):
-                    for word, count in dim_words[i].items():
-                        words[i][word << self.highest_dim_bit | dim] = count
+                # words missing from the training data do not add to the
+                # histogram intersection
+                n_words = len(self.transformers[i].vocabulary)
+                dim_bags.append(dim_words[0][:, :n_words])
 
-            test_bags = words
+            test_bags = hstack(dim_bags, format="csr")
         else:
             test_bags = self.transformers[0].transform(X)
             test_bags = test_bags[0]
+        similarities = _histogram_intersection_matrix(test_bags, self.transformed_data)
 
-        classes = Parallel(n_jobs=self.n_jobs)(
-            delayed(self._test_nn)(
-                test_bag,
-            )
-            for test_bag in test_bags
-        )
-
-        return np.array(classes)
+        # the most similar training cases are the closest ones
+        return self.class_vals[_nearest_neighbours(-similarities, self.random_state)]
 
     def predict_proba(self, X):
         preds = self.predict(X)
@@ -536,21 +504,6 @@ class IndividualTDE(BaseClassifier):
 
         return dists
 
-    def _test_nn(self, test_bag):
-        rng = check_random_state(self.random_state)
-
-        best_sim = -1
-        nn = None
-
-        for n, bag in enumerate(self.transformed_data):
-            sim = histogram_intersection(test_bag, bag)
-
-            if sim > best_sim or (sim == best_sim and rng.random() < 0.5):
-                best_sim = sim
-                nn = self.class_vals[n]
-
-        return nn
-
     def _select_dims(self, X, y):
         self.highest_dim_bit = (math.ceil(math.log2(self.n_dims))) + 1
         accs = []
@@ -571,6 +524,7 @@ class IndividualTDE(BaseClassifier):
                     remove_repeat_words=True,
                     save_words=False,
                     save_binning_dft=True,
+                    return_sparse=True,
                     n_jobs=self.n_jobs,
                 )
             )
@@ -584,11 +538,11 @@ class IndividualTDE(BaseClassifier):
                 transformers[i].binning_dft,
             )
             transformers[i].binning_dft = None
+            # the vocabulary is taken from the bags of the training data in fit
+            transformers[i].vocabulary = None
 
-            correct = 0
-            for i in range(self.n_instances):
-                if self._train_predict(i, sfa[0]) == y[i]:
-                    correct = correct + 1
+            preds = self._train_predictions(sfa[0])
+            correct = np.count_nonzero(preds == y)
 
             accs.append(correct)
 
@@ -612,25 +566,16 @@ class IndividualTDE(BaseClassifier):
 
         return dims, fin_transformers
 
-    def _train_predict(self, train_num, bags=None):
+    def _train_predictions(self, bags=None):
+        """Leave-one-out predictions of the training cases, with ties broken
+        by the first of the most similar training cases"""
         if bags is None:
             bags = self.transformed_data
 
-        test_bag = bags[train_num]
-        best_sim = -1
-        nn = None
-
-        for n, bag in enumerate(bags):
-            if n == train_num:
-                continue
-
-            sim = histogram_intersection(test_bag, bag)
+        similarities = _histogram_intersection_matrix(bags, bags)
+        np.fill_diagonal(similarities, -np.inf)
 
-            if sim > best_sim:
-                best_sim = sim
-                nn = self.class_vals[n]
-
-        return nn
+        return self.class_vals[np.argmax(similarities, axis=1)]
 
 
 def histogram_intersection(first, second):
@@ -649,3 +594,55 @@ def histogram_intersection(first, second):
         )
 
     return sim
+
+
+def _histogram_intersection_matrix(first, second):
+    """Histogram intersections between all the bags of first and second
+
+    Parameters
+    ----------
+    first : scipy CSR matrix of shape (n_first, n_words) of word counts
+    second : scipy CSR matrix of shape (n_second, n_words) of word counts
+
+    Returns
+    -------
+    similarities : np.ndarray of shape (n_first, n_second)
+    """
+    return _histogram_intersection_kernel(
+        first.data,
+        first.indices,
+        first.indptr,
+        second.data,
+        second.indices,
+        second.indptr,
+        max(first.shape[1], second.shape[1]),
+    )
+
+
+@njit(fastmath=True, cache=True, parallel=True)
+def _histogram_intersection_kernel(
+    first_data,
+    first_indices,
+    first_indptr,
+    second_data,
+    second_indices,
+    second_indptr,
+    n_words,
+):
+    n_first = len(first_indptr) - 1
+    n_second = len(second_indptr) - 1
+    similarities = np.zeros((n_first, n_second))
+
+    for i in prange(n_first):
+        # dense counts of the words of the first bag
+        counts = np.zeros(n_words)
+        for k in range(first_indptr[i], first_indptr[i + 1]):
+            counts[first_indices[k]] = first_data[k]
+
+        for j in range(n_second):
+            sim = 0.0
+            for k in range(second_indptr[j], second_indptr[j + 1]):
+                sim += min(counts[second_indices[k]], second_data[k])
+            similarities[i, j] = sim
+
+    return similarities
@@ -9,10 +9,9 @@ __all__ = ["WEASEL"]
 import math
 import numpy as np
 from numba import njit
-from sklearn.feature_extraction import DictVectorizer
+from scipy.sparse import hstack
 from sklearn.feature_selection import chi2
 from sklearn.linear_model import LogisticRegression
-from sklearn.pipeline import make_pipeline
 from sklearn.utils import check_random_state
 from sklearn.utils.multiclass import class_distribution
 
@@ -156,6 +155,7 @@ class WEASEL(BaseClassifier):
         self.n_instances = 0
 
         self.SFA_transformers = []
+        self.relevant_features = []
         self.clf = None
         self.n_jobs = n_jobs
         self.classes_ = []
@@ -201,8 +201,6 @@ class WEASEL(BaseClassifier):
             window_size,
         ):
             rng = check_random_state(window_size)
-            all_words = [dict() for x in range(len(X))]
-            relevant_features_count = 0
 
             # for window_size in self.window_sizes:
             transformer = SFA(
@@ -217,69 +215,47 @@ class WEASEL(BaseClassifier):
                 remove_repeat_words=False,
                 lower_bounding=False,
                 save_words=False,
+                return_sparse=True,
             )
 
             sfa_words = transformer.fit_transform(X, y)
-
-            # self.SFA_transformers.append(transformer)
             bag = sfa_words[0]
-            apply_chi_squared = self.p_threshold < 1
 
             # chi-squared test to keep only relevant features
-            if apply_chi_squared:
-                vectorizer = DictVectorizer(sparse=True, dtype=np.int32, sort=False)
-                bag_vec = vectorizer.fit_transform(bag)
-
-                chi2_statistics, p = chi2(bag_vec, y)
-                relevant_features_idx = np.where(p <= self.p_threshold)[0]
-                relevant_features = set(
-                    np.array(vectorizer.feature_names_)[relevant_features_idx]
-                )
-                relevant_features_count += len(relevant_features_idx)
-
-                # merging bag-of-patterns of different window_sizes
-                # to single bag-of-patterns with prefix indicating
-                # the used window-length
-                for j in range(len(bag)):
-                    for (key, value) in bag[j].items():
-                        # chi-squared test
-                        if (not apply_chi_squared) or (key in relevant_features):
-                            # append the prefixes to the words to
-                            # distinguish between window-sizes
-                            word = WEASEL.shift_left(key, self.highest_bit, window_size)
-                            all_words[j][word] = value
-
-                return all_words, transformer, relevant_features_count
+            if self.p_threshold < 1:
+                chi2_statistics, p = chi2(bag, y)
+                relevant_features = np.where(p <= self.p_threshold)[0]
+            else:
+                relevant_features = np.arange(bag.shape[1])
+
+            return bag[:, relevant_features], transformer, relevant_features
 
         parallel_res = Parallel(n_jobs=self.n_jobs)(
             delayed(_parallel_fit)(window_size) for window_size in self.window_sizes
         )  # , verbose=self.verbose
 
-        relevant_features_count = 0
-        all_words = [dict() for x in range(len(X))]
-
-        for sfa_words, transformer, rel_features_count in parallel_res:
+        # merging bag-of-patterns of different window_sizes
+        # to single bag-of-patterns, with the columns of each window size
+        # after those of the previous ones
+        self.SFA_transformers = []
+        self.relevant_features = []
+        bags = []
+        for bag, transformer, relevant_features in parallel_res:
             self.SFA_transformers.append(transformer)
-            relevant_features_count += rel_features_count
-
-            for idx, bag in enumerate(sfa_words):
-                for word, count in bag.items():
-                    all_words[idx][word] = count
-
-        self.clf = make_pipeline(
-            DictVectorizer(sparse=True, sort=False),
-            # StandardScaler(copy=False),
-            LogisticRegression(
-                max_iter=5000,
-                solver="liblinear",
-                dual=True,
-                # class_weight="balanced",
-                penalty="l2",
-                random_state=self.random_state,
-            ),
+            self.relevant_features.append(relevant_features)
+            bags.append(bag)
+        all_words = hstack(bags, format="csr")
+
+        self.clf = LogisticRegression(
+            max_iter=5000,
+            solver="liblinear",
+            dual=True,
+            # class_weight="balanced",
+            penalty="l2",
+            random_state=self.random_state,
         )
 
-        # print("Size of dict", relevant_features_count)
+        # print("Size of dict", all_words.shape[1])
         self.clf.fit(all_words, y)
         self._is_fitted = True
         return self
@@ -302,25 +278,16 @@ class WEASEL(BaseClassifier):
         self.check_is_fitted()
         X = check_X(X, enforce_univariate=True, coerce_to_numpy=True)
 
-        bag_all_words = [dict() for _ in range(len(X))]
-        for transformer in self.SFA_transformers:
-            # SFA transform
+        bags = []
+        for transformer, relevant_features in zip(
+            self.SFA_transformers, self.relevant_features
+        ):
+            # SFA transform, keeping the columns of the relevant words of the
+            # training data
             sfa_words = transformer.transform(X)
-            bag = sfa_words[0]
+            bags.append(sfa_words[0][:, relevant_features])
 
-            # merging bag-of-patterns of different window_sizes
-            # to single bag-of-patterns with prefix indicating
-            # the used window-length
-            for j in range(len(bag)):
-                for (key, value) in bag[j].items():
-                    # append the prefices to the words to distinguish
-                    # between window-sizes
-                    word = WEASEL.shift_left(
-                        key, self.highest_bit, transformer.window_size
-                    )
-                    bag_all_words[j][word] = value
-
-        return bag_all_words
+        return hstack(bags, format="csr")
 
     def compute_window_inc(self):
         win_inc = self.window_inc
@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
 import numpy as np
+import pytest
 from numpy import testing
+from sklearn.utils import check_random_state
 
 from sktime.classification.dictionary_based import BOSSEnsemble, IndividualBOSS
+from sktime.classification.dictionary_based._boss import _boss_distance_matrix
+from sktime.classification.dictionary_based._boss import _nearest_neighbours
+from sktime.classification.dictionary_based._boss import boss_distance
 from sktime.datasets import load_gunpoint, load_italy_power_demand
+from sktime.transformations.panel.dictionary_based import SFA
 
 
 def test_boss_on_gunpoint():
@@ -50,6 +56,68 @@ def test_boss_on_power_demand():
     assert score >= 0.88
 
 
+def test_boss_distance_matrix():
+    X_train, y_train = load_gunpoint(split="train", return_X_y=True)
+    X_test, _ = load_gunpoint(split="test", return_X_y=True)
+    params = dict(window_size=30, word_length=6, remove_repeat_words=True)
+
+    sfa = SFA(**params).fit(X_train.iloc[:15], y_train[:15])
+    sfa_sparse = SFA(return_sparse=True, **params).fit(X_train.iloc[:15], y_train[:15])
+    train_bags = sfa.transform(X_train.iloc[:15])[0]
+    test_bags = sfa.transform(X_test.iloc[:10])[0]
+    distances = _boss_distance_matrix(
+        sfa_sparse.transform(X_test.iloc[:10])[0],
+        sfa_sparse.transform(X_train.iloc[:15])[0],
+    )
+
+    expected = [[boss_distance(a, b) for b in train_bags] for a in test_bags]
+    testing.assert_array_equal(distances, expected)
+
+
+def _reference_nearest_neighbours(distances, random_state):
+    # search the neighbours in order, breaking ties at random
+    indices = []
+    for row in distances:
+        rng = check_random_state(random_state)
+        best_dist = np.inf
+        for n, dist in enumerate(row):
+            if dist < best_dist or (dist == best_dist and rng.random() < 0.5):
+                best_dist = dist
+                nn = n
+        indices.append(nn)
+    return indices
+
+
+@pytest.mark.parametrize("random_state", [0, 42, "instance"])
+def test_nearest_neighbours_breaks_ties_as_sequential_search(random_state):
+    distances = np.random.RandomState(1).randint(0, 4, size=(50, 20))
+
+    if random_state == "instance":
+        indices = _nearest_neighbours(distances, np.random.RandomState(5))
+        expected = _reference_nearest_neighbours(distances, np.random.RandomState(5))
+    else:
+        indices = _nearest_neighbours(distances, random_state)
+        expected = _reference_nearest_neighbours(distances, random_state)
+    testing.assert_array_equal(indices, expected)
+
+
+def test_train_predictions_match_leave_one_out_search():
+    X_train, y_train = load_gunpoint(split="train", return_X_y=True)
+    boss = IndividualBOSS(window_size=20, random_state=0)
+    boss.fit(X_train, y_train)
+
+    # the first of the closest other training cases
+    bags = [dict(zip(row.indices, row.data)) for row in boss.transformed_data]
+    expected = []
+    for i, bag in enumerate(bags):
+        distances = [
+            np.inf if i == j else boss_distance(bag, other)
+            for j, other in enumerate(bags)
+        ]
+        expected.append(boss.class_vals[np.argmin(distances)])
+    testing.assert_array_equal(boss._train_predictions(), expected)
+
+
 boss_gunpoint_probas = np.array(
     [
         [
@@ -5,8 +5,11 @@ from numpy import testing
 from sktime.classification.dictionary_based._tde import (
     TemporalDictionaryEnsemble,
     IndividualTDE,
+    _histogram_intersection_matrix,
+    histogram_intersection,
 )
 from sktime.datasets import load_gunpoint, load_italy_power_demand, load_basic_motions
+from sktime.transformations.panel.dictionary_based import SFA
 
 
 def test_tde_on_gunpoint():
@@ -83,6 +86,41 @@ def test_tde_on_basic_motions():
     testing.assert_array_equal(probas, tde_basic_motions_probas)
 
 
+def test_histogram_intersection_matrix():
+    X_train, y_train = load_gunpoint(split="train", return_X_y=True)
+    X_test, _ = load_gunpoint(split="test", return_X_y=True)
+    params = dict(window_size=30, word_length=6, levels=2, bigrams=True)
+
+    sfa = SFA(**params).fit(X_train.iloc[:15], y_train[:15])
+    sfa_sparse = SFA(return_sparse=True, **params).fit(X_train.iloc[:15], y_train[:15])
+    train_bags = sfa.transform(X_train.iloc[:15])[0]
+    test_bags = sfa.transform(X_test.iloc[:10])[0]
+    similarities = _histogram_intersection_matrix(
+        sfa_sparse.transform(X_test.iloc[:10])[0],
+        sfa_sparse.transform(X_train.iloc[:15])[0],
+    )
+
+    expected = [[histogram_intersection(a, b) for b in train_bags] for a in test_bags]
+    testing.assert_array_equal(similarities, expected)
+
+
+def test_train_predictions_match_leave_one_out_search():
+    X_train, y_train = load_gunpoint(split="train", return_X_y=True)
+    tde = IndividualTDE(window_size=20, levels=2, random_state=0)
+    tde.fit(X_train, y_train)
+
+    # the first of the most similar other training cases
+    bags = [dict(zip(row.indices, row.data)) for row in tde.transformed_data]
+    expected = []
+    for i, bag in enumerate(bags):
+        similarities = [
+            -np.inf if i == j else histogram_intersection(bag, other)
+            for j, other in enumerate(bags)
+        ]
+        expected.append(tde.class_vals[np.argmax(similarities)])
+    testing.assert_array_equal(tde._train_predictions(), expected)
+
+
 tde_gunpoint_probas = np.array(
     [
         [
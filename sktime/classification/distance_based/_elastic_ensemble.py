@@ -11,19 +11,21 @@ import time
 from itertools import product
 
 import numpy as np
-import pandas as pd
+from joblib import Parallel
+from joblib import delayed
+from joblib import effective_n_jobs
 from sklearn.metrics import accuracy_score
-from sklearn.model_selection import GridSearchCV
-from sklearn.model_selection import LeaveOneOut
-from sklearn.model_selection import RandomizedSearchCV
+from sklearn.model_selection import ParameterSampler
 from sklearn.model_selection import StratifiedShuffleSplit
-from sklearn.model_selection import cross_val_predict
 from sklearn.preprocessing import LabelEncoder
 from sklearn.utils.multiclass import class_distribution
 from sktime.classification.base import BaseClassifier
 from sktime.classification.distance_based._time_series_neighbors import (
     KNeighborsTimeSeriesClassifier,
 )
+from sktime.classification.distance_based._time_series_neighbors import (
+    _PAIRWISE_DISTANCES,
+)
 from sktime.distances.elastic_cython import ddtw_distance as ddtw_c
 from sktime.distances.elastic_cython import dtw_distance as dtw_c
 from sktime.distances.elastic_cython import erp_distance as erp_c
@@ -31,7 +33,8 @@ from sktime.distances.elastic_cython import lcss_distance as lcss_c
 from sktime.distances.elastic_cython import msm_distance as msm_c
 from sktime.distances.elastic_cython import wddtw_distance as wddtw_c
 from sktime.distances.elastic_cython import wdtw_distance as wdtw_c
-from sktime.transformations.panel.summarize import DerivativeSlopeTransformer
+from sktime.distances.cache import get_cache
+from sktime.distances.pairwise import pairwise_distance
 from sktime.utils.validation.panel import check_X
 from sktime.utils.validation.panel import check_X_y
 
@@ -67,12 +70,17 @@ class ElasticEnsemble(BaseClassifier):
       The proportion of the train set to use in classifying new cases optional.
     n_jobs : int or None, optional (default=None)
       The number of jobs to run in parallel for both `fit` and `predict`.
+      In `fit` the distance measures are evaluated concurrently.
       ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
       ``-1`` means using all processors.
     random_state : int, default=0
       The random seed.
     verbose : int, default=0
       If ``>0``, then prints out debug information.
+    time_limit : float, default=0.0
+      Time contract to limit the parameter search in minutes, 0 means no
+      limit. When the contract runs out the search of each measure stops at
+      the parameter options evaluated so far, visiting them in random order.
 
     Attributes
     ----------
@@ -100,6 +108,7 @@ class ElasticEnsemble(BaseClassifier):
         n_jobs=None,
         random_state=0,
         verbose=0,
+        time_limit=0.0,
     ):
         if distance_measures == "all":
             self.distance_measures = [
@@ -123,6 +132,7 @@ class ElasticEnsemble(BaseClassifier):
         self.n_jobs = n_jobs
         self.random_state = random_state
         self.verbose = verbose
+        self.time_limit = time_limit
         self.train = None
         self.constituent_build_times = None
         super(ElasticEnsemble, self).__init__()
@@ -142,7 +152,7 @@ class ElasticEnsemble(BaseClassifier):
         self : object
         """
 
-        X, y = check_X_y(X, y, enforce_univariate=True, coerce_to_pandas=False)
+        X, y = check_X_y(X, y, enforce_univariate=True, coerce_to_numpy=True)
 
         # Derivative DTW (DDTW) uses the regular DTW algorithm on data that
         # are transformed into derivatives.
@@ -150,24 +160,15 @@ class ElasticEnsemble(BaseClassifier):
         # into derivatives, and then call the
         # standard DTW algorithm on it, rather than transforming each series
         # every time a distance calculation
-        # is made. Please note that using DDTW elsewhere will not benefit
-        # from this speed enhancement
+        # is made. The derivatives are kept in the cache shared by the
+        # distance based classifiers, so they are only computed once per series
         if self.distance_measures.__contains__(
             ddtw_c
         ) or self.distance_measures.__contains__(wddtw_c):
-            der_X = DerivativeSlopeTransformer().fit_transform(X)
-            # reshape X for use with the efficient cython distance measures
-            if isinstance(X, pd.DataFrame):
-                der_X = np.array(
-                    [np.asarray([x]).reshape(1, len(x)) for x in der_X.iloc[:, 0]]
-                )
+            der_X = get_cache().slope_derivative(X)
         else:
             der_X = None
 
-        # reshape X for use with the efficient cython distance measures
-        if isinstance(X, pd.DataFrame):
-            X = np.array([np.asarray([x]).reshape(1, len(x)) for x in X.iloc[:, 0]])
-
         self.train_accs_by_classifier = np.zeros(len(self.distance_measures))
         self.train_preds_by_classifier = [None] * len(self.distance_measures)
         self.estimators_ = [None] * len(self.distance_measures)
@@ -187,8 +188,8 @@ class ElasticEnsemble(BaseClassifier):
         # This is achieved through the use of a deterministic
         # StratifiedShuffleSplit
         #
-        # For using less parameter options a RandomizedSearchCV is used in
-        # place of a GridSearchCV
+        # For using less parameter options the options are randomly sampled
+        # from the grid with a ParameterSampler
 
         param_train_x = None
         der_param_train_x = None
@@ -238,149 +239,179 @@ class ElasticEnsemble(BaseClassifier):
                 "options per "
                 "measure"
             )
-        for dm in range(0, len(self.distance_measures)):
-            this_measure = self.distance_measures[dm]
-
-            # uses the appropriate training data as required (either full or
-            # smaller sample as per the StratifiedShuffleSplit)
-            param_train_to_use = param_train_x
-            full_train_to_use = X
-            if this_measure is ddtw_c or dm is wddtw_c:
-                param_train_to_use = der_param_train_x
-                full_train_to_use = der_X
-                if this_measure is ddtw_c:
-                    this_measure = dtw_c
-                elif this_measure is wddtw_c:
-                    this_measure = wdtw_c
-
-            start_build_time = time.time()
-            if self.verbose > 0:
-                if (
-                    self.distance_measures[dm] is ddtw_c
-                    or self.distance_measures[dm] is wddtw_c
-                ):
-                    print(  # noqa: T001
-                        "Currently evaluating "
-                        + str(self.distance_measures[dm].__name__)
-                        + " (implemented as "
-                        + str(this_measure.__name__)
-                        + " with pre-transformed derivative data)"
-                    )
-                else:
-                    print(  # noqa: T001
-                        "Currently evaluating "
-                        + str(self.distance_measures[dm].__name__)
-                    )
-
-            # If 100 parameter options are being considered per measure,
-            # use a GridSearchCV
-            if self.proportion_of_param_options == 1:
-
-                grid = GridSearchCV(
-                    estimator=KNeighborsTimeSeriesClassifier(
-                        distance=this_measure, n_neighbors=1
-                    ),
-                    param_grid=ElasticEnsemble._get_100_param_options(
-                        self.distance_measures[dm], X
-                    ),
-                    cv=LeaveOneOut(),
-                    scoring="accuracy",
-                    n_jobs=self.n_jobs,
-                    verbose=self.verbose,
-                )
-                grid.fit(param_train_to_use, param_train_y)
 
-            # Else, used RandomizedSearchCV to randomly sample parameter
-            # options for each measure
-            else:
-                grid = RandomizedSearchCV(
-                    estimator=KNeighborsTimeSeriesClassifier(
-                        distance=this_measure, n_neighbors=1
-                    ),
-                    param_distributions=ElasticEnsemble._get_100_param_options(
-                        self.distance_measures[dm], X
-                    ),
-                    n_iter=100 * self.proportion_of_param_options,
-                    cv=LeaveOneOut(),
-                    scoring="accuracy",
-                    n_jobs=self.n_jobs,
-                    random_state=rand,
-                    verbose=self.verbose,
-                )
-                grid.fit(param_train_to_use, param_train_y)
-
-            # once the best parameter option has been estimated on the
-            # training data, perform a final pass with this parameter option
-            # to get the individual predictions with cross_cal_predict (
-            # Note: optimisation potentially possible here if a GridSearchCV
-            # was used previously. TO-DO: determine how to extract
-            # predictions for the best param option from GridSearchCV)
-            best_model = KNeighborsTimeSeriesClassifier(
-                n_neighbors=1,
-                distance=this_measure,
-                distance_params=grid.best_params_["distance_params"],
-            )
-            preds = cross_val_predict(
-                best_model, full_train_to_use, y, cv=LeaveOneOut()
+        # The measures are evaluated concurrently, each one in its own
+        # process. The remaining jobs are used as threads by the distance
+        # computations of each measure. The time contract is split evenly
+        # between the measures that share a job.
+        n_jobs = effective_n_jobs(self.n_jobs)
+        n_measures = len(self.distance_measures)
+        n_measure_jobs = min(n_jobs, n_measures)
+        time_limit = self.time_limit * 60 * n_measure_jobs / n_measures
+        seeds = rand.randint(np.iinfo(np.int32).max, size=n_measures)
+
+        results = Parallel(n_jobs=n_measure_jobs)(
+            delayed(self._fit_measure)(
+                dm,
+                X,
+                der_X,
+                y,
+                param_train_x,
+                der_param_train_x,
+                param_train_y,
+                time_limit,
+                seeds[dm],
+                max(1, n_jobs // n_measure_jobs),
             )
-            acc = accuracy_score(y, preds)
+            for dm in range(n_measures)
+        )
+        for dm, (best_model, acc, preds, build_time) in enumerate(results):
+            self.constituent_build_times.append(str(build_time))
+            self.estimators_[dm] = best_model
+            self.train_accs_by_classifier[dm] = acc
+            self.train_preds_by_classifier[dm] = preds
 
-            if self.verbose > 0:
+        self._is_fitted = True
+        return self
+
+    def _fit_measure(
+        self,
+        dm,
+        X,
+        der_X,
+        y,
+        param_train_x,
+        der_param_train_x,
+        param_train_y,
+        time_limit,
+        random_state,
+        n_jobs,
+    ):
+        """Find the parameter option of one measure with the best leave-one-out
+        accuracy and fit a 1-NN classifier with it.
+
+        The leave-one-out predictions of a 1-NN classifier are read off the
+        train-train distance matrix, so each parameter option needs a single
+        distance matrix rather than one nearest neighbour search per fold.
+        """
+        start_build_time = time.time()
+        this_measure = self.distance_measures[dm]
+
+        # uses the appropriate training data as required (either full or
+        # smaller sample as per the StratifiedShuffleSplit)
+        param_train_to_use = param_train_x
+        full_train_to_use = X
+        if this_measure is ddtw_c or this_measure is wddtw_c:
+            param_train_to_use = der_param_train_x
+            full_train_to_use = der_X
+            if this_measure is ddtw_c:
+                this_measure = dtw_c
+            elif this_measure is wddtw_c:
+                this_measure = wdtw_c
+        metric = _PAIRWISE_DISTANCES[this_measure]
+
+        if self.verbose > 0:
+            if this_measure is not self.distance_measures[dm]:
                 print(  # noqa: T001
-                    "Training accuracy for "
+                    "Currently evaluating "
                     + str(self.distance_measures[dm].__name__)
-                    + ": "
-                    + str(acc)
-                    + " (with parameter setting: "
-                    + str(grid.best_params_["distance_params"])
-                    + ")"
+                    + " (implemented as "
+                    + str(this_measure.__name__)
+                    + " with pre-transformed derivative data)"
+                )
+            else:
+                print(  # noqa: T001
+                    "Currently evaluating " + str(self.distance_measures[dm].__name__)
                 )
 
-            # Finally, reset the classifier for this measure and parameter
-            # option, ready to be called for test classification
-            best_model = KNeighborsTimeSeriesClassifier(
-                n_neighbors=1,
-                distance=this_measure,
-                distance_params=grid.best_params_["distance_params"],
+        param_grid = ElasticEnsemble._get_100_param_options(
+            self.distance_measures[dm], X
+        )
+        # If less than 100 parameter options are being considered per
+        # measure, randomly sample them from the grid
+        if self.proportion_of_param_options < 1:
+            param_options = [
+                params["distance_params"]
+                for params in ParameterSampler(
+                    param_grid,
+                    n_iter=int(round(100 * self.proportion_of_param_options)),
+                    random_state=random_state,
+                )
+            ]
+        # Else, if the search is contracted, evaluate the grid in random order
+        # so that the options evaluated in time are a random sample of it
+        elif time_limit > 0:
+            order = np.random.RandomState(random_state).permutation(
+                len(param_grid["distance_params"])
+            )
+            param_options = [param_grid["distance_params"][i] for i in order]
+        else:
+            param_options = param_grid["distance_params"]
+
+        best_acc = -1
+        best_params = None
+        best_distances = None
+        for params in param_options:
+            distances = pairwise_distance(
+                param_train_to_use, metric=metric, n_jobs=n_jobs, **params
             )
-            best_model.fit(full_train_to_use, y)
-            end_build_time = time.time()
+            acc = accuracy_score(
+                param_train_y, _loocv_predict(distances, param_train_y)
+            )
+            if acc > best_acc:
+                best_acc = acc
+                best_params = params
+                best_distances = distances
+            if time_limit > 0 and time.time() - start_build_time > time_limit:
+                break
+
+        # once the best parameter option has been estimated on the
+        # training data, get the leave-one-out predictions with this option on
+        # the full training data, reusing its distance matrix if the parameter
+        # search used all training cases
+        if param_train_to_use is not full_train_to_use:
+            best_distances = pairwise_distance(
+                full_train_to_use, metric=metric, n_jobs=n_jobs, **best_params
+            )
+        preds = _loocv_predict(best_distances, y)
+        acc = accuracy_score(y, preds)
 
-            self.constituent_build_times.append(str(end_build_time - start_build_time))
-            self.estimators_[dm] = best_model
-            self.train_accs_by_classifier[dm] = acc
-            self.train_preds_by_classifier[dm] = preds
+        if self.verbose > 0:
+            print(  # noqa: T001
+                "Training accuracy for "
+                + str(self.distance_measures[dm].__name__)
+                + ": "
+                + str(acc)
+                + " (with parameter setting: "
+                + str(best_params)
+                + ")"
+            )
 
-        self._is_fitted = True
-        return self
+        # Finally, reset the classifier for this measure and parameter
+        # option, ready to be called for test classification
+        best_model = KNeighborsTimeSeriesClassifier(
+            n_neighbors=1,
+            distance=this_measure,
+            distance_params=best_params,
+        )
+        best_model.fit(full_train_to_use, y)
+        end_build_time = time.time()
+
+        return best_model, acc, preds, end_build_time - start_build_time
 
     def predict_proba(self, X):
         self.check_is_fitted()
-        X = check_X(X, enforce_univariate=True, coerce_to_pandas=False)
+        X = check_X(X, enforce_univariate=True, coerce_to_numpy=True)
 
         # Derivative DTW (DDTW) uses the regular DTW algorithm on data that
-        # are transformed into derivatives.
-        # To increase the efficiency of DDTW we can pre-transform the data
-        # into derivatives, and then call the
-        # standard DTW algorithm on it, rather than transforming each series
-        # every time a distance calculation
-        # is made. Please note that using DDTW elsewhere will not benefit
-        # from this speed enhancement
+        # are transformed into derivatives, see fit
         if self.distance_measures.__contains__(
             ddtw_c
         ) or self.distance_measures.__contains__(wddtw_c):
-            der_X = DerivativeSlopeTransformer().fit_transform(X)
-            if isinstance(X, pd.DataFrame):
-                der_X = np.array(
-                    [np.asarray([x]).reshape(1, len(x)) for x in der_X.iloc[:, 0]]
-                )
+            der_X = get_cache().slope_derivative(X)
         else:
             der_X = None
 
-        # reshape X for use with the efficient cython distance measures
-        if isinstance(X, pd.DataFrame):
-            X = np.array([np.asarray([x]).reshape(1, len(x)) for x in X.iloc[:, 0]])
-
         output_probas = []
         train_sum = 0
 
@@ -546,3 +577,11 @@ class ElasticEnsemble(BaseClassifier):
             raise NotImplementedError(
                 "EE does not currently support: " + str(distance_measure)
             )
+
+
+def _loocv_predict(distances, y):
+    """Leave-one-out predictions of a 1-NN classifier from the train-train
+    distance matrix, ties are broken by the first nearest neighbour."""
+    distances = distances.copy()
+    np.fill_diagonal(distances, np.inf)
+    return np.asarray(y)[np.argmin(distances, axis=1)]
@@ -10,16 +10,16 @@ Data Mining and Knowledge Discovery, 33(3): 607-635, 2019
 
 # linkedin.com/goastler; github.com/goastler
 __author__ = ["George Oastler"]
-__all__ = ["ProximityForest", "_CachedTransformer", "ProximityStump", "ProximityTree"]
+__all__ = ["ProximityForest", "ProximityStump", "ProximityTree"]
 
 import numpy as np
-import pandas as pd
 from joblib import Parallel
 from joblib import delayed
 from scipy import stats
 from sklearn.preprocessing import LabelEncoder
 from sklearn.preprocessing import normalize
 from sklearn.utils import check_random_state
+from sktime.distances.cache import _slope_derivative
 from sktime.distances.elastic_cython import dtw_distance
 from sktime.distances.elastic_cython import erp_distance
 from sktime.distances.elastic_cython import lcss_distance
@@ -37,8 +37,6 @@ from sktime.classification.distance_based._proximity_forest_utils import (
     negative_dataframe_indices,
 )
 from sktime.classification.distance_based._proximity_forest_utils import stdp as _stdp
-from sktime.transformations.base import _PanelToPanelTransformer
-from sktime.transformations.panel.summarize import DerivativeSlopeTransformer
 from sktime.utils.data_processing import from_nested_to_2d_array
 from sktime.utils.validation.panel import check_X
 from sktime.utils.validation.panel import check_X_y
@@ -52,90 +50,20 @@ from sktime.utils.validation.panel import check_X_y
 # todo duck-type functions
 
 
-class _CachedTransformer(_PanelToPanelTransformer):
-    """Transformer container that transforms data and adds the transformed
-    version to a cache.
-    If the transformation is called again on already seen data the data is
-    fetched
-    from the cache rather than performing the expensive transformation.
-
-    Parameters
-    ----------
-    transformer : the transformer to transform uncached data
-    Attributes
-    ----------
-    cache       : location to store transforms seen before for fast look up
-
+def _derivative_distance(distance_measure):
     """
-
-    _required_parameters = ["transformer"]
-
-    def __init__(self, transformer):
-        self.cache = {}
-        self.transformer = transformer
-        super(_CachedTransformer, self).__init__()
-
-    def clear(self):
-        """
-        clear the cache
-        """
-        self.cache = {}
-
-    def transform(self, X, y=None):
-        """
-        Fit transformer, creating a cache for transformation.
-
-        Parameters
-        ----------
-        X : pandas DataFrame of shape [n_instances, n_features]
-            Input data
-        y : pandas Series, shape (n_instances), optional
-            Targets for supervised learning.
-
-        Returns
-        -------
-        cached_instances.
-        """
-        # for each instance, get transformed instance from cache or
-        # transform and add to cache
-        cached_instances = {}
-        uncached_indices = []
-        for index in X.index.values:
-            try:
-                cached_instances[index] = self.cache[index]
-            except Exception:
-                uncached_indices.append(index)
-        if len(uncached_indices) > 0:
-            uncached_instances = X.loc[uncached_indices, :]
-            transformed_uncached_instances = self.transformer.fit_transform(
-                uncached_instances
-            )
-            transformed_uncached_instances.index = uncached_instances.index
-            transformed_uncached_instances = transformed_uncached_instances.to_dict(
-                "index"
-            )
-            self.cache.update(transformed_uncached_instances)
-            cached_instances.update(transformed_uncached_instances)
-        cached_instances = pd.DataFrame.from_dict(cached_instances, orient="index")
-        return cached_instances
-
-    def __str__(self):
-        return self.transformer.__str__()
-
-
-def _derivative_distance(distance_measure, transformer):
-    """
-    take derivative before conducting distance measure
-    :param distance_measure: the distance measure to use
-    :param transformer: the transformer to use
+    take derivative before conducting distance measure, the derivatives are
+    not cached, as looking a series up costs as much as its derivative
+    :param distance_measure: the cython distance measure to use
     :return: a distance measure function with built in transformation
     """
 
     def distance(instance_a, instance_b, **params):
-        df = pd.DataFrame([instance_a, instance_b])
-        df = transformer.transform(X=df)
-        instance_a = df.iloc[0, :]
-        instance_b = df.iloc[1, :]
+        # cython distance measures take series of shape [n_timepoints,
+        # n_columns], the derivative panels of shape [n_instances, n_columns,
+        # n_timepoints]
+        instance_a = _slope_derivative(instance_a.T[np.newaxis])[0].T
+        instance_b = _slope_derivative(instance_b.T[np.newaxis])[0].T
         return distance_measure(instance_a, instance_b, **params)
 
     return distance
@@ -551,42 +479,28 @@ def euclidean_distance_measure_getter(X):
     return {"distance_measure": [cython_wrapper(dtw_distance)], "w": [0]}
 
 
-def setup_wddtw_distance_measure_getter(transformer):
+def wddtw_distance_measure_getter(X):
     """
-    generate the wddtw distance measure by baking the derivative transformer
-    into the wdtw distance measure
-    :param transformer: the transformer to use
-    :return: a getter to produce the distance measure
+    generate the wddtw distance measure
+    :param X: dataset to derive parameter ranges from
+    :return: distance measure and parameter range dictionary
     """
-
-    def getter(X):
-        return {
-            "distance_measure": [
-                _derivative_distance(cython_wrapper(wdtw_distance), transformer)
-            ],
-            "g": stats.uniform(0, 1),
-        }
-
-    return getter
+    return {
+        "distance_measure": [cython_wrapper(_derivative_distance(wdtw_distance))],
+        "g": stats.uniform(0, 1),
+    }
 
 
-def setup_ddtw_distance_measure_getter(transformer):
+def ddtw_distance_measure_getter(X):
     """
-    generate the ddtw distance measure by baking the derivative transformer
-    into the dtw distance measure
-    :param transformer: the transformer to use
-    :return: a getter to produce the distance measure
+    generate the ddtw distance measure
+    :param X: dataset to derive parameter ranges from
+    :return: distance measure and parameter range dictionary
     """
-
-    def getter(X):
-        return {
-            "distance_measure": [
-                _derivative_distance(cython_wrapper(dtw_distance), transformer)
-            ],
-            "w": stats.uniform(0, 0.25),
-        }
-
-    return getter
+    return {
+        "distance_measure": [cython_wrapper(_derivative_distance(dtw_distance))],
+        "w": stats.uniform(0, 0.25),
+    }
 
 
 def setup_all_distance_measure_getter(proximity):
@@ -595,13 +509,12 @@ def setup_all_distance_measure_getter(proximity):
     :param proximity: a PT / PF / PS
     :return: a list of distance measure getters
     """
-    transformer = _CachedTransformer(DerivativeSlopeTransformer())
     distance_measure_getters = [
         euclidean_distance_measure_getter,
         dtw_distance_measure_getter,
-        setup_ddtw_distance_measure_getter(transformer),
+        ddtw_distance_measure_getter,
         wdtw_distance_measure_getter,
-        setup_wddtw_distance_measure_getter(transformer),
+        wddtw_distance_measure_getter,
         msm_distance_measure_getter,
         lcss_distance_measure_getter,
         erp_distance_measure_getter,
@@ -4,6 +4,8 @@ import numpy as np
 import pandas as pd
 from sktime.utils.validation.panel import check_X, check_X_y
 from sktime.utils.data_processing import from_nested_to_2d_array
+from sktime.utils.data_processing import from_nested_to_3d_numpy
+from sktime.distances.cache import get_cache
 
 # Tuning
 from sklearn.model_selection import GridSearchCV
@@ -249,13 +251,27 @@ class ShapeDTW(BaseClassifier):
         # private method for performing the transformations on
         # the test/training data. It extracts the subsequences
         # and then performs the shape descriptor function on
-        # each subsequence.
+        # each subsequence. The descriptors of each series are kept
+        # in the shared distance cache, so they are computed once for
+        # fit, predict and all folds of the weighting_factor tuning.
+        X = check_X(X, coerce_to_numpy=True)
+        key = (
+            "shape_dtw",
+            self.subsequence_length,
+            self.shape_descriptor_function,
+            tuple(self.shape_descriptor_functions or ()),
+            tuple(sorted((self.metric_params or {}).items())),
+            getattr(self, "weighting_factor", None),
+        )
+        return get_cache().get(X, self._transform_shape_descriptors, key)
+
+    def _transform_shape_descriptors(self, X):
         X = self.sw.transform(X)
 
         # Feed X into the appropriate shape descriptor function
         X = self._generate_shape_descriptors(X)
 
-        return X
+        return from_nested_to_3d_numpy(X)
 
     def predict_proba(self, X):
         """
@@ -39,9 +39,26 @@ from sktime.distances.elastic_cython import (
 
 from sktime.classification.base import BaseClassifier
 from sktime.distances.mpdist import mpdist
+from sktime.distances.neighbors import LOWER_BOUNDED_DISTANCES
+from sktime.distances.neighbors import nearest_neighbors
+from sktime.distances.pairwise import pairwise_distance
 from sktime.utils.validation.panel import check_X
 from sktime.utils.validation.panel import check_X_y
 
+# distance functions which are computed with the batched pairwise distance
+# engine in kneighbors rather than pair by pair through scikit-learn
+_PAIRWISE_DISTANCES = {
+    euclidean_distance: "euclidean",
+    dtw_distance: "dtw",
+    ddtw_distance: "ddtw",
+    wdtw_distance: "wdtw",
+    wddtw_distance: "wddtw",
+    lcss_distance: "lcss",
+    erp_distance: "erp",
+    msm_distance: "msm",
+    twe_distance: "twe",
+}
+
 """
 Please note that many aspects of this class are taken from scikit-learn's
 KNeighborsTimeSeriesClassifier
@@ -95,6 +112,10 @@ class KNeighborsTimeSeriesClassifier(_KNeighborsClassifier, BaseClassifier):
     distance          : distance measure for time series: {'dtw','ddtw',
     'wdtw','lcss','erp','msm','twe'}: default ='dtw'
     distance_params   : dictionary for metric parameters: default = None
+    pruning           : boolean, whether to search for the neighbours using
+    LB_Kim/LB_Keogh lower bounds and early abandoning rather than computing
+    the distance to every training case. Only used with 'dtw', 'ddtw', 'wdtw'
+    and 'wddtw', finds the same neighbours: default = False
 
     """
 
@@ -111,11 +132,13 @@ class KNeighborsTimeSeriesClassifier(_KNeighborsClassifier, BaseClassifier):
         weights="uniform",
         distance="dtw",
         distance_params=None,
+        pruning=False,
         **kwargs
     ):
         self._cv_for_params = False
         self.distance = distance
         self.distance_params = distance_params
+        self.pruning = pruning
 
         if distance == "euclidean":  # Euclidean will default to the base class distance
             distance = euclidean_distance
@@ -345,14 +368,36 @@ class KNeighborsTimeSeriesClassifier(_KNeighborsClassifier, BaseClassifier):
                 else self.effective_metric_params_
             )
 
-            result = pairwise_distances_chunked(
-                X,
-                self._fit_X,
-                reduce_func=reduce_func,
-                metric=self.effective_metric_,
-                n_jobs=n_jobs,
-                **kwds
-            )
+            metric = _PAIRWISE_DISTANCES.get(self.effective_metric_)
+            if self.pruning and metric in LOWER_BOUNDED_DISTANCES:
+                # the data is stored as [n_instances, n_timepoints, n_columns]
+                dist, neigh_ind = nearest_neighbors(
+                    X.transpose((0, 2, 1)),
+                    self._fit_X.transpose((0, 2, 1)),
+                    n_neighbors=n_neighbors,
+                    metric=metric,
+                    n_jobs=n_jobs,
+                    **self.effective_metric_params_
+                )
+                result = [(dist, neigh_ind) if return_distance else neigh_ind]
+            elif metric is not None:
+                dist = pairwise_distance(
+                    X.transpose((0, 2, 1)),
+                    self._fit_X.transpose((0, 2, 1)),
+                    metric=metric,
+                    n_jobs=n_jobs,
+                    **self.effective_metric_params_
+                )
+                result = [reduce_func(dist, 0)]
+            else:
+                result = pairwise_distances_chunked(
+                    X,
+                    self._fit_X,
+                    reduce_func=reduce_func,
+                    metric=self.effective_metric_,
+                    n_jobs=n_jobs,
+                    **kwds
+                )
         else:
             raise ValueError("internal: _fit_method not recognized")
 
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+from numpy.testing import assert_array_equal
+from sklearn.model_selection import LeaveOneOut
+from sklearn.model_selection import cross_val_predict
+
+from sktime.classification.distance_based._elastic_ensemble import ElasticEnsemble
+from sktime.classification.distance_based._time_series_neighbors import (
+    KNeighborsTimeSeriesClassifier,
+)
+from sktime.distances.elastic_cython import ddtw_distance
+from sktime.distances.elastic_cython import dtw_distance
+from sktime.distances.elastic_cython import msm_distance
+from sktime.distances.elastic_cython import wdtw_distance
+from sktime.utils._testing.panel import make_classification_problem
+
+
+def _make_data():
+    X, y = make_classification_problem(
+        n_instances=20, n_timepoints=20, return_numpy=True, random_state=1
+    )
+    return X, np.asarray(y)
+
+
+def test_train_predictions_match_leave_one_out():
+    X, y = _make_data()
+    ee = ElasticEnsemble(
+        distance_measures=[dtw_distance, msm_distance],
+        proportion_of_param_options=0.05,
+    )
+    ee.fit(X, y)
+
+    for estimator, preds in zip(ee.estimators_, ee.train_preds_by_classifier):
+        knn = KNeighborsTimeSeriesClassifier(
+            n_neighbors=1,
+            distance=estimator.distance,
+            distance_params=estimator.distance_params,
+        )
+        expected = cross_val_predict(knn, X, y, cv=LeaveOneOut())
+        assert_array_equal(preds, expected)
+
+
+def test_parallel_fit_matches_sequential_fit():
+    X, y = _make_data()
+    params = dict(
+        distance_measures=[dtw_distance, ddtw_distance, wdtw_distance],
+        proportion_of_param_options=0.1,
+        proportion_train_in_param_finding=0.5,
+    )
+    sequential = ElasticEnsemble(n_jobs=1, **params).fit(X, y)
+    parallel = ElasticEnsemble(n_jobs=2, **params).fit(X, y)
+
+    assert sequential.get_metric_params() == parallel.get_metric_params()
+    assert_array_equal(
+        sequential.train_accs_by_classifier, parallel.train_accs_by_classifier
+    )
+    assert_array_equal(sequential.predict_proba(X), parallel.predict_proba(X))
+
+
+def test_time_limit():
+    X, y = _make_data()
+    ee = ElasticEnsemble(distance_measures=[dtw_distance], time_limit=1e-6)
+    ee.fit(X, y)
+
+    # at least one parameter option is evaluated before the contract expires
+    assert len(ee.estimators_) == 1
+    assert ee.estimators_[0].distance_params["w"] in np.arange(100) / 100
+    assert ee.predict(X).shape == y.shape
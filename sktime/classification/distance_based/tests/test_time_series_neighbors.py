@@ -49,3 +49,14 @@ def test_knn_on_arrowhead():
             if pred[j] == y_test[j]:
                 correct = correct + 1
         assert correct == expected_correct[distance_functions[i]]
+
+
+def test_knn_pruning_on_arrowhead():
+    # lower bounding and early abandoning must find the same neighbours
+    X_train, y_train = load_arrow_head(split="train", return_X_y=True)
+    X_test, y_test = load_arrow_head(split="test", return_X_y=True)
+    for distance in ["dtw", "wdtw"]:
+        knn = KNeighborsTimeSeriesClassifier(distance=distance, pruning=True)
+        knn.fit(X_train, y_train)
+        pred = knn.predict(X_test)
+        assert (pred == y_test).sum() == expected_correct[distance]
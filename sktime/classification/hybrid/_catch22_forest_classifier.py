@@ -15,7 +15,7 @@ from sktime.utils.validation._dependencies import _check_soft_dependencies
 from sktime.utils.validation.panel import check_X
 
 _check_soft_dependencies("catch22")
-from catch22 import catch22_all  # noqa: E402
+from sktime.transformations.panel.catch22_features import Catch22  # noqa: E402
 
 
 class Catch22ForestClassifier(BaseClassifier):
@@ -94,24 +94,15 @@ class Catch22ForestClassifier(BaseClassifier):
         self : object
         """
         X = check_X(X, enforce_univariate=False, coerce_to_numpy=True)
-        n_instances = X.shape[0]
-        X = np.reshape(X, (n_instances, -1))
         self.classes_ = class_distribution(np.asarray(y).reshape(-1, 1))[0][0]
 
-        c22_list = []
-        for i in range(n_instances):
-            series = X[i, :]
-            c22_dict = catch22_all(series)
-            c22_list.append(c22_dict["values"])
-
         self.classifier = RandomForestClassifier(
             n_jobs=self.n_jobs,
             n_estimators=self.n_estimators,
             random_state=self.random_state,
         )
 
-        X_c22 = np.array(c22_list)
-        np.nan_to_num(X_c22, False, 0, 0, 0)
+        X_c22 = self._transform(X)
 
         self.classifier.fit(X_c22, y)
 
@@ -121,33 +112,20 @@ class Catch22ForestClassifier(BaseClassifier):
     def predict(self, X):
         self.check_is_fitted()
         X = check_X(X, enforce_univariate=False, coerce_to_numpy=True)
-        n_instances = X.shape[0]
-        X = np.reshape(X, (n_instances, -1))
-
-        c22_list = []
-        for i in range(n_instances):
-            series = X[i, :]
-            c22_dict = catch22_all(series)
-            c22_list.append(c22_dict["values"])
-
-        X_c22 = np.array(c22_list)
-        np.nan_to_num(X_c22, False, 0, 0, 0)
+        X_c22 = self._transform(X)
 
         return self.classifier.predict(X_c22)
 
     def predict_proba(self, X):
         self.check_is_fitted()
         X = check_X(X, enforce_univariate=False, coerce_to_numpy=True)
-        n_instances = X.shape[0]
-        X = np.reshape(X, (n_instances, -1))
+        X_c22 = self._transform(X)
 
-        c22_list = []
-        for i in range(n_instances):
-            series = X[i, :]
-            c22_dict = catch22_all(series)
-            c22_list.append(c22_dict["values"])
+        return self.classifier.predict_proba(X_c22)
 
-        X_c22 = np.array(c22_list)
+    def _transform(self, X):
+        """Catch22 features of the series of X, with nan and infinite values
+        replaced by 0"""
+        X_c22 = Catch22(n_jobs=self.n_jobs).fit_transform(X).to_numpy()
         np.nan_to_num(X_c22, False, 0, 0, 0)
-
-        return self.classifier.predict_proba(X_c22)
+        return X_c22
@@ -5,11 +5,16 @@
 __author__ = "Matthew Middlehurst"
 __all__ = ["HIVECOTEV1"]
 
+import time
 from datetime import datetime
 
 import numpy as np
+from joblib import Parallel
+from joblib import delayed
+from joblib import effective_n_jobs
+from sklearn.base import clone
 from sklearn.metrics import accuracy_score
-from sklearn.model_selection import cross_val_predict
+from sklearn.model_selection import StratifiedKFold
 from sklearn.utils import check_random_state
 from sklearn.utils.multiclass import class_distribution
 
@@ -22,6 +27,10 @@ from sktime.classification.interval_based import (
 from sktime.classification.shapelet_based import ShapeletTransformClassifier
 from sktime.utils.validation.panel import check_X_y, check_X
 
+# number of trees or parameter samples fit to measure the throughput of a
+# component under a time limit
+_N_PROBE_UNITS = 5
+
 
 class HIVECOTEV1(BaseClassifier):
     """
@@ -34,6 +43,28 @@ class HIVECOTEV1(BaseClassifier):
 
     Parameters
     ----------
+    stc_params              : dict or None, parameters of the
+    ShapeletTransformClassifier (default = {"time_contract_in_mins": 60})
+    tsf_params              : dict or None, parameters of the
+    TimeSeriesForestClassifier (default = None)
+    rise_params             : dict or None, parameters of the
+    RandomIntervalSpectralForest (default = None)
+    cboss_params            : dict or None, parameters of the
+    ContractableBOSS (default = None)
+    train_estimate_method   : str, how the train accuracies that weight the
+    STC, TSF and RISE components are estimated, "cv" fits each component
+    on 10 stratified folds, "internal" uses the out-of-bag estimates of the
+    bagged TSF and RISE and of the forest of STC on its shapelet transform,
+    cBOSS always uses its leave-one-out estimate (default = "cv")
+    cv_time_limit_in_minutes : float, time limit for the cross-validation,
+    folds that have not started when it expires are skipped, 0 means no
+    limit (default = 0)
+    time_limit_in_minutes   : float, time limit for fit, if greater than 0
+    it is split across the components in proportion to their projected
+    train times, measured on a few trees or parameter samples, and the
+    components are fit concurrently with their own contracts and weighted
+    with their internal train estimates, train_estimate_method is ignored
+    (default = 0)
     verbose                             : int, level of output printed to
     the console (for information only) (default = 0)
     n_jobs                  : int, optional (default=1)
@@ -45,6 +76,8 @@ class HIVECOTEV1(BaseClassifier):
     Attributes
     ----------
     n_classes               : extracted from the data
+    time_limits_            : dict, time limits in minutes of the components
+    when fit with a time limit
 
     Notes
     -----
@@ -74,6 +107,9 @@ class HIVECOTEV1(BaseClassifier):
         tsf_params=None,
         rise_params=None,
         cboss_params=None,
+        train_estimate_method="cv",
+        cv_time_limit_in_minutes=0,
+        time_limit_in_minutes=0,
         verbose=0,
         n_jobs=1,
         random_state=None,
@@ -91,6 +127,9 @@ class HIVECOTEV1(BaseClassifier):
         self.tsf_params = tsf_params
         self.rise_params = rise_params
         self.cboss_params = cboss_params
+        self.train_estimate_method = train_estimate_method
+        self.cv_time_limit_in_minutes = cv_time_limit_in_minutes
+        self.time_limit_in_minutes = time_limit_in_minutes
 
         self.verbose = verbose
         self.n_jobs = n_jobs
@@ -113,43 +152,40 @@ class HIVECOTEV1(BaseClassifier):
 
     def fit(self, X, y):
         X, y = check_X_y(X, y, enforce_univariate=True)
+        if self.train_estimate_method not in ("cv", "internal"):
+            raise ValueError(
+                "train_estimate_method must be 'cv' or 'internal', but found: "
+                f"{self.train_estimate_method}"
+            )
+        y = np.asarray(y)
 
         self.n_classes = np.unique(y).shape[0]
         self.classes_ = class_distribution(np.asarray(y).reshape(-1, 1))[0][0]
 
-        cv_size = 10
-        _, counts = np.unique(y, return_counts=True)
-        min_class = np.min(counts)
-        if min_class < cv_size:
-            cv_size = min_class
-
-        self.stc = ShapeletTransformClassifier(**self.stc_params)
-        self.stc.fit(X, y)
-
-        if self.verbose > 0:
-            print("STC ", datetime.now().strftime("%H:%M:%S %d/%m/%Y"))  # noqa
-
-        train_preds = cross_val_predict(
-            ShapeletTransformClassifier(
-                **self.stc_params,
-                random_state=self.random_state,
-            ),
-            X=X,
-            y=y,
-            cv=cv_size,
+        if self.time_limit_in_minutes > 0:
+            self._fit_contracted(X, y)
+            self._is_fitted = True
+            return self
+
+        internal = self.train_estimate_method == "internal"
+        tsf_params = self.tsf_params
+        rise_params = self.rise_params
+        if internal:
+            # out-of-bag estimates require bagged forests
+            tsf_params = {"bootstrap": True, **tsf_params}
+            rise_params = {"bootstrap": True, **rise_params}
+
+        self.stc = ShapeletTransformClassifier(
+            **self.stc_params,
             n_jobs=self.n_jobs,
         )
-        self.stc_weight = accuracy_score(y, train_preds) ** 4
+        self.stc.fit(X, y)
 
         if self.verbose > 0:
-            print(  # noqa
-                "STC train estimate ",
-                datetime.now().strftime("%H:%M:%S %d/%m/%Y"),
-            )
-            print("STC weight = " + str(self.stc_weight))  # noqa
+            print("STC ", datetime.now().strftime("%H:%M:%S %d/%m/%Y"))  # noqa
 
         self.tsf = TimeSeriesForestClassifier(
-            **self.tsf_params,
+            **tsf_params,
             random_state=self.random_state,
             n_jobs=self.n_jobs,
         )
@@ -158,26 +194,8 @@ class HIVECOTEV1(BaseClassifier):
         if self.verbose > 0:
             print("TSF ", datetime.now().strftime("%H:%M:%S %d/%m/%Y"))  # noqa
 
-        train_preds = cross_val_predict(
-            TimeSeriesForestClassifier(
-                **self.tsf_params, random_state=self.random_state
-            ),
-            X=X,
-            y=y,
-            cv=cv_size,
-            n_jobs=self.n_jobs,
-        )
-        self.tsf_weight = accuracy_score(y, train_preds) ** 4
-
-        if self.verbose > 0:
-            print(  # noqa
-                "TSF train estimate ",
-                datetime.now().strftime("%H:%M:%S %d/%m/%Y"),
-            )
-            print("TSF weight = " + str(self.tsf_weight))  # noqa
-
         self.rise = RandomIntervalSpectralForest(
-            **self.rise_params,
+            **rise_params,
             random_state=self.random_state,
             n_jobs=self.n_jobs,
         )
@@ -186,23 +204,45 @@ class HIVECOTEV1(BaseClassifier):
         if self.verbose > 0:
             print("RISE ", datetime.now().strftime("%H:%M:%S %d/%m/%Y"))  # noqa
 
-        train_preds = cross_val_predict(
-            RandomIntervalSpectralForest(
-                **self.rise_params,
-                random_state=self.random_state,
-            ),
-            X=X,
-            y=y,
-            cv=cv_size,
-            n_jobs=self.n_jobs,
-        )
-        self.rise_weight = accuracy_score(y, train_preds) ** 4
+        if internal:
+            # STC estimates with the out-of-bag cases of its forest, TSF and
+            # RISE with the out-of-bag cases of their trees
+            train_preds = [
+                self.classes_[np.argmax(clf._get_train_probs(X), axis=1)]
+                for clf in (self.stc, self.tsf, self.rise)
+            ]
+            predicted = [np.ones(len(y), dtype=bool)] * 3
+        else:
+            train_preds, predicted = self._cross_val_predict(
+                [
+                    ShapeletTransformClassifier(
+                        **self.stc_params,
+                        random_state=self.random_state,
+                    ),
+                    TimeSeriesForestClassifier(
+                        **tsf_params, random_state=self.random_state
+                    ),
+                    RandomIntervalSpectralForest(
+                        **rise_params,
+                        random_state=self.random_state,
+                    ),
+                ],
+                X,
+                y,
+            )
+
+        self.stc_weight, self.tsf_weight, self.rise_weight = [
+            accuracy_score(y[mask], preds[mask]) ** 4
+            for preds, mask in zip(train_preds, predicted)
+        ]
 
         if self.verbose > 0:
             print(  # noqa
-                "RISE train estimate ",
+                "STC, TSF and RISE train estimates ",
                 datetime.now().strftime("%H:%M:%S %d/%m/%Y"),
             )
+            print("STC weight = " + str(self.stc_weight))  # noqa
+            print("TSF weight = " + str(self.tsf_weight))  # noqa
             print("RISE weight = " + str(self.rise_weight))  # noqa
 
         self.cboss = ContractableBOSS(
@@ -223,6 +263,127 @@ class HIVECOTEV1(BaseClassifier):
         self._is_fitted = True
         return self
 
+    def _fit_contracted(self, X, y):
+        """Fit the components concurrently, each with its share of the time
+        limit, and weight them with their internal train estimates."""
+        start_time = time.time()
+        n_workers = min(4, effective_n_jobs(self.n_jobs))
+        n_jobs = max(1, effective_n_jobs(self.n_jobs) // n_workers)
+
+        names = ["STC", "TSF", "RISE", "cBOSS"]
+        estimators = [
+            ShapeletTransformClassifier(**self.stc_params, n_jobs=n_jobs),
+            TimeSeriesForestClassifier(
+                **{"bootstrap": True, **self.tsf_params},
+                random_state=self.random_state,
+                n_jobs=n_jobs,
+            ),
+            RandomIntervalSpectralForest(
+                **{"bootstrap": True, **self.rise_params},
+                random_state=self.random_state,
+                n_jobs=n_jobs,
+            ),
+            ContractableBOSS(
+                **self.cboss_params, random_state=self.random_state, n_jobs=n_jobs
+            ),
+        ]
+
+        # the throughput of the components with a configured size is measured
+        # by fitting a few trees or parameter samples, the STC shapelet search
+        # is sized by its own contract
+        size_params = [None, "n_estimators", "n_estimators", "n_parameter_samples"]
+        probe_times = Parallel(n_jobs=n_workers)(
+            delayed(_time_fit)(
+                clone(estimator).set_params(**{size_param: _N_PROBE_UNITS}), X, y
+            )
+            for estimator, size_param in zip(estimators[1:], size_params[1:])
+        )
+        projected_times = np.array(
+            [estimators[0].time_contract_in_mins * 60]
+            + [
+                probe_time / _N_PROBE_UNITS * estimator.get_params()[size_param]
+                for estimator, size_param, probe_time in zip(
+                    estimators[1:], size_params[1:], probe_times
+                )
+            ]
+        )
+
+        # the slices are proportional to the projected times, and scaled so
+        # that the pool finishes within the remaining time when the
+        # components are started longest first
+        remaining = self.time_limit_in_minutes * 60 - (time.time() - start_time)
+        shares = projected_times / projected_times.sum()
+        slices = np.maximum(remaining * shares / _makespan(shares, n_workers), 1)
+        self.time_limits_ = dict(zip(names, slices / 60))
+
+        estimators[0].set_params(time_contract_in_mins=slices[0] / 60)
+        for estimator, time_limit in zip(estimators[1:], slices[1:]):
+            estimator.set_params(time_limit=time_limit / 60)
+
+        if self.verbose > 0:
+            print("Component time limits (minutes) = " + str(self.time_limits_))  # noqa
+
+        order = np.argsort(-slices, kind="stable")
+        fitted = Parallel(n_jobs=n_workers)(
+            delayed(_fit_with_train_probs)(estimators[i], X, y) for i in order
+        )
+        weights = np.zeros(len(names))
+        for i, (estimator, train_probs) in zip(order, fitted):
+            estimators[i] = estimator
+            train_preds = estimator.classes_[np.argmax(train_probs, axis=1)]
+            weights[i] = accuracy_score(y, train_preds) ** 4
+
+        self.stc, self.tsf, self.rise, self.cboss = estimators
+        self.stc_weight, self.tsf_weight, self.rise_weight, self.cboss_weight = weights
+
+        if self.verbose > 0:
+            print(  # noqa
+                "Components (estimates included) ",
+                datetime.now().strftime("%H:%M:%S %d/%m/%Y"),
+            )
+            for name, weight in zip(names, weights):
+                print(name + " weight = " + str(weight))  # noqa
+
+    def _cross_val_predict(self, estimators, X, y):
+        """Cross-validated predictions of all estimators, the folds of all
+        estimators are fit in a single pool of jobs.
+
+        Returns the predictions of each estimator and masks of the cases they
+        are available for, folds that have not started when the time limit
+        expires are skipped.
+        """
+        cv_size = 10
+        _, counts = np.unique(y, return_counts=True)
+        min_class = np.min(counts)
+        if min_class < cv_size:
+            cv_size = min_class
+
+        deadline = None
+        if self.cv_time_limit_in_minutes > 0:
+            deadline = time.time() + self.cv_time_limit_in_minutes * 60
+
+        # the folds are started in turn for every estimator, the first fold of
+        # each estimator is always evaluated
+        folds = list(StratifiedKFold(n_splits=cv_size).split(X, y))
+        jobs = [
+            (i, train, test, deadline if n > 0 else None)
+            for n, (train, test) in enumerate(folds)
+            for i in range(len(estimators))
+        ]
+        fold_preds = Parallel(n_jobs=self.n_jobs)(
+            delayed(_fit_predict_fold)(clone(estimators[i]), X, y, train, test, end)
+            for i, train, test, end in jobs
+        )
+
+        train_preds = [np.empty(len(y), dtype=y.dtype) for _ in estimators]
+        predicted = [np.zeros(len(y), dtype=bool) for _ in estimators]
+        for (i, _, test, _), preds in zip(jobs, fold_preds):
+            if preds is not None:
+                train_preds[i][test] = preds
+                predicted[i][test] = True
+
+        return train_preds, predicted
+
     def predict(self, X):
         rng = check_random_state(self.random_state)
         return np.array(
@@ -256,3 +417,30 @@ class HIVECOTEV1(BaseClassifier):
         )
 
         return dists / dists.sum(axis=1, keepdims=True)
+
+
+def _fit_predict_fold(estimator, X, y, train, test, deadline=None):
+    if deadline is not None and time.time() > deadline:
+        return None
+    estimator.fit(X.iloc[train], y[train])
+    return estimator.predict(X.iloc[test])
+
+
+def _time_fit(estimator, X, y):
+    start_time = time.time()
+    estimator.fit(X, y)
+    return time.time() - start_time
+
+
+def _fit_with_train_probs(estimator, X, y):
+    estimator.fit(X, y)
+    return estimator, estimator._get_train_probs(X)
+
+
+def _makespan(times, n_workers):
+    """Time at which n_workers finish the jobs taking times, when each job is
+    started, longest first, by the first free worker."""
+    loads = np.zeros(n_workers)
+    for job_time in sorted(times, reverse=True):
+        loads[np.argmin(loads)] += job_time
+    return loads.max()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import time
+
+import numpy as np
+import pytest
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import cross_val_predict
+
+from sktime.classification.hybrid import HIVECOTEV1
+from sktime.classification.hybrid._hivecote_v1 import _makespan
+from sktime.classification.interval_based import RandomIntervalSpectralForest
+from sktime.classification.interval_based import TimeSeriesForestClassifier
+from sktime.datasets import load_gunpoint
+
+PARAMS = dict(
+    stc_params={"time_contract_in_mins": 0.01, "n_estimators": 10},
+    tsf_params={"n_estimators": 10},
+    rise_params={"n_estimators": 10},
+    cboss_params={"n_parameter_samples": 10, "max_ensemble_size": 5},
+    random_state=0,
+)
+
+
+def _load_data():
+    X, y = load_gunpoint(split="train", return_X_y=True)
+    indices = np.random.RandomState(0).permutation(20)
+    return X.iloc[indices], y[indices]
+
+
+def test_cv_weights_match_cross_val_predict():
+    X, y = _load_data()
+    hc = HIVECOTEV1(n_jobs=2, **PARAMS)
+    hc.fit(X, y)
+
+    # the shared pool of folds gives the same predictions as cross-validating
+    # each component separately
+    for estimator, weight in [
+        (TimeSeriesForestClassifier(n_estimators=10, random_state=0), hc.tsf_weight),
+        (RandomIntervalSpectralForest(n_estimators=10, random_state=0), hc.rise_weight),
+    ]:
+        preds = cross_val_predict(estimator, X, y, cv=10)
+        assert weight == accuracy_score(y, preds) ** 4
+
+
+def test_internal_train_estimates():
+    X, y = _load_data()
+    hc = HIVECOTEV1(train_estimate_method="internal", **PARAMS)
+    hc.fit(X, y)
+
+    assert hc.tsf.bootstrap and hc.rise.bootstrap
+    for weight in [hc.stc_weight, hc.tsf_weight, hc.rise_weight, hc.cboss_weight]:
+        assert 0 <= weight <= 1
+    assert hc.predict(X).shape == y.shape
+
+
+def test_cv_time_limit():
+    X, y = _load_data()
+    hc = HIVECOTEV1(cv_time_limit_in_minutes=1e-6, **PARAMS)
+    hc.fit(X, y)
+
+    # the first fold of each component is evaluated before the limit expires
+    for weight in [hc.stc_weight, hc.tsf_weight, hc.rise_weight]:
+        assert 0 <= weight <= 1
+
+
+def test_time_limit():
+    X, y = _load_data()
+    hc = HIVECOTEV1(time_limit_in_minutes=0.1, n_jobs=2, **PARAMS)
+    start_time = time.time()
+    hc.fit(X, y)
+    elapsed = time.time() - start_time
+
+    # two workers run the components longest first within the time limit
+    limits = list(hc.time_limits_.values())
+    assert _makespan(limits, 2) == pytest.approx(0.1, abs=0.01)
+    assert elapsed < 2 * 0.1 * 60
+    assert len(hc.tsf.estimators_) >= 1 and len(hc.rise.estimators_) >= 1
+    for weight in [hc.stc_weight, hc.tsf_weight, hc.rise_weight, hc.cboss_weight]:
+        assert 0 <= weight <= 1
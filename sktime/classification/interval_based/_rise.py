@@ -7,12 +7,15 @@ __author__ = ["Tony Bagnall", "Yi-Xuan Xu"]
 __all__ = ["RandomIntervalSpectralForest", "acf", "matrix_acf", "ps"]
 
 import math
+import time
 
 import numpy as np
 from joblib import Parallel
 from joblib import delayed
+from joblib import effective_n_jobs
 from sklearn.base import clone
 from sklearn.ensemble._forest import ForestClassifier
+from sklearn.ensemble._forest import _generate_sample_indices
 from sklearn.tree import DecisionTreeClassifier
 from sklearn.utils.multiclass import class_distribution
 from sklearn.utils.validation import check_random_state
@@ -27,19 +30,64 @@ def _transform(X, interval, lag):
     """
     Compute the ACF and PS for given intervals of input data X.
     """
-    n_instances, _ = X.shape
-    acf_x = np.empty(shape=(n_instances, lag))
-    ps_len = (interval[1] - interval[0]) / 2
-    ps_x = np.empty(shape=(n_instances, int(ps_len)))
-    for j in range(n_instances):
-        acf_x[j] = acf(X[j, interval[0] : interval[1]], lag)
-        ps_x[j] = ps(X[j, interval[0] : interval[1]])
-    transformed_x = np.concatenate((acf_x, ps_x), axis=1)
+    X_slice = X[:, interval[0] : interval[1]]
+    transformed_x = np.concatenate(
+        (_acf_matrix(X_slice, lag), _ps_matrix(X_slice)), axis=1
+    )
 
     return transformed_x
 
 
-def _parallel_build_trees(X, y, tree, interval, lag, acf_min_values):
+def _acf_matrix(X, max_lag):
+    """
+    Autocorrelation function of each row of X for lags 1 to max_lag, as found
+    by `acf`. The lagged products are summed with an FFT based
+    autocorrelation of all rows at once, and the sums and sums of squares of
+    the overlapping parts with cumulative sums.
+    """
+    # the ACF does not change under a shift, centring the rows avoids the
+    # cancellation of the uncentred sums below for series far from zero
+    X = X - X.mean(axis=1, keepdims=True)
+    n_instances, length = X.shape
+    lags = np.arange(1, max_lag + 1)
+    n = length - lags
+
+    sums = np.zeros((n_instances, length + 1))
+    np.cumsum(X, axis=1, out=sums[:, 1:])
+    squared_sums = np.zeros((n_instances, length + 1))
+    np.cumsum(np.square(X), axis=1, out=squared_sums[:, 1:])
+    s1 = sums[:, n] / n
+    s2 = (sums[:, -1:] - sums[:, lags]) / n
+    v1 = squared_sums[:, n] / n - s1 * s1
+    v2 = (squared_sums[:, -1:] - squared_sums[:, lags]) / n - s2 * s2
+
+    # zero padding to a power of two of at least twice the length avoids
+    # wrapping around
+    fft_length = 1 << (2 * length - 1).bit_length()
+    fft = np.fft.rfft(X, n=fft_length, axis=1)
+    products = np.fft.irfft(fft.real * fft.real + fft.imag * fft.imag, n=fft_length)
+    covariances = products[:, lags] / n - s1 * s2
+
+    zero_v1 = v1 <= 1e-9
+    zero_v2 = v2 <= 1e-9
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y = covariances / (np.sqrt(v1) * np.sqrt(v2))
+    # both zero variance, so must be 100% correlated, one zero variance and
+    # the other not, uncorrelated
+    y[zero_v1 | zero_v2] = 0
+    y[zero_v1 & zero_v2] = 1
+    return y
+
+
+def _ps_matrix(X):
+    """
+    Power spectrum of each row of X, as found by `ps`.
+    """
+    fft = np.fft.rfft(X, axis=1)[:, : X.shape[1] // 2]
+    return fft.real * fft.real + fft.imag * fft.imag
+
+
+def _parallel_build_trees(X, y, tree, interval, lag, acf_min_values, bootstrap=False):
     """
     Private function used to fit a single tree in parallel.
     """
@@ -51,9 +99,25 @@ def _parallel_build_trees(X, y, tree, interval, lag, acf_min_values):
     temp_lag = int(temp_lag)
     transformed_x = _transform(X, interval, temp_lag)
 
-    tree.fit(transformed_x, y)
+    if not bootstrap:
+        tree.fit(transformed_x, y)
+        return temp_lag, tree, None
 
-    return temp_lag, tree
+    # the bootstrap sample is drawn with the random state of the tree, as in
+    # scikit-learn forests, and given as sample weights
+    n_instances = X.shape[0]
+    indices = _generate_sample_indices(tree.random_state, n_instances, n_instances)
+    sample_weight = np.bincount(indices, minlength=n_instances)
+    tree.fit(transformed_x, y, sample_weight=sample_weight)
+
+    # the out-of-bag cases are predicted with the features at hand, rather
+    # than transforming them again for the train estimate
+    oob = np.flatnonzero(sample_weight == 0)
+    oob_proba = np.zeros((0, len(tree.classes_)))
+    if len(oob) > 0:
+        oob_proba = tree.predict_proba(transformed_x[oob])
+
+    return temp_lag, tree, (oob, oob_proba)
 
 
 def _predict_proba_for_estimator(X, estimator, interval, lag):
@@ -113,6 +177,14 @@ class RandomIntervalSpectralForest(ForestClassifier, BaseClassifier):
         If RandomState instance, random_state is the random number generator;
         If None, the random number generator is the RandomState instance used
         by `np.random`.
+    bootstrap : bool, optional (default=False)
+        Whether each tree is built on a bootstrap sample of the training
+        cases, which gives out-of-bag train estimates.
+    time_limit : float, optional (default=0.0)
+        Time contract in minutes. If greater than 0, trees are added until it
+        expires and n_estimators is ignored.
+    contract_max_n_estimators : int, optional (default=500)
+        The maximum number of trees built under a time contract.
 
     Attributes
     ----------
@@ -154,10 +226,14 @@ class RandomIntervalSpectralForest(ForestClassifier, BaseClassifier):
         acf_min_values=4,
         n_jobs=None,
         random_state=None,
+        bootstrap=False,
+        time_limit=0.0,
+        contract_max_n_estimators=500,
     ):
         super(RandomIntervalSpectralForest, self).__init__(
             base_estimator=DecisionTreeClassifier(random_state=random_state),
             n_estimators=n_estimators,
+            bootstrap=bootstrap,
         )
         self.n_estimators = n_estimators
         self.min_interval = min_interval
@@ -165,6 +241,9 @@ class RandomIntervalSpectralForest(ForestClassifier, BaseClassifier):
         self.acf_min_values = acf_min_values
         self.n_jobs = n_jobs
         self.random_state = random_state
+        self.bootstrap = bootstrap
+        self.time_limit = time_limit
+        self.contract_max_n_estimators = contract_max_n_estimators
 
         # We need to add is-fitted state when inheriting from scikit-learn
         self._is_fitted = False
@@ -198,21 +277,16 @@ class RandomIntervalSpectralForest(ForestClassifier, BaseClassifier):
         X, y = check_X_y(X, y, enforce_univariate=True, coerce_to_numpy=True)
         X = X.squeeze(1)
 
-        n_instances, self.series_length = X.shape
+        self.n_instances, self.series_length = X.shape
 
         rng = check_random_state(self.random_state)
 
         self.estimators_ = []
         self.n_classes = np.unique(y).shape[0]
         self.classes_ = class_distribution(np.asarray(y).reshape(-1, 1))[0][0]
-        self.intervals = np.zeros((self.n_estimators, 2), dtype=int)
-        self.intervals[0][0] = 0
-        self.intervals[0][1] = self.series_length
-        for i in range(1, self.n_estimators):
-            self.intervals[i][0] = rng.randint(self.series_length - self.min_interval)
-            self.intervals[i][1] = rng.randint(
-                self.intervals[i][0] + self.min_interval, self.series_length
-            )
+        self.intervals = np.zeros((0, 2), dtype=int)
+        self.lags = np.zeros(0, dtype=int)
+        self._oob_probas = []
 
         # Check lag against global properties
         self.acf_lag_ = self.acf_lag
@@ -220,13 +294,45 @@ class RandomIntervalSpectralForest(ForestClassifier, BaseClassifier):
             self.acf_lag_ = self.series_length - self.acf_min_values
         if self.acf_lag < 0:
             self.acf_lag_ = 1
-        self.lags = np.zeros(self.n_estimators, dtype=int)
 
+        if self.time_limit <= 0:
+            self._fit_trees(X, y, self._get_intervals(self.n_estimators, rng), rng)
+        else:
+            # trees are added in batches of one per job until the time limit
+            # expires, n_estimators is ignored
+            start_time = time.time()
+            batch_size = effective_n_jobs(self.n_jobs)
+            while (
+                len(self.estimators_) == 0
+                or time.time() - start_time < self.time_limit * 60
+            ) and len(self.estimators_) < self.contract_max_n_estimators:
+                n_trees = min(
+                    batch_size, self.contract_max_n_estimators - len(self.estimators_)
+                )
+                self._fit_trees(X, y, self._get_intervals(n_trees, rng), rng)
+
+        self._is_fitted = True
+        return self
+
+    def _get_intervals(self, n_trees, rng):
+        intervals = np.zeros((n_trees, 2), dtype=int)
+        for i in range(n_trees):
+            # the first tree of the forest uses the whole series
+            if len(self.estimators_) + i == 0:
+                intervals[i] = [0, self.series_length]
+                continue
+            intervals[i][0] = rng.randint(self.series_length - self.min_interval)
+            intervals[i][1] = rng.randint(
+                intervals[i][0] + self.min_interval, self.series_length
+            )
+        return intervals
+
+    def _fit_trees(self, X, y, intervals, rng):
         trees = [
             _make_estimator(
                 self.base_estimator, random_state=rng.randint(np.iinfo(np.int32).max)
             )
-            for _ in range(self.n_estimators)
+            for _ in range(len(intervals))
         ]
 
         # Parallel loop
@@ -235,20 +341,20 @@ class RandomIntervalSpectralForest(ForestClassifier, BaseClassifier):
                 X,
                 y,
                 tree,
-                self.intervals[i],
+                intervals[i],
                 self.acf_lag_,
                 self.acf_min_values,
+                self.bootstrap,
             )
             for i, tree in enumerate(trees)
         )
 
-        # Collect lags and newly grown trees
-        for i, (lag, tree) in enumerate(worker_rets):
-            self.lags[i] = lag
-            self.estimators_.append(tree)
-
-        self._is_fitted = True
-        return self
+        # Collect lags, newly grown trees and their out-of-bag predictions
+        lags = [lag for lag, _, _ in worker_rets]
+        self.estimators_ += [tree for _, tree, _ in worker_rets]
+        self._oob_probas += [oob_proba for _, _, oob_proba in worker_rets]
+        self.intervals = np.concatenate((self.intervals, intervals))
+        self.lags = np.concatenate((self.lags, np.asarray(lags, dtype=int)))
 
     def predict(self, X):
         """
@@ -306,7 +412,7 @@ class RandomIntervalSpectralForest(ForestClassifier, BaseClassifier):
             )
 
         # Assign chunk of trees to jobs
-        n_jobs, _, _ = _partition_estimators(self.n_estimators, self.n_jobs)
+        n_jobs, _, _ = _partition_estimators(len(self.estimators_), self.n_jobs)
 
         # Parallel loop
         all_proba = Parallel(n_jobs=n_jobs)(
@@ -316,10 +422,40 @@ class RandomIntervalSpectralForest(ForestClassifier, BaseClassifier):
                 self.intervals[i],
                 self.lags[i],
             )
-            for i in range(self.n_estimators)
+            for i in range(len(self.estimators_))
         )
 
-        return np.sum(all_proba, axis=0) / self.n_estimators
+        return np.sum(all_proba, axis=0) / len(self.estimators_)
+
+    def _get_train_probs(self, X):
+        self.check_is_fitted()
+        if not self.bootstrap:
+            raise ValueError(
+                "Out-of-bag train estimates require the trees to be built with "
+                "bootstrap=True."
+            )
+        X = check_X(X, enforce_univariate=True, coerce_to_numpy=True)
+        X = X.squeeze(1)
+
+        n_instances = X.shape[0]
+        if n_instances != self.n_instances:
+            raise ValueError(
+                "The out-of-bag train estimates are found for the data passed "
+                "to fit, but the number of cases does not match."
+            )
+        sums = np.zeros((n_instances, self.n_classes))
+        divisors = np.zeros(n_instances)
+
+        # each tree predicts the cases left out of its bootstrap sample in fit
+        for oob, proba in self._oob_probas:
+            sums[oob] += proba
+            divisors[oob] += 1
+
+        results = np.ones((n_instances, self.n_classes)) * (1 / self.n_classes)
+        predicted = divisors > 0
+        results[predicted] = sums[predicted] / divisors[predicted, np.newaxis]
+
+        return results
 
 
 def acf(x, max_lag):
@@ -10,6 +10,7 @@ import numpy as np
 from joblib import Parallel
 from joblib import delayed
 from sklearn.ensemble._forest import ForestClassifier
+from sklearn.ensemble._forest import _generate_unsampled_indices
 from sklearn.tree import DecisionTreeClassifier
 
 from sktime.classification.base import BaseClassifier
@@ -49,6 +50,14 @@ class TimeSeriesForestClassifier(
          The number of jobs to run in parallel for both `fit` and `predict`.
          ``-1`` means using all processors.
      random_state    : int, seed for random, optional (default = none)
+     bootstrap       : bool, whether each tree is built on a bootstrap sample
+     of the training cases, which gives out-of-bag train estimates, optional
+     (default = False)
+     time_limit      : float, time contract in minutes, if greater than 0
+     trees are added until it expires and n_estimators is ignored, optional
+     (default = 0)
+     contract_max_n_estimators : int, maximum number of trees built under a
+     time contract, optional (default = 500)
 
      Attributes
      ----------
@@ -116,14 +125,46 @@ class TimeSeriesForestClassifier(
             )
         y_probas = Parallel(n_jobs=self.n_jobs)(
             delayed(_predict_proba)(X, self.estimators_[i], self.intervals_[i])
-            for i in range(self.n_estimators)
+            for i in range(len(self.estimators_))
         )
 
         output = np.sum(y_probas, axis=0) / (
-            np.ones(self.n_classes) * self.n_estimators
+            np.ones(self.n_classes) * len(self.estimators_)
         )
         return output
 
+    def _get_train_probs(self, X):
+        self.check_is_fitted()
+        if not self.bootstrap:
+            raise ValueError(
+                "Out-of-bag train estimates require the trees to be built with "
+                "bootstrap=True."
+            )
+        X = check_X(X, enforce_univariate=True, coerce_to_numpy=True)
+        X = X.squeeze(1)
+
+        n_instances = X.shape[0]
+        sums = np.zeros((n_instances, self.n_classes))
+        divisors = np.zeros(n_instances)
+
+        oob_probas = Parallel(n_jobs=self.n_jobs)(
+            delayed(_predict_oob_proba)(
+                X, self.estimators_[i], self.intervals_[i], self.sample_seeds_[i]
+            )
+            for i in range(len(self.estimators_))
+        )
+
+        # each tree predicts the cases left out of its bootstrap sample
+        for oob, proba in oob_probas:
+            sums[oob] += proba
+            divisors[oob] += 1
+
+        results = np.ones((n_instances, self.n_classes)) * (1 / self.n_classes)
+        predicted = divisors > 0
+        results[predicted] = sums[predicted] / divisors[predicted, np.newaxis]
+
+        return results
+
 
 def _predict_proba(X, estimator, intervals):
     """
@@ -132,3 +173,15 @@ def _predict_proba(X, estimator, intervals):
     """
     Xt = _transform(X, intervals)
     return estimator.predict_proba(Xt)
+
+
+def _predict_oob_proba(X, estimator, intervals, sample_seed):
+    """
+    Find probability estimates of the cases in X that are not in the
+    bootstrap sample of the estimator.
+    """
+    n_instances = X.shape[0]
+    oob = _generate_unsampled_indices(sample_seed, n_instances, n_instances)
+    if len(oob) == 0:
+        return oob, np.zeros((0, len(estimator.classes_)))
+    return oob, _predict_proba(X[oob], estimator, intervals)
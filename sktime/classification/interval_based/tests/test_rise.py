@@ -3,6 +3,11 @@ import numpy as np
 from sklearn.model_selection import train_test_split
 
 from sktime.classification.interval_based import RandomIntervalSpectralForest
+from sktime.classification.interval_based._rise import _acf_matrix
+from sktime.classification.interval_based._rise import _ps_matrix
+from sktime.classification.interval_based._rise import _transform
+from sktime.classification.interval_based._rise import acf
+from sktime.classification.interval_based._rise import ps
 from sktime.datasets import load_gunpoint
 
 # expected y_proba
@@ -41,3 +46,47 @@ def test_y_proba_on_gunpoint():
     estimator.fit(X_train, y_train)
     actual = estimator.predict_proba(X_test)
     np.testing.assert_array_equal(actual, expected)
+
+
+def test_oob_train_probs():
+    X, y = load_gunpoint(return_X_y=True)
+    X_train, _, y_train, _ = train_test_split(X, y, test_size=0.8, random_state=42)
+    estimator = RandomIntervalSpectralForest(
+        random_state=42, n_estimators=20, bootstrap=True
+    )
+    estimator.fit(X_train, y_train)
+    train_probs = estimator._get_train_probs(X_train)
+
+    # each case is predicted by the trees it was left out of
+    X_train = np.asarray([series.to_numpy() for series in X_train.iloc[:, 0]])
+    sums = np.zeros(train_probs.shape)
+    counts = np.zeros(len(X_train))
+    for i, tree in enumerate(estimator.estimators_):
+        rng = np.random.RandomState(tree.random_state)
+        in_bag = np.zeros(len(X_train), dtype=bool)
+        in_bag[rng.randint(0, len(X_train), len(X_train))] = 1
+        Xt = _transform(X_train[~in_bag], estimator.intervals[i], estimator.lags[i])
+        sums[~in_bag] += tree.predict_proba(Xt)
+        counts[~in_bag] += 1
+    expected = np.full(train_probs.shape, 0.5)
+    expected[counts > 0] = sums[counts > 0] / counts[counts > 0, np.newaxis]
+
+    np.testing.assert_array_almost_equal(train_probs, expected)
+
+
+def test_batched_acf_and_ps_match_per_series():
+    X = np.random.RandomState(0).normal(loc=5, scale=3, size=(10, 57))
+    # zero variance of both parts and of one of them
+    X[0] = 2.0
+    X[1, :30] = 1.0
+
+    for lag in [1, 5, 53]:
+        expected = np.array([acf(x, lag) for x in X])
+        np.testing.assert_array_almost_equal(_acf_matrix(X, lag), expected)
+
+    # far from zero, as raw sensor data, the ACF does not change under a
+    # shift, acf is given centred series as its variances are not centred
+    X_offset = np.random.RandomState(1).normal(loc=1e5, size=(10, 150))
+    expected = np.array([acf(x - x.mean(), 20) for x in X_offset])
+    np.testing.assert_allclose(_acf_matrix(X_offset, 20), expected, atol=1e-12)
+    np.testing.assert_array_almost_equal(_ps_matrix(X), [ps(x) for x in X])
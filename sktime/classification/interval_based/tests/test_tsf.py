@@ -4,6 +4,7 @@ from sklearn.model_selection import train_test_split
 
 from sktime.classification.interval_based import TimeSeriesForestClassifier
 from sktime.datasets import load_gunpoint
+from sktime.series_as_features.base.estimators.interval_based._tsf import _transform
 
 # expected y_proba
 expected = np.array(
@@ -41,3 +42,30 @@ def test_y_proba_on_gunpoint():
     estimator.fit(X_train, y_train)
     actual = estimator.predict_proba(X_test)
     np.testing.assert_array_equal(actual, expected)
+
+
+def test_oob_train_probs():
+    X, y = load_gunpoint(return_X_y=True)
+    X_train, _, y_train, _ = train_test_split(X, y, test_size=0.8, random_state=42)
+    estimator = TimeSeriesForestClassifier(
+        random_state=42, n_estimators=20, bootstrap=True
+    )
+    estimator.fit(X_train, y_train)
+    train_probs = estimator._get_train_probs(X_train)
+
+    # each case is predicted by the trees it was left out of
+    X_train = np.asarray([series.to_numpy() for series in X_train.iloc[:, 0]])
+    sums = np.zeros(train_probs.shape)
+    counts = np.zeros(len(X_train))
+    for tree, intervals, seed in zip(
+        estimator.estimators_, estimator.intervals_, estimator.sample_seeds_
+    ):
+        in_bag = np.zeros(len(X_train), dtype=bool)
+        in_bag[np.random.RandomState(seed).randint(0, len(X_train), len(X_train))] = 1
+        sums[~in_bag] += tree.predict_proba(_transform(X_train[~in_bag], intervals))
+        counts[~in_bag] += 1
+    expected = np.full(train_probs.shape, 0.5)
+    expected[counts > 0] = sums[counts > 0] / counts[counts > 0, np.newaxis]
+
+    np.testing.assert_array_almost_equal(train_probs, expected)
+    assert len(np.unique(estimator.sample_seeds_)) == len(estimator.estimators_)
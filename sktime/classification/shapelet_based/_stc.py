@@ -13,7 +13,11 @@ __all__ = ["ShapeletTransformClassifier"]
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel
+from joblib import delayed
 from sklearn.ensemble import RandomForestClassifier
+from sklearn.ensemble._forest import _generate_unsampled_indices
+from sklearn.ensemble._forest import _get_n_samples_bootstrap
 from sklearn.pipeline import Pipeline
 from sklearn.utils.multiclass import class_distribution
 from sktime.classification.base import BaseClassifier
@@ -30,6 +34,9 @@ class ShapeletTransformClassifier(BaseClassifier):
     time_contract_in_mins: int, search time for shapelets, optional (default = 300)
     n_estimators         :       500,
     random_state         :  int, seed for random, optional (default = none)
+    n_jobs               :  int, the number of jobs to run in parallel for the
+    shapelet search, the transform and the forest, -1 means using all
+    processors, optional (default = 1)
 
     Attributes
     ----------
@@ -61,10 +68,17 @@ class ShapeletTransformClassifier(BaseClassifier):
         "missing_values": False,
     }
 
-    def __init__(self, time_contract_in_mins=300, n_estimators=500, random_state=None):
+    def __init__(
+        self,
+        time_contract_in_mins=300,
+        n_estimators=500,
+        random_state=None,
+        n_jobs=1,
+    ):
         self.time_contract_in_mins = time_contract_in_mins
         self.n_estimators = n_estimators
         self.random_state = random_state
+        self.n_jobs = n_jobs
 
         #        self.shapelet_transform=ContractedShapeletTransform(
         #        time_limit_in_mins=self.time_contract_in_mins, verbose=shouty)
@@ -104,12 +118,15 @@ class ShapeletTransformClassifier(BaseClassifier):
                         time_contract_in_mins=self.time_contract_in_mins,
                         verbose=False,
                         random_state=self.random_state,
+                        n_jobs=self.n_jobs,
                     ),
                 ),
                 (
                     "rf",
                     RandomForestClassifier(
-                        n_estimators=self.n_estimators, random_state=self.random_state
+                        n_estimators=self.n_estimators,
+                        random_state=self.random_state,
+                        n_jobs=self.n_jobs,
                     ),
                 ),
             ]
@@ -157,3 +174,48 @@ class ShapeletTransformClassifier(BaseClassifier):
         self.check_is_fitted()
 
         return self.classifier_.predict_proba(X)
+
+    def _get_train_probs(self, X):
+        """Out-of-bag estimates of the random forest on the shapelet transform
+        of the train data.
+
+        The shapelets are searched on all train cases, so the estimates are
+        more optimistic than a cross-validation of the whole pipeline, but
+        do not repeat the shapelet search.
+        """
+        X = check_X(X, enforce_univariate=True)
+        self.check_is_fitted()
+
+        Xt = np.asarray(self.classifier_.named_steps["st"].transform(X))
+        forest = self.classifier_.named_steps["rf"]
+
+        n_instances = Xt.shape[0]
+        n_samples_bootstrap = _get_n_samples_bootstrap(n_instances, forest.max_samples)
+        sums = np.zeros((n_instances, self.n_classes_))
+        divisors = np.zeros(n_instances)
+
+        oob_probas = Parallel(n_jobs=self.n_jobs)(
+            delayed(_predict_oob_proba)(Xt, tree, n_samples_bootstrap)
+            for tree in forest.estimators_
+        )
+
+        # each tree predicts the cases left out of its bootstrap sample
+        for oob, proba in oob_probas:
+            sums[oob] += proba
+            divisors[oob] += 1
+
+        results = np.ones((n_instances, self.n_classes_)) * (1 / self.n_classes_)
+        predicted = divisors > 0
+        results[predicted] = sums[predicted] / divisors[predicted, np.newaxis]
+
+        return results
+
+
+def _predict_oob_proba(X, tree, n_samples_bootstrap):
+    n_instances = X.shape[0]
+    oob = _generate_unsampled_indices(
+        tree.random_state, n_instances, n_samples_bootstrap
+    )
+    if len(oob) == 0:
+        return oob, np.zeros((0, len(tree.classes_)))
+    return oob, tree.predict_proba(X[oob])
@@ -3,6 +3,8 @@
 Utilities for loading datasets
 """
 
+import hashlib
+import json
 import os
 import shutil
 import tempfile
@@ -13,6 +15,7 @@ import numpy as np
 import pandas as pd
 
 from sktime.utils.data_io import load_from_tsfile_to_dataframe
+from sktime.utils.data_io import load_from_tsfile_to_numpy
 
 __all__ = [
     "load_airline",
@@ -40,6 +43,7 @@ __author__ = [
 
 DIRNAME = "data"
 MODULE = os.path.dirname(__file__)
+CACHE_DIRNAME = ".cache"
 
 
 # time series classification data sets
@@ -114,7 +118,9 @@ def _list_downloaded_datasets(extract_path):
     return datasets
 
 
-def load_UCR_UEA_dataset(name, split=None, return_X_y=False, extract_path=None):
+def load_UCR_UEA_dataset(
+    name, split=None, return_X_y=False, extract_path=None, cache=False
+):
     """
     Load dataset from UCR UEA time series classification repository. Downloads and
     extracts dataset if not already downloaded.
@@ -132,6 +138,13 @@ def load_UCR_UEA_dataset(name, split=None, return_X_y=False, extract_path=None):
         features and the target.
     extract_path : str, optional (default=None)
         Default extract path is `sktime/datasets/data/`
+    cache : bool, optional (default=False)
+        If True, the parsed data are stored in a binary cache next to the
+        .ts files on the first load, and later loads read the cache instead
+        of parsing the files again. The cache is keyed by the hash of the .ts
+        files and memory-mapped, so that processes loading the same dataset
+        share its memory. The series of data loaded from the cache are
+        read-only.
 
     Returns
     -------
@@ -140,10 +153,10 @@ def load_UCR_UEA_dataset(name, split=None, return_X_y=False, extract_path=None):
     y: numpy array
         The class labels for each case in X
     """
-    return _load_dataset(name, split, return_X_y, extract_path)
+    return _load_dataset(name, split, return_X_y, extract_path, cache=cache)
 
 
-def _load_dataset(name, split, return_X_y, extract_path=None):
+def _load_dataset(name, split, return_X_y, extract_path=None, cache=False):
     """
     Helper function to load time series classification datasets.
     """
@@ -172,7 +185,7 @@ def _load_dataset(name, split, return_X_y, extract_path=None):
     if split in ("train", "test"):
         fname = name + "_" + split.upper() + ".ts"
         abspath = os.path.join(local_module, local_dirname, name, fname)
-        X, y = load_from_tsfile_to_dataframe(abspath)
+        X, y = _load_tsfile(abspath, cache)
 
     # if split is None, load both train and test set
     elif split is None:
@@ -181,7 +194,7 @@ def _load_dataset(name, split, return_X_y, extract_path=None):
         for split in ("train", "test"):
             fname = name + "_" + split.upper() + ".ts"
             abspath = os.path.join(local_module, local_dirname, name, fname)
-            result = load_from_tsfile_to_dataframe(abspath)
+            result = _load_tsfile(abspath, cache)
             X = pd.concat([X, pd.DataFrame(result[0])])
             y = pd.concat([y, pd.Series(result[1])])
     else:
@@ -195,6 +208,88 @@ def _load_dataset(name, split, return_X_y, extract_path=None):
         return X
 
 
+def _load_tsfile(path, cache=False):
+    """Load a .ts file with class labels, from the cache if cache is True"""
+    if not cache:
+        return load_from_tsfile_to_dataframe(path)
+
+    cache_dir = os.path.join(os.path.dirname(path), CACHE_DIRNAME)
+    name = os.path.splitext(os.path.basename(path))[0]
+    prefix = os.path.join(cache_dir, name + "_" + _hash_file(path))
+
+    # the metadata are written last, so that their presence marks a
+    # complete cache entry
+    if not os.path.exists(prefix + ".json"):
+        try:
+            (values, offsets), y = load_from_tsfile_to_numpy(path, return_ragged=True)
+        except NotImplementedError:
+            # files with timestamps are not cached
+            return load_from_tsfile_to_dataframe(path)
+        try:
+            _write_cache(prefix, values, offsets, y)
+        except OSError:
+            # the cache is skipped if its directory is not writable
+            return _from_ragged_to_nested(values, offsets), y
+
+    values = np.load(prefix + "_values.npy", mmap_mode="r")
+    offsets = np.load(prefix + "_offsets.npy")
+    y = np.load(prefix + "_y.npy")
+    return _from_ragged_to_nested(values, offsets), y
+
+
+def _hash_file(path, block_size=2 ** 20):
+    """Hash of the contents of a file"""
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(block_size), b""):
+            file_hash.update(block)
+    return file_hash.hexdigest()[:16]
+
+
+def _write_cache(prefix, values, offsets, y):
+    """Write the parsed data of a .ts file to the cache"""
+    os.makedirs(os.path.dirname(prefix), exist_ok=True)
+    arrays = {"_values.npy": values, "_offsets.npy": offsets, "_y.npy": y}
+    for suffix, array in arrays.items():
+        _atomic_write(prefix + suffix, lambda file: np.save(file, array))
+
+    metadata = {"n_instances": offsets.shape[0], "n_dimensions": offsets.shape[1] - 1}
+    _atomic_write(
+        prefix + ".json", lambda file: file.write(json.dumps(metadata).encode())
+    )
+
+
+def _atomic_write(path, write):
+    """Write a file via a temporary file, so that other processes never see
+    partially written files"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as file:
+            write(file)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _from_ragged_to_nested(values, offsets):
+    """Convert ragged series into a nested DataFrame, as returned by
+    load_from_tsfile_to_dataframe"""
+    n_instances, n_dimensions = offsets.shape[0], offsets.shape[1] - 1
+    X = pd.DataFrame(dtype=np.float32)
+    for j in range(n_dimensions):
+        column = np.empty(n_instances, dtype=object)
+        for i in range(n_instances):
+            start, end = offsets[i, j], offsets[i, j + 1]
+            column[i] = (
+                pd.Series(values[start:end])
+                if end > start
+                else pd.Series(dtype="object")
+            )
+        X["dim_" + str(j)] = column
+    return X
+
+
 def load_gunpoint(split=None, return_X_y=False):
     """
     Loads the GunPoint time series classification problem and returns X and y
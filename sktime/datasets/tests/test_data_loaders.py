@@ -6,6 +6,7 @@ __author__ = ["Sebastiaan Koel", "Emilia Rose"]
 __all__ = []
 
 import os
+import shutil
 
 import numpy as np
 import pandas as pd
@@ -14,6 +15,7 @@ import pytest
 from sktime.datasets import load_UCR_UEA_dataset
 from sktime.datasets import load_arrow_head
 from sktime.datasets import load_uschange
+from sktime.datasets.base import MODULE
 from sktime.utils._testing.estimator_checks import _assert_array_almost_equal
 
 _CHECKS = {
@@ -106,3 +108,30 @@ def test_load_UCR_UEA_dataset_download(tmpdir):
     expected_X, expected_y = load_arrow_head(return_X_y=True)
     _assert_array_almost_equal(actual_X, expected_X, decimal=4)
     np.testing.assert_array_equal(expected_y, actual_y)
+
+
+@pytest.mark.parametrize("name", ["BasicMotions", "PLAID"])
+def test_load_UCR_UEA_dataset_cache(tmpdir, monkeypatch, name):
+    extract_path = str(tmpdir)
+    shutil.copytree(os.path.join(MODULE, "data", name), os.path.join(tmpdir, name))
+    expected_X, expected_y = load_UCR_UEA_dataset(
+        name, return_X_y=True, extract_path=extract_path
+    )
+
+    # the first load writes the cache, the second one reads it
+    for _ in range(2):
+        actual_X, actual_y = load_UCR_UEA_dataset(
+            name, return_X_y=True, extract_path=extract_path, cache=True
+        )
+        pd.testing.assert_series_equal(actual_y, expected_y)
+        assert actual_X.shape == expected_X.shape
+        for actual, expected in zip(actual_X.to_numpy(), expected_X.to_numpy()):
+            for actual_series, expected_series in zip(actual, expected):
+                pd.testing.assert_series_equal(actual_series, expected_series)
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("the .ts file is parsed again")
+
+        monkeypatch.setattr("sktime.datasets.base.load_from_tsfile_to_numpy", _fail)
+
+    assert len(os.listdir(os.path.join(tmpdir, name, ".cache"))) == 8
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""Cache of derived representations of time series for distance computations.
+
+Elastic distance based classifiers repeatedly need the same derived
+representations of the same series: derivatives for DDTW and WDDTW,
+LB_Keogh envelopes for nearest neighbour search, z-normalised copies, etc.
+They are needed again for every parameter value, cross-validation fold and
+ensemble member. The cache stores these representations per series, keyed by a
+fingerprint of the series values and by the representation and its parameters,
+so that each series is only transformed once no matter which panel it is part
+of.
+"""
+
+__author__ = ["Jason Lines", "TonyBagnall"]
+__all__ = ["SeriesCache", "get_cache"]
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _envelopes(X, band):
+    n_instances, n_columns, n_timepoints = X.shape
+    envelopes = np.empty((n_instances, 2, n_columns, n_timepoints))
+    for i in range(n_instances):
+        for k in range(n_columns):
+            if band >= n_timepoints - 1:
+                # the envelope of an unconstrained warping is flat
+                envelopes[i, 0, k] = X[i, k].max()
+                envelopes[i, 1, k] = X[i, k].min()
+                continue
+            for t in range(n_timepoints):
+                start = max(0, t - band)
+                end = min(n_timepoints, t + band + 1)
+                envelopes[i, 0, k, t] = X[i, k, start:end].max()
+                envelopes[i, 1, k, t] = X[i, k, start:end].min()
+    return envelopes
+
+
+def _derivative(X):
+    return np.diff(X, axis=2)
+
+
+def _slope_derivative(X):
+    # same as DerivativeSlopeTransformer, the first and last values are
+    # repeated to keep the series length
+    der = ((X[:, :, 1:-1] - X[:, :, :-2]) + ((X[:, :, 2:] - X[:, :, :-2]) / 2)) / 2
+    return np.concatenate([der[:, :, :1], der, der[:, :, -1:]], axis=2)
+
+
+def _z_normalise(X):
+    std = X.std(axis=2, keepdims=True)
+    std[std == 0] = 1
+    return (X - X.mean(axis=2, keepdims=True)) / std
+
+
+class SeriesCache:
+    """Size-bounded LRU cache of derived representations of time series.
+
+    Parameters
+    ----------
+    max_bytes : int, optional (default=256MB)
+        Maximum total size of the cached representations. The least recently
+        used representations are evicted when it is exceeded.
+
+    Attributes
+    ----------
+    n_bytes : int
+        Total size of the cached representations.
+    hits : int
+        Number of series whose representation was found in the cache.
+    misses : int
+        Number of series whose representation had to be computed.
+    """
+
+    def __init__(self, max_bytes=256 * 2 ** 20):
+        self.max_bytes = max_bytes
+        self.n_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def clear(self):
+        """Remove all cached representations."""
+        with self._lock:
+            self._cache.clear()
+            self.n_bytes = 0
+
+    def get(self, X, transform, key):
+        """Get the representation ``transform(X)`` of a panel.
+
+        Only the series of X that are not in the cache are transformed.
+
+        Parameters
+        ----------
+        X : np.ndarray of shape [n_instances, n_columns, n_timepoints]
+            Panel of time series.
+        transform : callable
+            Function mapping a 3D panel to an array whose first axis indexes
+            the instances. It must transform each series independently of the
+            others.
+        key : hashable
+            Identifies the representation and its parameters.
+
+        Returns
+        -------
+        Xt : np.ndarray
+            The representation of X, with one row per instance of X.
+        """
+        X = np.ascontiguousarray(X)
+        fingerprints = [
+            (key, x.shape, x.dtype.str, hashlib.blake2b(x, digest_size=16).digest())
+            for x in X
+        ]
+
+        rows = [None] * len(X)
+        with self._lock:
+            for i, fingerprint in enumerate(fingerprints):
+                if fingerprint in self._cache:
+                    self._cache.move_to_end(fingerprint)
+                    rows[i] = self._cache[fingerprint]
+            missing = [i for i, row in enumerate(rows) if row is None]
+            self.hits += len(X) - len(missing)
+            self.misses += len(missing)
+
+        if missing:
+            Xt = transform(X[missing])
+            with self._lock:
+                for i, row in zip(missing, Xt):
+                    rows[i] = row
+                    self._put(fingerprints[i], row)
+        if len(rows) == 0:
+            return transform(X)
+        return np.stack(rows)
+
+    def _put(self, fingerprint, row):
+        row = np.array(row)  # own the memory rather than a view on a batch
+        if fingerprint in self._cache:
+            self.n_bytes -= self._cache.pop(fingerprint).nbytes
+        self._cache[fingerprint] = row
+        self.n_bytes += row.nbytes
+        while self.n_bytes > self.max_bytes and self._cache:
+            _, evicted = self._cache.popitem(last=False)
+            self.n_bytes -= evicted.nbytes
+
+    def derivative(self, X):
+        """First order differences of each series, as used by DDTW."""
+        return self.get(X, _derivative, ("derivative",))
+
+    def slope_derivative(self, X):
+        """Slope-based derivative of each series, see
+        DerivativeSlopeTransformer."""
+        return self.get(X, _slope_derivative, ("slope_derivative",))
+
+    def z_normalise(self, X):
+        """Z-normalised copy of each series."""
+        return self.get(X, _z_normalise, ("z_normalise",))
+
+    def envelopes(self, X, window):
+        """Upper and lower LB_Keogh envelopes of each series.
+
+        Parameters
+        ----------
+        X : np.ndarray of shape [n_instances, n_columns, n_timepoints]
+        window : int
+            Half width of the envelope, in time points.
+
+        Returns
+        -------
+        upper, lower : np.ndarray of shape [n_instances, n_columns, n_timepoints]
+        """
+        window = int(window)
+        envelopes = self.get(
+            X.astype(np.float64, copy=False),
+            lambda X: _envelopes(X, window),
+            ("envelopes", window),
+        )
+        return envelopes[:, 0], envelopes[:, 1]
+
+
+_CACHE = SeriesCache()
+
+
+def get_cache():
+    """Get the cache shared by the distance based estimators.
+
+    Returns
+    -------
+    cache : SeriesCache
+    """
+    return _CACHE
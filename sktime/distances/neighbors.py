@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""Nearest neighbour search with lower bounding and early abandoning.
+
+Rather than computing the distance from a query to every candidate series, the
+candidates are visited in order of a cheap lower bound on their DTW distance
+(the maximum of LB_Kim and LB_Keogh). The search stops as soon as the lower
+bound of the next candidate exceeds the distance to the current k-th nearest
+neighbour, and each full distance computation is abandoned as soon as it is
+known to exceed that distance.
+
+Keogh, E. and Ratanamahatana, C. "Exact indexing of dynamic time warping."
+Knowledge and Information Systems 7.3 (2005): 358-386.
+
+Rakthanmanon, T. et al. "Searching and mining trillions of time series
+subsequences under dynamic time warping." Proceedings of the 18th ACM SIGKDD
+(2012): 262-270.
+"""
+
+__author__ = ["Jason Lines", "TonyBagnall"]
+__all__ = ["nearest_neighbors", "LOWER_BOUNDED_DISTANCES"]
+
+import numpy as np
+from numba import njit
+from numba import prange
+
+from sktime.distances.cache import get_cache
+from sktime.distances.pairwise import _call_with_n_jobs
+from sktime.distances.pairwise import _check_panels
+from sktime.distances.pairwise import _derivative
+from sktime.distances.pairwise import _early_abandon_dtw_distance
+from sktime.distances.pairwise import _early_abandon_wdtw_distance
+from sktime.distances.pairwise import _get_params
+from sktime.distances.pairwise import _wdtw_weights
+
+
+@njit(cache=True)
+def _lb_kim(x, y):
+    # the first and last points of both series are always aligned
+    n_columns, n_timepoints = x.shape
+    lb = 0.0
+    for k in range(n_columns):
+        diff = x[k, 0] - y[k, 0]
+        lb += diff * diff
+        if n_timepoints > 1:
+            diff = x[k, n_timepoints - 1] - y[k, n_timepoints - 1]
+            lb += diff * diff
+    return lb
+
+
+@njit(cache=True)
+def _lb_keogh(x, upper, lower):
+    n_columns, n_timepoints = x.shape
+    lb = 0.0
+    for k in range(n_columns):
+        for t in range(n_timepoints):
+            if x[k, t] > upper[k, t]:
+                diff = x[k, t] - upper[k, t]
+                lb += diff * diff
+            elif x[k, t] < lower[k, t]:
+                diff = x[k, t] - lower[k, t]
+                lb += diff * diff
+    return lb
+
+
+def _make_nearest_neighbors(distance):
+    """Build a parallel nearest neighbour search for ``distance``."""
+
+    @njit(parallel=True)
+    def _nearest_neighbors(
+        X, Y, upper, lower, kim_weight, keogh_weight, n_neighbors, params
+    ):
+        n_x = X.shape[0]
+        n_y = Y.shape[0]
+        distances = np.full((n_x, n_neighbors), np.inf)
+        indices = np.zeros((n_x, n_neighbors), dtype=np.int64)
+        for i in prange(n_x):
+            lower_bounds = np.empty(n_y)
+            for j in range(n_y):
+                lower_bounds[j] = max(
+                    kim_weight * _lb_kim(X[i], Y[j]),
+                    keogh_weight * _lb_keogh(X[i], upper[j], lower[j]),
+                )
+            n_found = 0
+            for j in np.argsort(lower_bounds):
+                cutoff = distances[i, n_neighbors - 1]
+                if lower_bounds[j] > cutoff:
+                    break
+                d = distance(X[i], Y[j], params, cutoff)
+                # keep the neighbours sorted by distance, ties by index
+                if n_found < n_neighbors:
+                    n_found += 1
+                elif d > cutoff or (d == cutoff and j > indices[i, n_neighbors - 1]):
+                    continue
+                p = n_found - 1
+                while p > 0 and (
+                    d < distances[i, p - 1]
+                    or (d == distances[i, p - 1] and j < indices[i, p - 1])
+                ):
+                    distances[i, p] = distances[i, p - 1]
+                    indices[i, p] = indices[i, p - 1]
+                    p -= 1
+                distances[i, p] = d
+                indices[i, p] = j
+        return distances, indices
+
+    return _nearest_neighbors
+
+
+# name: (search kernel, ((parameter name, default value), ...), preprocessing)
+LOWER_BOUNDED_DISTANCES = {
+    "dtw": (
+        _make_nearest_neighbors(_early_abandon_dtw_distance),
+        (("w", -1.0),),
+        None,
+    ),
+    "ddtw": (
+        _make_nearest_neighbors(_early_abandon_dtw_distance),
+        (("w", -1.0),),
+        _derivative,
+    ),
+    "wdtw": (
+        _make_nearest_neighbors(_early_abandon_wdtw_distance),
+        (("g", 0.05),),
+        None,
+    ),
+    "wddtw": (
+        _make_nearest_neighbors(_early_abandon_wdtw_distance),
+        (("g", 0.0),),
+        _derivative,
+    ),
+}
+
+
+def _lower_bound_weights(metric, params, n_timepoints):
+    """Envelope width and scaling of LB_Kim and LB_Keogh for a distance."""
+    if metric in ("dtw", "ddtw"):
+        window = params[0]
+        band = n_timepoints if window < 0 else int(window * n_timepoints)
+        return band, 1.0, 1.0
+    # every cell of the WDTW cost matrix is scaled by a weight no smaller
+    # than the smallest weight, the first and last cells by the first weight
+    weights = _wdtw_weights(n_timepoints, n_timepoints, params[0])
+    return n_timepoints, weights[0], weights.min()
+
+
+def nearest_neighbors(X, Y, n_neighbors=1, metric="dtw", n_jobs=None, **metric_params):
+    """Find the nearest neighbours in Y of each instance in X.
+
+    Gives the same neighbours as sorting the rows of
+    ``pairwise_distance(X, Y, metric)``, with ties broken by index, but
+    prunes most of the distance computations.
+
+    Parameters
+    ----------
+    X : np.ndarray of shape [n_instances_X, n_columns, n_timepoints]
+        Query panel.
+    Y : np.ndarray of shape [n_instances_Y, n_columns, n_timepoints]
+        Panel in which to search for neighbours. Must have the same series
+        length as X.
+    n_neighbors : int, optional (default=1)
+        Number of neighbours to find.
+    metric : str, optional (default="dtw")
+        One of the keys of LOWER_BOUNDED_DISTANCES.
+    n_jobs : int or None, optional (default=None)
+        The number of threads used to search for the neighbours of the
+        instances of X. None means 1, -1 means using all processors.
+    **metric_params
+        Parameters of the distance measure, e.g. ``w`` for dtw.
+
+    Returns
+    -------
+    distances : np.ndarray of shape [n_instances_X, n_neighbors]
+        Distances to the neighbours, in increasing order.
+    indices : np.ndarray of shape [n_instances_X, n_neighbors]
+        Indices of the neighbours in Y.
+    """
+    X, Y = _check_panels(X, Y)
+    if X.shape[2] != Y.shape[2]:
+        raise ValueError(
+            "X and Y must have the same series length, but found %d and %d"
+            % (X.shape[2], Y.shape[2])
+        )
+    if not 0 < n_neighbors <= Y.shape[0]:
+        raise ValueError(
+            "Expected 0 < n_neighbors <= n_instances of Y, but n_neighbors = %d "
+            "and n_instances = %d" % (n_neighbors, Y.shape[0])
+        )
+    if metric not in LOWER_BOUNDED_DISTANCES:
+        raise ValueError(
+            "Unrecognised distance measure: %s. Allowed values are names from %s"
+            % (metric, list(LOWER_BOUNDED_DISTANCES))
+        )
+    search, param_spec, preprocess = LOWER_BOUNDED_DISTANCES[metric]
+    params = _get_params(metric, param_spec, metric_params)
+    if preprocess is not None:
+        X = preprocess(X)
+        Y = preprocess(Y)
+
+    band, kim_weight, keogh_weight = _lower_bound_weights(metric, params, X.shape[2])
+    upper, lower = get_cache().envelopes(Y, band)
+    return _call_with_n_jobs(
+        search,
+        n_jobs,
+        X,
+        Y,
+        upper,
+        lower,
+        kim_weight,
+        keogh_weight,
+        n_neighbors,
+        params,
+    )
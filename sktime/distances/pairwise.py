@@ -0,0 +1,447 @@
+# -*- coding: utf-8 -*-
+"""Batched pairwise distance engine for time series panels.
+
+The functions in ``sktime.distances.elastic_cython`` compute the distance
+between a single pair of series, so building a distance matrix requires one
+Python-level call (with its own validation and allocation) per pair. This
+module computes the whole matrix between two panels at once: the input is
+validated and converted once, preprocessing (e.g. derivatives for DDTW) is
+done once per series rather than once per pair and is cached across calls,
+and all pairs are
+evaluated in compiled kernels that run in parallel over the rows of the
+distance matrix.
+
+The kernels reproduce the results of their ``elastic_cython`` counterparts
+for equal length series.
+"""
+
+__author__ = ["Jason Lines", "TonyBagnall"]
+__all__ = ["pairwise_distance", "PAIRWISE_DISTANCES"]
+
+import numba
+import numpy as np
+from joblib import effective_n_jobs
+from numba import njit
+from numba import prange
+
+from sktime.distances.cache import get_cache
+
+
+@njit(cache=True)
+def _euclidean_distance(x, y, params):
+    n_columns, n_timepoints = x.shape
+    distance = 0.0
+    for k in range(n_columns):
+        for i in range(n_timepoints):
+            diff = x[k, i] - y[k, i]
+            distance += diff * diff
+    return distance
+
+
+@njit(cache=True)
+def _squared_distance(x, y, i, j):
+    distance = 0.0
+    for k in range(x.shape[0]):
+        diff = x[k, i] - y[k, j]
+        distance += diff * diff
+    return distance
+
+
+@njit(cache=True)
+def _dtw_distance(x, y, params):
+    # params: (window,)
+    return _early_abandon_dtw_distance(x, y, params, np.inf)
+
+
+@njit(cache=True)
+def _early_abandon_dtw_distance(x, y, params, cutoff):
+    # returns infinity as soon as the distance is known to exceed the cutoff
+    if x.shape[1] > y.shape[1]:
+        x, y = y, x
+    lx = x.shape[1]
+    ly = y.shape[1]
+    window = params[0]
+    if window < 0:
+        band = max(lx, ly)
+    else:
+        band = int(window * max(lx, ly))
+
+    # only two rows of the cost matrix are kept, cells outside of the
+    # warping window read as infinity
+    prev = np.full(ly + 1, np.inf)
+    curr = np.full(ly + 1, np.inf)
+    prev[0] = 0.0
+    for i in range(1, lx + 1):
+        jstart = max(1, i - band)
+        jstop = min(ly + 1, i + band + 1)
+        curr[jstart - 1 : min(ly + 1, jstop + 1)] = np.inf
+        row_min = np.inf
+        for j in range(jstart, jstop):
+            curr[j] = _squared_distance(x, y, i - 1, j - 1) + min(
+                prev[j], curr[j - 1], prev[j - 1]
+            )
+            row_min = min(row_min, curr[j])
+        # every warping path passes through this row
+        if row_min > cutoff:
+            return np.inf
+        prev, curr = curr, prev
+    return prev[ly]
+
+
+@njit(cache=True)
+def _wdtw_weights(lx, ly, g):
+    weights = np.empty(ly)
+    for i in range(ly):
+        weights[i] = 1 / (1 + np.exp(-g * (i - lx / 2)))
+    return weights
+
+
+@njit(cache=True)
+def _wdtw_distance(x, y, params):
+    # params: (g,)
+    return _early_abandon_wdtw_distance(x, y, params, np.inf)
+
+
+@njit(cache=True)
+def _early_abandon_wdtw_distance(x, y, params, cutoff):
+    if x.shape[1] > y.shape[1]:
+        x, y = y, x
+    lx = x.shape[1]
+    ly = y.shape[1]
+    weights = _wdtw_weights(lx, ly, params[0])
+
+    prev = np.full(ly + 1, np.inf)
+    curr = np.full(ly + 1, np.inf)
+    prev[0] = 0.0
+    for i in range(1, lx + 1):
+        curr[0] = np.inf
+        row_min = np.inf
+        for j in range(1, ly + 1):
+            cost = weights[abs(i - j)] * _squared_distance(x, y, i - 1, j - 1)
+            curr[j] = cost + min(prev[j], curr[j - 1], prev[j - 1])
+            row_min = min(row_min, curr[j])
+        if row_min > cutoff:
+            return np.inf
+        prev, curr = curr, prev
+    return prev[ly]
+
+
+@njit(cache=True)
+def _lcss_distance(x, y, params):
+    # params: (delta, epsilon, dim_to_use)
+    if x.shape[1] > y.shape[1]:
+        x, y = y, x
+    delta = int(params[0])
+    epsilon = params[1]
+    dim = int(params[2])
+    m = x.shape[1]
+    n = y.shape[1]
+
+    lcss = np.zeros((m + 1, n + 1), dtype=np.int32)
+    for i in range(m):
+        for j in range(max(0, i - delta), min(n, i + delta + 1)):
+            if y[dim, j] + epsilon >= x[dim, i] >= y[dim, j] - epsilon:
+                lcss[i + 1, j + 1] = lcss[i, j] + 1
+            elif lcss[i, j + 1] > lcss[i + 1, j]:
+                lcss[i + 1, j + 1] = lcss[i, j + 1]
+            else:
+                lcss[i + 1, j + 1] = lcss[i + 1, j]
+
+    max_val = -1
+    for j in range(1, n + 1):
+        if lcss[m, j] > max_val:
+            max_val = lcss[m, j]
+    return 1 - (max_val / m)
+
+
+@njit(cache=True)
+def _msm_cost(new_point, x, y, c):
+    if (x <= new_point <= y) or (y <= new_point <= x):
+        return c
+    return c + min(abs(new_point - x), abs(new_point - y))
+
+
+@njit(cache=True)
+def _msm_distance(x, y, params):
+    # params: (c, dim_to_use)
+    if x.shape[1] > y.shape[1]:
+        x, y = y, x
+    c = params[0]
+    dim = int(params[1])
+    first = x[dim]
+    second = y[dim]
+    m = first.shape[0]
+    n = second.shape[0]
+
+    cost = np.zeros((m, n))
+    cost[0, 0] = abs(first[0] - second[0])
+    for i in range(1, m):
+        cost[i, 0] = cost[i - 1, 0] + _msm_cost(first[i], first[i - 1], second[0], c)
+    for j in range(1, n):
+        cost[0, j] = cost[0, j - 1] + _msm_cost(second[j], first[0], second[j - 1], c)
+
+    for i in range(1, m):
+        for j in range(1, n):
+            d1 = cost[i - 1, j - 1] + abs(first[i] - second[j])
+            d2 = cost[i - 1, j] + _msm_cost(first[i], first[i - 1], second[j], c)
+            d3 = cost[i, j - 1] + _msm_cost(second[j], first[i], second[j - 1], c)
+            cost[i, j] = min(d1, d2, d3)
+    return cost[m - 1, n - 1]
+
+
+@njit(cache=True)
+def _erp_distance(x, y, params):
+    # params: (band_size, g, dim_to_use)
+    if x.shape[1] > y.shape[1]:
+        x, y = y, x
+    g = params[1]
+    dim = int(params[2])
+    first = x[dim]
+    second = y[dim]
+    m = first.shape[0]
+    band = int(np.ceil(params[0] * m))
+
+    curr = np.zeros(m)
+    prev = np.zeros(m)
+    for i in range(m):
+        prev, curr = curr, prev
+        left = max(0, i - (band + 1))
+        right = min(m - 1, i + band + 1)
+        for j in range(left, right + 1):
+            if abs(i - j) <= band:
+                d1 = (first[i] - g) * (first[i] - g)
+                d2 = (second[j] - g) * (second[j] - g)
+                d12 = (first[i] - second[j]) * (first[i] - second[j])
+                cost = 0.0
+                if i + j != 0:
+                    if i == 0 or (
+                        j != 0
+                        and prev[j - 1] + d12 > curr[j - 1] + d2
+                        and curr[j - 1] + d2 < prev[j] + d1
+                    ):
+                        # deletion
+                        cost = curr[j - 1] + d2
+                    elif j == 0 or (
+                        i != 0
+                        and prev[j - 1] + d12 > prev[j] + d1
+                        and prev[j] + d1 < curr[j - 1] + d2
+                    ):
+                        # insertion
+                        cost = prev[j] + d1
+                    else:
+                        # match
+                        cost = prev[j - 1] + d12
+                curr[j] = cost
+            else:
+                curr[j] = np.inf
+    return np.sqrt(curr[m - 1])
+
+
+@njit(cache=True)
+def _twe_distance(x, y, params):
+    # params: (penalty, stiffness)
+    penalty = params[0]
+    stiffness = params[1]
+    n_columns = x.shape[0]
+    r = x.shape[1]
+    c = y.shape[1]
+
+    # local costs of deleting a point, the time stamps are the indices + 1
+    di1 = np.zeros(r + 1)
+    dj1 = np.zeros(c + 1)
+    for j in range(1, c + 1):
+        for k in range(n_columns):
+            if j > 1:
+                diff = y[k, j - 2] - y[k, j - 1]
+            else:
+                diff = y[k, j - 1]
+            dj1[j] += diff * diff
+    for i in range(1, r + 1):
+        for k in range(n_columns):
+            if i > 1:
+                diff = x[k, i - 2] - x[k, i - 1]
+            else:
+                diff = x[k, i - 1]
+            di1[i] += diff * diff
+
+    D = np.zeros((r + 1, c + 1))
+    for i in range(1, r + 1):
+        for j in range(1, c + 1):
+            dist = 0.0
+            for k in range(n_columns):
+                diff = x[k, i - 1] - y[k, j - 1]
+                dist += diff * diff
+                if i > 1 and j > 1:
+                    diff = x[k, i - 2] - y[k, j - 2]
+                    dist += diff * diff
+            D[i, j] = dist
+
+    for i in range(1, r + 1):
+        D[i, 0] = D[i - 1, 0] + di1[i]
+    for j in range(1, c + 1):
+        D[0, j] = D[0, j - 1] + dj1[j]
+
+    for i in range(1, r + 1):
+        for j in range(1, c + 1):
+            htrans = abs(i - j)
+            if i > 1 and j > 1:
+                htrans += abs(i - j)
+            dmin = D[i - 1, j - 1] + stiffness * htrans + D[i, j]
+            htrans = 1.0 if i > 1 else i
+            dist = di1[i] + D[i - 1, j] + penalty + stiffness * htrans
+            if dmin > dist:
+                dmin = dist
+            htrans = 1.0 if j > 1 else j
+            dist = dj1[j] + D[i, j - 1] + penalty + stiffness * htrans
+            if dmin > dist:
+                dmin = dist
+            D[i, j] = dmin
+    return D[r, c]
+
+
+def _make_pairwise(distance):
+    """Build a parallel kernel evaluating ``distance`` on all pairs."""
+
+    @njit(parallel=True)
+    def _pairwise(X, Y, params):
+        n_x = X.shape[0]
+        n_y = Y.shape[0]
+        distances = np.empty((n_x, n_y))
+        for i in prange(n_x):
+            for j in range(n_y):
+                distances[i, j] = distance(X[i], Y[j], params)
+        return distances
+
+    return _pairwise
+
+
+def _derivative(X):
+    return get_cache().derivative(X)
+
+
+# name: (pairwise kernel, ((parameter name, default value), ...), preprocessing)
+# the parameter names and default values are those of elastic_cython
+PAIRWISE_DISTANCES = {
+    "euclidean": (_make_pairwise(_euclidean_distance), (), None),
+    "dtw": (_make_pairwise(_dtw_distance), (("w", -1.0),), None),
+    "ddtw": (_make_pairwise(_dtw_distance), (("w", -1.0),), _derivative),
+    "wdtw": (_make_pairwise(_wdtw_distance), (("g", 0.05),), None),
+    "wddtw": (_make_pairwise(_wdtw_distance), (("g", 0.0),), _derivative),
+    "lcss": (
+        _make_pairwise(_lcss_distance),
+        (("delta", 3), ("epsilon", 0.05), ("dim_to_use", 0)),
+        None,
+    ),
+    "msm": (_make_pairwise(_msm_distance), (("c", 1.0), ("dim_to_use", 0)), None),
+    "erp": (
+        _make_pairwise(_erp_distance),
+        (("band_size", 5.0), ("g", 0.0), ("dim_to_use", 0)),
+        None,
+    ),
+    "twe": (
+        _make_pairwise(_twe_distance),
+        (("penalty", 1.0), ("stiffness", 1.0)),
+        None,
+    ),
+}
+
+
+def _check_panel(X):
+    X = np.asarray(X, dtype=np.float64)
+    if X.ndim == 2:
+        X = X.reshape(X.shape[0], 1, X.shape[1])
+    if X.ndim != 3:
+        raise ValueError(
+            "X must be a 3D numpy array of shape [n_instances, n_columns, "
+            "n_timepoints], but found %d dimensions" % X.ndim
+        )
+    return np.ascontiguousarray(X)
+
+
+def _check_panels(X, Y=None):
+    X = _check_panel(X)
+    Y = X if Y is None else _check_panel(Y)
+    if X.shape[1] != Y.shape[1]:
+        raise ValueError(
+            "X and Y must have the same number of columns, but found %d and %d"
+            % (X.shape[1], Y.shape[1])
+        )
+    return X, Y
+
+
+def _get_params(metric, param_spec, metric_params):
+    unknown = set(metric_params) - {name for name, _ in param_spec}
+    if unknown:
+        raise ValueError(
+            "Unrecognised parameters %s for distance measure: %s. Allowed "
+            "parameters are %s" % (sorted(unknown), metric, [n for n, _ in param_spec])
+        )
+    return np.array(
+        [float(metric_params.get(name, default)) for name, default in param_spec],
+        dtype=np.float64,
+    )
+
+
+def _call_with_n_jobs(kernel, n_jobs, *args):
+    """Call a parallel numba kernel with n_jobs threads."""
+    n_threads = min(effective_n_jobs(n_jobs), numba.config.NUMBA_NUM_THREADS)
+    previous_n_threads = numba.get_num_threads()
+    numba.set_num_threads(n_threads)
+    try:
+        return kernel(*args)
+    finally:
+        numba.set_num_threads(previous_n_threads)
+
+
+def pairwise_distance(X, Y=None, metric="dtw", n_jobs=None, **metric_params):
+    """Compute the distance matrix between two panels of time series.
+
+    Parameters
+    ----------
+    X : np.ndarray of shape [n_instances_X, n_columns, n_timepoints]
+        First panel. 2D arrays are interpreted as univariate panels of shape
+        [n_instances_X, n_timepoints].
+    Y : np.ndarray of shape [n_instances_Y, n_columns, n_timepoints] or None
+        Second panel. If None, the distances between the instances of X are
+        computed.
+    metric : str or callable, optional (default="dtw")
+        One of the keys of PAIRWISE_DISTANCES, or a callable taking two series
+        of shape [n_timepoints, n_columns] (the layout used by the functions in
+        sktime.distances.elastic_cython) and returning a float. Callables are
+        evaluated pair by pair in Python.
+    n_jobs : int or None, optional (default=None)
+        The number of threads used to compute the rows of the distance
+        matrix. None means 1, -1 means using all processors.
+    **metric_params
+        Parameters of the distance measure, e.g. ``w`` for dtw or ``c`` for
+        msm, with the same names and defaults as in elastic_cython.
+
+    Returns
+    -------
+    distances : np.ndarray of shape [n_instances_X, n_instances_Y]
+    """
+    X, Y = _check_panels(X, Y)
+
+    if callable(metric):
+        X = X.transpose((0, 2, 1))
+        Y = Y.transpose((0, 2, 1))
+        distances = np.empty((X.shape[0], Y.shape[0]))
+        for i in range(X.shape[0]):
+            for j in range(Y.shape[0]):
+                distances[i, j] = metric(X[i], Y[j], **metric_params)
+        return distances
+
+    if metric not in PAIRWISE_DISTANCES:
+        raise ValueError(
+            "Unrecognised distance measure: %s. Allowed values are names from %s "
+            "or a callable distance measure" % (metric, list(PAIRWISE_DISTANCES))
+        )
+    pairwise, param_spec, preprocess = PAIRWISE_DISTANCES[metric]
+    params = _get_params(metric, param_spec, metric_params)
+    if preprocess is not None:
+        # transform each series once rather than once per pair
+        Y = None if Y is X else preprocess(Y)
+        X = preprocess(X)
+        Y = X if Y is None else Y
+
+    return _call_with_n_jobs(pairwise, n_jobs, X, Y, params)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from sktime.distances.cache import SeriesCache
+from sktime.transformations.panel.summarize import DerivativeSlopeTransformer
+from sktime.utils._testing.panel import make_classification_problem
+from sktime.utils.data_processing import from_3d_numpy_to_nested
+from sktime.utils.data_processing import from_nested_to_3d_numpy
+
+
+def _make_panel():
+    X, _ = make_classification_problem(
+        n_instances=10, n_columns=2, return_numpy=True, random_state=1
+    )
+    return X
+
+
+def test_cache_reuses_series_across_panels():
+    X = _make_panel()
+    cache = SeriesCache()
+    np.testing.assert_array_equal(cache.derivative(X[:6]), np.diff(X[:6], axis=2))
+    assert (cache.hits, cache.misses) == (0, 6)
+
+    # only the series not seen before are transformed
+    np.testing.assert_array_equal(cache.derivative(X[4:]), np.diff(X[4:], axis=2))
+    assert (cache.hits, cache.misses) == (2, 10)
+
+    # representations with different parameters are cached separately
+    cache.envelopes(X, 2)
+    cache.envelopes(X, 3)
+    assert len(cache) == 30
+
+
+def test_cache_lru_eviction():
+    X = _make_panel()
+    row_bytes = X[0].nbytes
+    cache = SeriesCache(max_bytes=3 * row_bytes)
+    cache.z_normalise(X[:3])
+    cache.z_normalise(X[:1])  # mark the first series as recently used
+    cache.z_normalise(X[3:4])
+    assert len(cache) == 3
+    assert cache.n_bytes == 3 * row_bytes
+
+    cache.z_normalise(X[[0, 2, 3]])
+    assert cache.misses == 4
+    cache.z_normalise(X[1:2])
+    assert cache.misses == 5
+
+    cache.clear()
+    assert len(cache) == 0 and cache.n_bytes == 0
+
+
+def test_slope_derivative():
+    X = _make_panel()
+    expected = DerivativeSlopeTransformer().fit_transform(from_3d_numpy_to_nested(X))
+    actual = SeriesCache().slope_derivative(X)
+    np.testing.assert_array_almost_equal(actual, from_nested_to_3d_numpy(expected))
+
+
+def test_envelopes():
+    X = _make_panel()
+    upper, lower = SeriesCache().envelopes(X, 2)
+    for t in range(X.shape[2]):
+        window = X[:, :, max(0, t - 2) : t + 3]
+        np.testing.assert_array_equal(upper[:, :, t], window.max(axis=2))
+        np.testing.assert_array_equal(lower[:, :, t], window.min(axis=2))
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from sktime.distances.neighbors import nearest_neighbors
+from sktime.distances.pairwise import pairwise_distance
+from sktime.utils._testing.panel import make_classification_problem
+
+METRIC_PARAMS = [
+    ("dtw", {}),
+    ("dtw", {"w": 0.1}),
+    ("ddtw", {"w": 0.2}),
+    ("wdtw", {}),
+    ("wdtw", {"g": -0.1}),
+    ("wddtw", {"g": 0.1}),
+]
+
+
+@pytest.mark.parametrize("n_columns", [1, 2])
+@pytest.mark.parametrize("n_neighbors", [1, 3])
+@pytest.mark.parametrize("metric, metric_params", METRIC_PARAMS)
+def test_nearest_neighbors_matches_pairwise_distance(
+    metric, metric_params, n_neighbors, n_columns
+):
+    X, _ = make_classification_problem(
+        n_instances=30,
+        n_columns=n_columns,
+        n_timepoints=25,
+        return_numpy=True,
+        random_state=1,
+    )
+    X, Y = X[:10], X[10:]
+    distances = pairwise_distance(X, Y, metric=metric, **metric_params)
+    expected_indices = np.argsort(distances, axis=1, kind="stable")[:, :n_neighbors]
+
+    actual_distances, actual_indices = nearest_neighbors(
+        X, Y, n_neighbors=n_neighbors, metric=metric, n_jobs=2, **metric_params
+    )
+    np.testing.assert_array_equal(actual_indices, expected_indices)
+    np.testing.assert_array_almost_equal(
+        actual_distances, np.take_along_axis(distances, expected_indices, axis=1)
+    )
+
+
+def test_nearest_neighbors_ties():
+    X = np.zeros((2, 1, 10))
+    Y = np.zeros((4, 1, 10))
+    distances, indices = nearest_neighbors(X, Y, n_neighbors=3)
+    np.testing.assert_array_equal(indices, [[0, 1, 2], [0, 1, 2]])
+    np.testing.assert_array_equal(distances, np.zeros((2, 3)))
+
+
+def test_nearest_neighbors_bad_input():
+    X = np.zeros((2, 1, 10))
+    with pytest.raises(ValueError, match="Unrecognised distance measure"):
+        nearest_neighbors(X, X, metric="msm")
+    with pytest.raises(ValueError, match="same series length"):
+        nearest_neighbors(X, X[:, :, :5])
+    with pytest.raises(ValueError, match="n_neighbors"):
+        nearest_neighbors(X, X, n_neighbors=3)
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from sktime.distances import elastic_cython
+from sktime.distances.elastic import euclidean_distance
+from sktime.distances.pairwise import pairwise_distance
+from sktime.utils._testing.panel import make_classification_problem
+
+DISTANCES = {
+    "euclidean": euclidean_distance,
+    "dtw": elastic_cython.dtw_distance,
+    "ddtw": elastic_cython.ddtw_distance,
+    "wdtw": elastic_cython.wdtw_distance,
+    "wddtw": elastic_cython.wddtw_distance,
+    "lcss": elastic_cython.lcss_distance,
+    "msm": elastic_cython.msm_distance,
+    "erp": elastic_cython.erp_distance,
+    "twe": elastic_cython.twe_distance,
+}
+
+METRIC_PARAMS = [
+    ("dtw", {"w": 0.1}),
+    ("wdtw", {"g": 0.2}),
+    ("lcss", {"delta": 5, "epsilon": 0.5}),
+    ("msm", {"c": 0.5}),
+    ("erp", {"band_size": 0.2, "g": 0.1}),
+    ("twe", {"penalty": 0.5, "stiffness": 0.1}),
+]
+
+
+def _make_panels(n_columns):
+    X, _ = make_classification_problem(
+        n_instances=10,
+        n_columns=n_columns,
+        n_timepoints=20,
+        return_numpy=True,
+        random_state=1,
+    )
+    return X[:6], X[6:]
+
+
+def _expected(X, Y, distance, **metric_params):
+    # elastic_cython expects series of shape [n_timepoints, n_columns]
+    X = X.transpose((0, 2, 1))
+    Y = Y.transpose((0, 2, 1))
+    return np.array(
+        [[distance(x, y, **metric_params) for y in Y] for x in X], dtype=np.float64
+    )
+
+
+@pytest.mark.parametrize("n_columns", [1, 3])
+@pytest.mark.parametrize("metric", list(DISTANCES))
+def test_pairwise_distance_matches_elastic_cython(metric, n_columns):
+    X, Y = _make_panels(n_columns)
+    expected = _expected(X, Y, DISTANCES[metric])
+    actual = pairwise_distance(X, Y, metric=metric)
+    np.testing.assert_array_almost_equal(actual, expected)
+
+
+@pytest.mark.parametrize("metric, metric_params", METRIC_PARAMS)
+def test_pairwise_distance_metric_params(metric, metric_params):
+    X, Y = _make_panels(2)
+    expected = _expected(X, Y, DISTANCES[metric], **metric_params)
+    actual = pairwise_distance(X, Y, metric=metric, n_jobs=2, **metric_params)
+    np.testing.assert_array_almost_equal(actual, expected)
+
+
+def test_pairwise_distance_self_and_callable():
+    X, _ = _make_panels(1)
+    expected = pairwise_distance(X, X, metric=elastic_cython.dtw_distance)
+    np.testing.assert_array_almost_equal(pairwise_distance(X, metric="dtw"), expected)
+    np.testing.assert_array_almost_equal(
+        pairwise_distance(X[:, 0], metric="dtw"), expected
+    )
+
+
+def test_pairwise_distance_bad_input():
+    X, Y = _make_panels(2)
+    with pytest.raises(ValueError, match="Unrecognised distance measure"):
+        pairwise_distance(X, Y, metric="foo")
+    with pytest.raises(ValueError, match="Unrecognised parameters"):
+        pairwise_distance(X, Y, metric="dtw", c=1)
+    with pytest.raises(ValueError, match="same number of columns"):
+        pairwise_distance(X, Y[:, :1], metric="dtw")
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3 -u
+# -*- coding: utf-8 -*-
+# copyright: sktime developers, BSD-3-Clause License (see LICENSE file)
+
+__author__ = ["Markus Löning"]
+__all__ = ["_DataBuffer"]
+
+import numpy as np
+import pandas as pd
+
+# minimum number of observations the buffer has room for
+_MIN_CAPACITY = 16
+
+
+class _DataBuffer:
+    """Append-optimised buffer of a time series or of a data frame of time
+    series.
+
+    The values and the time index are kept in numpy arrays with spare capacity
+    at the end, so that appending observations after the last stored one is
+    amortised O(number of new observations) rather than O(length of the
+    history). Appending observations that overlap with the stored ones falls
+    back to `combine_first`, as for a pd.Series or pd.DataFrame.
+
+    Parameters
+    ----------
+    data : pd.Series or pd.DataFrame
+        Initial data, with a time index.
+    max_length : int or None, optional (default=None)
+        Maximum number of most recent observations to keep. If None, all
+        observations are kept.
+    """
+
+    def __init__(self, data, max_length=None):
+        if max_length is not None and max_length < 1:
+            raise ValueError(
+                f"`max_length` must be a positive integer or None, but found: "
+                f"{max_length}"
+            )
+        self.max_length = max_length
+        self._set(data)
+
+    def __len__(self):
+        return self._end - self._start
+
+    def _set(self, data):
+        """Replace the buffered data."""
+        if self.max_length is not None:
+            data = data.iloc[-self.max_length :]
+
+        self._pandas = None
+        self._is_frame = isinstance(data, pd.DataFrame)
+        self._index_info = _get_index_info(data.index)
+        self._dtype = _get_dtype(data)
+        if self._index_info is None or self._dtype is None:
+            # unsupported data are only stored as pandas object
+            self._pandas = data
+            self._start, self._end = 0, len(data)
+            return
+
+        n_timepoints = len(data)
+        capacity = max(2 * n_timepoints, _MIN_CAPACITY)
+        self._index = np.empty(capacity, dtype=np.int64)
+        self._index[:n_timepoints] = _index_to_numpy(data.index)
+        self._values = np.empty((capacity,) + data.shape[1:], dtype=self._dtype)
+        self._values[:n_timepoints] = data.to_numpy()
+        self._start = 0
+        self._end = n_timepoints
+        self._name = data.columns if self._is_frame else data.name
+
+    def append(self, data):
+        """Add observations to the buffer.
+
+        Values of new observations at time points that are already stored
+        replace the stored ones.
+
+        Parameters
+        ----------
+        data : pd.Series or pd.DataFrame
+            New observations, of the same type as the buffered data.
+        """
+        if len(data) == 0:
+            return
+        if not self._can_append(data):
+            self._set(data.combine_first(self.to_pandas()))
+            return
+
+        dtype = _get_result_dtype(self._dtype, _get_dtype(data))
+        last = self._index[self._end - 1] if len(self) > 0 else None
+        n_new = len(data)
+        if self._end + n_new > len(self._index) or dtype != self._dtype:
+            # allocate new arrays rather than moving the values in place, as
+            # previously returned pandas objects are views on the old ones
+            n_timepoints = len(self) + n_new
+            capacity = max(2 * n_timepoints, _MIN_CAPACITY)
+            index = np.empty(capacity, dtype=np.int64)
+            index[: len(self)] = self._index[self._start : self._end]
+            values = np.empty((capacity,) + self._values.shape[1:], dtype=dtype)
+            values[: len(self)] = self._values[self._start : self._end]
+            self._index, self._values = index, values
+            self._end -= self._start
+            self._start = 0
+            self._dtype = dtype
+
+        self._index[self._end : self._end + n_new] = _index_to_numpy(data.index)
+        self._values[self._end : self._end + n_new] = data.to_numpy()
+        self._end += n_new
+        self._index_info = _update_index_info(self._index_info, last, data.index)
+        if not self._is_frame:
+            self._name = data.name
+        if self.max_length is not None:
+            self._start = max(self._start, self._end - self.max_length)
+        self._pandas = None
+
+    def _can_append(self, data):
+        """Whether data can be appended without re-aligning the buffer."""
+        if self._index_info is None or self._dtype is None:
+            return False
+        if self._is_frame != isinstance(data, pd.DataFrame):
+            return False
+        if self._is_frame and not data.columns.equals(self._name):
+            return False
+        if _get_dtype(data) is None or not _is_compatible(self._index_info, data.index):
+            return False
+        # new observations must all be after the last stored one
+        return (
+            len(self) == 0
+            or _index_to_numpy(data.index[:1])[0] > self._index[self._end - 1]
+        )
+
+    def to_pandas(self):
+        """Get the buffered data.
+
+        Returns
+        -------
+        data : pd.Series or pd.DataFrame
+        """
+        if self._pandas is None:
+            index = _index_from_numpy(
+                self._index[self._start : self._end], self._index_info
+            )
+            values = self._values[self._start : self._end]
+            if self._is_frame:
+                self._pandas = pd.DataFrame(
+                    values, index=index, columns=self._name, copy=False
+                )
+            else:
+                self._pandas = pd.Series(values, index=index, name=self._name)
+        return self._pandas
+
+
+def _get_dtype(data):
+    """Common numeric dtype of the columns of data, None if they differ."""
+    dtypes = [data.dtype] if isinstance(data, pd.Series) else list(data.dtypes)
+    if len(set(dtypes)) != 1 or not isinstance(dtypes[0], np.dtype):
+        return None
+    if dtypes[0].kind not in "biufc":
+        return None
+    return dtypes[0]
+
+
+def _get_result_dtype(dtype, other):
+    # combine_first re-aligns the data with missing values, which turns
+    # integer and boolean values into floats
+    dtype = np.result_type(dtype, other)
+    if dtype.kind not in "fc":
+        dtype = np.dtype(np.float64)
+    return dtype
+
+
+def _get_index_info(index):
+    """Information needed to re-create a time index from its int64 values."""
+    if type(index) is pd.RangeIndex:
+        return "range", index.step, index.name
+    if type(index) is pd.Int64Index:
+        return "int", None, index.name
+    if type(index) is pd.DatetimeIndex:
+        return "datetime", (index.tz, index.freq), index.name
+    if type(index) is pd.PeriodIndex:
+        return "period", index.dtype, index.name
+    return None
+
+
+def _is_compatible(index_info, index):
+    kind, info, _ = index_info
+    if kind in ("range", "int"):
+        return type(index) in (pd.RangeIndex, pd.Int64Index)
+    if kind == "datetime":
+        return type(index) is pd.DatetimeIndex and index.tz == info[0]
+    return type(index) is pd.PeriodIndex and index.dtype == info
+
+
+def _update_index_info(index_info, last, index):
+    """Index information after appending index after the time point last,
+    as given by combine_first."""
+    kind, info, name = index_info
+    # the union of indices with different names has no name
+    if index.name != name:
+        name = None
+    if kind == "range":
+        step = info
+        if (
+            type(index) is not pd.RangeIndex
+            or (len(index) > 1 and index.step != step)
+            or (last is not None and index[0] != last + step)
+        ):
+            return "int", None, name
+    elif kind == "datetime":
+        tz, freq = info
+        if freq is not None and (
+            (len(index) > 1 and index.freq != freq)
+            or (last is not None and index[0] != _to_timestamp(last, tz) + freq)
+        ):
+            return kind, (tz, None), name
+    return kind, info, name
+
+
+def _to_timestamp(value, tz):
+    timestamp = pd.Timestamp(value, tz="UTC")
+    return timestamp.tz_convert(tz) if tz is not None else timestamp.tz_localize(None)
+
+
+def _index_to_numpy(index):
+    if type(index) in (pd.DatetimeIndex, pd.PeriodIndex):
+        return index.asi8
+    return index.to_numpy(dtype=np.int64)
+
+
+def _index_from_numpy(values, index_info):
+    kind, info, name = index_info
+    if kind == "range":
+        start = values[0] if len(values) > 0 else 0
+        return pd.RangeIndex(start, start + len(values) * info, info, name=name)
+    if kind == "int":
+        return pd.Index(values, name=name)
+    if kind == "datetime":
+        tz, freq = info
+        if freq is not None and len(values) > 0:
+            return pd.date_range(
+                start=_to_timestamp(values[0], tz),
+                periods=len(values),
+                freq=freq,
+                name=name,
+            )
+        index = pd.DatetimeIndex(values.view("M8[ns]"), name=name)
+        return index.tz_localize("UTC").tz_convert(tz) if tz is not None else index
+    return pd.PeriodIndex(pd.arrays.PeriodArray(values, dtype=info), name=name)
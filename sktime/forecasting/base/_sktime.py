@@ -13,6 +13,7 @@ import pandas as pd
 
 from sktime.forecasting.base._base import BaseForecaster
 from sktime.forecasting.base._base import DEFAULT_ALPHA
+from sktime.forecasting.base._buffer import _DataBuffer
 from sktime.forecasting.model_selection import CutoffSplitter
 from sktime.forecasting.model_selection import SlidingWindowSplitter
 from sktime.utils.datetime import _shift
@@ -27,8 +28,13 @@ from sktime.utils.validation.forecasting import check_y_X
 class _SktimeForecaster(BaseForecaster):
     """Base class for forecaster implemented in sktime"""
 
+    # maximum number of most recent observations kept as training data,
+    # see set_max_history
+    _max_history = None
+
     def __init__(self):
-        # training data
+        # training data, kept in buffers so that updates only append the new
+        # observations
         self._y = None
         self._X = None
 
@@ -37,6 +43,51 @@ class _SktimeForecaster(BaseForecaster):
         self._cutoff = None  # reference point for relative fh
         super(_SktimeForecaster, self).__init__()
 
+    @property
+    def _y(self):
+        return None if self._y_buffer is None else self._y_buffer.to_pandas()
+
+    @_y.setter
+    def _y(self, y):
+        self._y_buffer = None if y is None else _DataBuffer(y, self._max_history)
+
+    @property
+    def _X(self):
+        return None if self._X_buffer is None else self._X_buffer.to_pandas()
+
+    @_X.setter
+    def _X(self, X):
+        self._X_buffer = None if X is None else _DataBuffer(X, self._max_history)
+
+    def set_max_history(self, max_history=None):
+        """Set the maximum number of observations kept as training data.
+
+        Only the most recent `max_history` observations of the data passed to
+        `fit` and `update` are kept, which bounds the memory and time used by
+        long running online forecasting. The forecaster must not need older
+        observations to make predictions or to update its fitted parameters.
+
+        Parameters
+        ----------
+        max_history : int or None, optional (default=None)
+            Maximum number of observations to keep, None keeps all
+            observations.
+
+        Returns
+        -------
+        self : an instance of self
+        """
+        if max_history is not None and max_history < 1:
+            raise ValueError(
+                f"`max_history` must be a positive integer or None, but found: "
+                f"{max_history}"
+            )
+        self._max_history = max_history
+        # re-apply to the training data seen so far
+        self._y = self._y
+        self._X = self._X
+        return self
+
     def _set_y_X(self, y, X=None, enforce_index_type=None):
         """Set training data.
 
@@ -75,14 +126,19 @@ class _SktimeForecaster(BaseForecaster):
         y, X = check_y_X(y, X, allow_empty=True, enforce_index_type=enforce_index_type)
 
         if len(y) > 0:
-            self._y = y.combine_first(self._y)
+            # the buffer appends new observations in place if they come after
+            # the ones seen so far, and falls back to combine_first otherwise
+            self._y_buffer.append(y)
 
             # set cutoff to the end of the observation horizon
             self._set_cutoff(y.index[-1])
 
             # update X if given
             if X is not None:
-                self._X = X.combine_first(self._X)
+                if self._X_buffer is None:
+                    self._X = X
+                else:
+                    self._X_buffer.append(X)
 
     def _get_y_pred(self, y_in_sample, y_out_sample):
         """Combining in-sample and out-sample prediction
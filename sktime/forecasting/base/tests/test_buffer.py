@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# copyright: sktime developers, BSD-3-Clause License (see LICENSE file)
+
+__author__ = ["Markus Löning"]
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from pandas.testing import assert_series_equal
+
+from sktime.datasets import load_airline
+from sktime.forecasting.base._buffer import _DataBuffer
+from sktime.forecasting.naive import NaiveForecaster
+from sktime.utils._testing.forecasting import make_forecasting_problem
+
+# (start, length) of the chunks of data appended to the initial data, they
+# continue it, leave gaps and overlap with it
+CHUNKS = [(10, 1), (11, 3), (8, 5), (20, 1), (25, 4), (27, 2)]
+
+
+@pytest.mark.parametrize("index_type", ["int", "range", "datetime", "period"])
+def test_append_matches_combine_first(index_type):
+    y = make_forecasting_problem(n_timepoints=40, index_type=index_type)
+    X = pd.DataFrame({"a": y * 2, "b": y + 1})
+
+    y_buffer = _DataBuffer(y.iloc[:10])
+    X_buffer = _DataBuffer(X.iloc[:10])
+    y_expected = y.iloc[:10]
+    X_expected = X.iloc[:10]
+    for start, length in CHUNKS:
+        y_new = y.iloc[start : start + length]
+        X_new = X.iloc[start : start + length]
+        y_buffer.append(y_new)
+        X_buffer.append(X_new)
+        y_expected = y_new.combine_first(y_expected)
+        X_expected = X_new.combine_first(X_expected)
+
+        assert_series_equal(y_buffer.to_pandas(), y_expected)
+        assert_frame_equal(X_buffer.to_pandas(), X_expected)
+
+
+def test_max_length():
+    y = make_forecasting_problem(n_timepoints=40)
+    buffer = _DataBuffer(y.iloc[:10], max_length=5)
+    assert_series_equal(buffer.to_pandas(), y.iloc[5:10])
+
+    for t in range(10, 40):
+        buffer.append(y.iloc[t : t + 1])
+        assert_series_equal(buffer.to_pandas(), y.iloc[t - 4 : t + 1])
+
+
+def test_update_with_max_history():
+    y = make_forecasting_problem(n_timepoints=40)
+    forecaster = NaiveForecaster(strategy="mean", window_length=5)
+    forecaster.set_max_history(10)
+    forecaster.fit(y.iloc[:20], fh=[1])
+    for t in range(20, 40):
+        forecaster.update(y.iloc[t : t + 1], update_params=False)
+
+    assert_series_equal(forecaster._y, y.iloc[30:])
+    np.testing.assert_allclose(forecaster.predict(), y.iloc[35:].mean())
+
+
+def test_index_and_series_names_are_kept():
+    y = load_airline()
+    forecaster = NaiveForecaster()
+    forecaster.fit(y.iloc[:100])
+    assert_series_equal(forecaster._y, y.iloc[:100])
+    for start, length in [(100, 10), (110, 1), (105, 10)]:
+        forecaster.update(y.iloc[start : start + length], update_params=False)
+    assert_series_equal(forecaster._y, y.iloc[:115])
+
+    # as combine_first, the index has no name when the names differ
+    y_new = y.iloc[115:120].rename_axis("time")
+    forecaster.update(y_new, update_params=False)
+    assert_series_equal(forecaster._y, y_new.combine_first(y.iloc[:115]))
+    assert forecaster._y.index.name is None
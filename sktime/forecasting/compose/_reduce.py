@@ -26,6 +26,7 @@ __all__ = [
 ]
 
 import numpy as np
+import pandas as pd
 from sklearn.base import RegressorMixin
 from sklearn.base import clone
 
@@ -34,8 +35,10 @@ from sktime.forecasting.base._base import DEFAULT_ALPHA
 from sktime.forecasting.base._sktime import _BaseWindowForecaster
 from sktime.forecasting.base._sktime import _OptionalForecastingHorizonMixin
 from sktime.forecasting.base._sktime import _RequiredForecastingHorizonMixin
+from sktime.forecasting.base._sktime import _format_moving_cutoff_predictions
 from sktime.regression.base import BaseRegressor
 from sktime.utils._maint import deprecated
+from sktime.utils.datetime import _shift
 from sktime.utils.validation import check_window_length
 from sktime.utils.validation.forecasting import check_step_length
 
@@ -406,7 +409,6 @@ class _RecursiveReducer(_OptionalForecastingHorizonMixin, _Reducer):
         window_length = self.window_length_
         fh_max = fh.to_relative(self.cutoff)[-1]
 
-        y_pred = np.zeros(fh_max)
         last = np.zeros((1, n_columns, window_length + fh_max))
 
         # Fill pre-allocated arrays with available data.
@@ -415,26 +417,132 @@ class _RecursiveReducer(_OptionalForecastingHorizonMixin, _Reducer):
             last[:, 1:, :window_length] = X_last.T
             last[:, 1:, window_length:] = X.T
 
+        y_pred = self._predict_recursive(last, fh_max)[0]
+
+        # While the recursive strategy requires to generate predictions for all steps
+        # until the furthest step in the forecasting horizon, we only return the
+        # requested ones.
+        fh_idx = fh.to_indexer(self.cutoff)
+        return y_pred[fh_idx]
+
+    def _predict_recursive(self, last, fh_max):
+        """Recursively generate predictions for a batch of windows
+
+        All windows are moved forward together, so that the estimator is
+        called once per step ahead on the stacked windows, rather than once
+        per step ahead and window.
+
+        Parameters
+        ----------
+        last : np.ndarray, shape=[n_windows, n_columns, window_length + fh_max]
+            Last windows of available data, followed by the future values of
+            the exogenous variables. The values of the target variable after
+            the last windows are filled with the predictions.
+        fh_max : int
+            Furthest step ahead to predict.
+
+        Returns
+        -------
+        y_pred : np.ndarray, shape=[n_windows, fh_max]
+        """
+        n_windows = last.shape[0]
+        window_length = self.window_length_
+        y_pred = np.zeros((n_windows, fh_max))
+
         # Recursively generate predictions by iterating over forecasting horizon.
         for i in range(fh_max):
-            # Slice prediction window.
+            # Slice prediction windows.
             X_pred = last[:, :, i : window_length + i]
 
             # Reshape data into tabular array.
             if self._estimator_scitype == "tabular-regressor":
-                X_pred = X_pred.reshape(1, -1)
+                X_pred = X_pred.reshape(n_windows, -1)
 
             # Generate predictions.
-            y_pred[i] = self.estimator_.predict(X_pred)
+            y_pred[:, i] = self.estimator_.predict(X_pred)
 
-            # Update last window with previous prediction.
-            last[:, 0, window_length + i] = y_pred[i]
+            # Update last windows with previous predictions.
+            last[:, 0, window_length + i] = y_pred[:, i]
 
-        # While the recursive strategy requires to generate predictions for all steps
-        # until the furthest step in the forecasting horizon, we only return the
-        # requested ones.
-        fh_idx = fh.to_indexer(self.cutoff)
-        return y_pred[fh_idx]
+        return y_pred
+
+    def _predict_moving_cutoff(
+        self,
+        y,
+        cv,
+        X=None,
+        update_params=True,
+        return_pred_int=False,
+        alpha=DEFAULT_ALPHA,
+    ):
+        """Make single-step or multi-step moving cutoff predictions
+
+        Without updating the fitted parameters, the estimator is the same for
+        all cutoffs, so that the last windows of all cutoffs are collected
+        first and predicted together in a single batch.
+
+        Parameters
+        ----------
+        y : pd.Series
+        cv : temporal cross-validation generator
+        X : pd.DataFrame
+        update_params : bool
+        return_pred_int : bool
+        alpha : float or array-like
+
+        Returns
+        -------
+        y_pred = pd.Series
+        """
+        fh = cv.get_fh()
+        if (
+            update_params
+            or X is not None
+            or self._X is not None
+            or return_pred_int
+            or not fh.is_relative
+            or not fh.is_all_out_of_sample()
+        ):
+            return super(_RecursiveReducer, self)._predict_moving_cutoff(
+                y,
+                cv,
+                X,
+                update_params=update_params,
+                return_pred_int=return_pred_int,
+                alpha=alpha,
+            )
+
+        window_length = self.window_length_
+        fh_max = fh[-1]
+        cutoffs = []
+        windows = []
+
+        # enter into a detached cutoff mode
+        with self._detached_cutoff():
+            # set cutoff to time point before data
+            self._set_cutoff(_shift(y.index[0], by=-1))
+            # iterate over data, only collecting the last window of each cutoff
+            for new_window, _ in cv.split(y):
+                self.update(y.iloc[new_window], update_params=False)
+                y_last, _ = self._get_last_window()
+                windows.append(y_last if self._is_predictable(y_last) else None)
+                cutoffs.append(self.cutoff)
+
+        # Predict all predictable windows together.
+        is_predictable = np.array([window is not None for window in windows])
+        y_pred = np.full((len(windows), fh_max), np.nan)
+        if is_predictable.any():
+            last = np.zeros((is_predictable.sum(), 1, window_length + fh_max))
+            last[:, 0, :window_length] = [w for w in windows if w is not None]
+            y_pred[is_predictable] = self._predict_recursive(last, fh_max)
+
+        # Only return the requested steps ahead.
+        fh_idx = fh.to_indexer()
+        y_preds = [
+            pd.Series(y_pred[i, fh_idx], index=fh.to_absolute(cutoff))
+            for i, cutoff in enumerate(cutoffs)
+        ]
+        return _format_moving_cutoff_predictions(y_preds, cutoffs)
 
 
 class _DirRecReducer(_RequiredForecastingHorizonMixin, _Reducer):
@@ -8,6 +8,7 @@ import numpy as np
 import pandas as pd
 import pytest
 from sklearn.base import BaseEstimator
+from sklearn.base import clone
 from sklearn.base import RegressorMixin
 from sklearn.dummy import DummyRegressor
 from sklearn.linear_model import LinearRegression
@@ -521,3 +522,33 @@ def test_dirrec_against_recursive_accumulated_error():
     assert mean_absolute_percentage_error(
         y_test, preds_dirrec
     ) < mean_absolute_percentage_error(y_test, preds_recursive)
+
+
+@pytest.mark.parametrize(
+    "forecaster",
+    [
+        RecursiveTabularRegressionForecaster(LinearRegression(), window_length=5),
+        RecursiveTimeSeriesRegressionForecaster(
+            make_pipeline(Tabularizer(), LinearRegression()), window_length=5
+        ),
+    ],
+)
+@pytest.mark.parametrize("fh", [1, [1, 3, 6]])
+def test_recursive_update_predict_against_predict(forecaster, fh):
+    # moving-cutoff predictions are generated in a single batch, they should
+    # match the predictions made from each cutoff separately
+    y = load_airline()
+    y_train, y_test = temporal_train_test_split(y, test_size=36)
+    cv = SlidingWindowSplitter(fh=fh, window_length=5, step_length=2)
+    fitted = clone(forecaster).fit(y_train)
+    actual = fitted.update_predict(y_test, cv=cv, update_params=False)
+
+    f = clone(forecaster).fit(y_train)
+    expected = []
+    for train, _ in cv.split(y_test):
+        f.update(y_test.iloc[train], update_params=False)
+        expected.append(f.predict(fh))
+    expected = pd.concat(expected) if fh == 1 else pd.DataFrame(expected).T
+
+    np.testing.assert_array_almost_equal(actual, expected)
+    assert fitted.cutoff == y_train.index[-1]
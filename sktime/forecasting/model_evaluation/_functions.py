@@ -3,9 +3,13 @@
 __author__ = ["Martin Walter", "Markus Löning"]
 __all__ = ["evaluate"]
 
+import time
+
 import numpy as np
 import pandas as pd
-import time
+from joblib import Parallel
+from joblib import delayed
+
 from sktime.utils.validation.forecasting import check_y_X
 from sktime.utils.validation.forecasting import check_cv
 from sktime.forecasting.base import ForecastingHorizon
@@ -21,6 +25,7 @@ def evaluate(
     scoring=None,
     fit_params=None,
     return_data=False,
+    n_jobs=None,
 ):
     """Evaluate forecaster using cross-validation
 
@@ -47,6 +52,13 @@ def evaluate(
         Returns three additional columns in the DataFrame, by default False.
         The cells of the columns contain each a pd.Series for y_train,
         y_pred, y_test.
+    n_jobs : int or None, optional (default=None)
+        The number of jobs to run in parallel over the folds, only used with
+        the "refit" strategy, as the folds depend on each other with the
+        "update" strategy. ``None`` means 1 unless in a
+        :obj:`joblib.parallel_backend` context. ``-1`` means using all
+        processors. If more than one job is used, the folds are fitted on
+        copies of `forecaster`.
 
     Returns
     -------
@@ -73,71 +85,123 @@ def evaluate(
     scoring = check_scoring(scoring)
     y, X = check_y_X(y, X)
     fit_params = {} if fit_params is None else fit_params
+    fh = check_fh(cv.fh)
 
     # Define score name.
     score_name = "test_" + scoring.name
 
-    # Initialize dataframe.
-    results = pd.DataFrame()
-
-    # Run temporal cross-validation.
-    for i, (train, test) in enumerate(cv.split(y)):
-        # split data
-        y_train, y_test, X_train, X_test = _split(y, X, train, test, cv.fh)
-
-        # create forecasting horizon
-        fh = ForecastingHorizon(y_test.index, is_relative=False)
-
-        # fit/update
-        start_fit = time.time()
-        if i == 0 or strategy == "refit":
-            forecaster.fit(y_train, X_train, fh=fh, **fit_params)
-
-        else:  # if strategy == "update":
-            forecaster.update(y_train, X_train)
-        fit_time = time.time() - start_fit
-
-        # predict
-        start_pred = time.time()
-        y_pred = forecaster.predict(fh, X=X_test)
-        pred_time = time.time() - start_pred
-
-        # score
-        score = scoring(y_pred, y_test)
-
-        # save results
-        results = results.append(
-            {
-                score_name: score,
-                "fit_time": fit_time,
-                "pred_time": pred_time,
-                "len_train_window": len(y_train),
-                "cutoff": forecaster.cutoff,
-                "y_train": y_train if return_data else np.nan,
-                "y_test": y_test if return_data else np.nan,
-                "y_pred": y_pred if return_data else np.nan,
-            },
-            ignore_index=True,
+    # The folds are split lazily, so that the training windows of all folds
+    # are not held in memory at once.
+    splits = (_split(y, X, train, test, fh) for train, test in cv.split(y))
+
+    # Run temporal cross-validation. With the refit strategy, the folds are
+    # independent and can be run in parallel.
+    if strategy == "refit":
+        fold_results = Parallel(n_jobs=n_jobs)(
+            delayed(_evaluate_fold)(
+                forecaster, scoring, *split, True, fit_params, return_data
+            )
+            for split in splits
         )
+    else:  # if strategy == "update":
+        fold_results = [
+            _evaluate_fold(forecaster, scoring, *split, i == 0, fit_params, return_data)
+            for i, split in enumerate(splits)
+        ]
+
+    # Collect results.
+    columns = [
+        score_name,
+        "fit_time",
+        "pred_time",
+        "len_train_window",
+        "cutoff",
+        "y_train",
+        "y_test",
+        "y_pred",
+    ]
+    results = pd.DataFrame(
+        {
+            column: _to_array(values)
+            for column, values in zip(columns, zip(*fold_results))
+        },
+        columns=columns,
+    )
+    results[score_name] = results[score_name].astype(float)
 
     # post-processing of results
     if not return_data:
         results = results.drop(columns=["y_train", "y_test", "y_pred"])
-    results["len_train_window"] = results["len_train_window"].astype(int)
 
     return results
 
 
+def _evaluate_fold(
+    forecaster,
+    scoring,
+    y_train,
+    y_test,
+    X_train,
+    X_test,
+    fit,
+    fit_params,
+    return_data,
+):
+    """Fit or update the forecaster on the training data of one fold and
+    score its predictions on the test data"""
+    # create forecasting horizon
+    fh = ForecastingHorizon(y_test.index, is_relative=False)
+
+    # fit/update
+    start_fit = time.time()
+    if fit:
+        forecaster.fit(y_train, X_train, fh=fh, **fit_params)
+    else:
+        forecaster.update(y_train, X_train)
+    fit_time = time.time() - start_fit
+
+    # predict
+    start_pred = time.time()
+    y_pred = forecaster.predict(fh, X=X_test)
+    pred_time = time.time() - start_pred
+
+    # score
+    score = scoring(y_pred, y_test)
+
+    len_train_window = len(y_train)
+    if not return_data:
+        y_train, y_test, y_pred = None, None, None
+    return (
+        score,
+        fit_time,
+        pred_time,
+        len_train_window,
+        forecaster.cutoff,
+        y_train,
+        y_test,
+        y_pred,
+    )
+
+
+def _to_array(values):
+    """Column of the results, pandas objects are kept as cell values"""
+    if isinstance(values[0], (pd.Series, pd.DataFrame)) or values[0] is None:
+        array = np.empty(len(values), dtype=object)
+        for i, value in enumerate(values):
+            array[i] = value
+        return array
+    return pd.Series(values).array
+
+
 def _split(y, X, train, test, fh):
     """Split y and X for given train and test set indices"""
     y_train = y.iloc[train]
     y_test = y.iloc[test]
 
-    cutoff = y_train.index[-1]
-    fh = check_fh(fh)
-    fh = fh.to_relative(cutoff)
-
     if X is not None:
+        cutoff = y_train.index[-1]
+        fh = fh.to_relative(cutoff)
+
         X_train = X.iloc[train, :]
 
         # We need to expand test indices to a full range, since some forecasters
@@ -7,6 +7,7 @@ __all__ = [
     "test_evaluate_common_configs",
     "test_evaluate_initial_window",
     "test_evaluate_no_exog_against_with_exog",
+    "test_evaluate_parallel_refit",
 ]
 
 import numpy as np
@@ -137,3 +138,26 @@ def test_evaluate_no_exog_against_with_exog():
 
     scoring_name = f"test_{scoring.name}"
     assert np.all(out_exog[scoring_name] != out_no_exog[scoring_name])
+
+
+@pytest.mark.parametrize("return_data", [True, False])
+def test_evaluate_parallel_refit(return_data):
+    # Check that running the folds in parallel gives the same results
+    y = make_forecasting_problem(n_timepoints=30, index_type="int")
+    forecaster = NaiveForecaster(strategy="mean")
+    cv = ExpandingWindowSplitter(fh=[1, 2], initial_window=10, step_length=2)
+    scoring = MeanAbsolutePercentageError(symmetric=True)
+
+    out = evaluate(forecaster, cv, y, scoring=scoring, return_data=return_data)
+    out_parallel = evaluate(
+        forecaster, cv, y, scoring=scoring, return_data=return_data, n_jobs=2
+    )
+    _check_evaluate_output(out_parallel.iloc[:, :5], cv, y, scoring)
+
+    columns = out.columns.drop(["fit_time", "pred_time"])
+    pd.testing.assert_frame_equal(out.loc[:, columns], out_parallel.loc[:, columns])
+    if return_data:
+        assert isinstance(out_parallel.loc[0, "y_pred"], pd.Series)
+        pd.testing.assert_series_equal(
+            out_parallel.loc[0, "y_test"], y.iloc[10:12], check_names=False
+        )
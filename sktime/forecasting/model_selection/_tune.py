@@ -5,20 +5,24 @@
 __author__ = ["Markus Löning"]
 __all__ = ["ForecastingGridSearchCV", "ForecastingRandomizedSearchCV"]
 
+import numpy as np
 import pandas as pd
 from joblib import Parallel
 from joblib import delayed
 from sklearn.base import clone
 from sklearn.model_selection import ParameterGrid
 from sklearn.model_selection import ParameterSampler
-from sklearn.model_selection import check_cv
 from sklearn.model_selection._search import _check_param_grid
 from sklearn.utils.metaestimators import if_delegate_has_method
 
 from sktime.exceptions import NotFittedError
 from sktime.forecasting.base import BaseForecaster
 from sktime.forecasting.base._base import DEFAULT_ALPHA
-from sktime.forecasting.model_evaluation import evaluate
+from sktime.forecasting.model_evaluation._functions import _check_strategy
+from sktime.forecasting.model_evaluation._functions import _evaluate_fold
+from sktime.forecasting.model_evaluation._functions import _split
+from sktime.utils.validation.forecasting import check_cv
+from sktime.utils.validation.forecasting import check_fh
 from sktime.utils.validation.forecasting import check_scoring
 from sktime.utils.validation.forecasting import check_y_X
 
@@ -34,6 +38,7 @@ class BaseGridSearch(BaseForecaster):
         refit=False,
         scoring=None,
         verbose=0,
+        halving_factor=None,
     ):
         self.forecaster = forecaster
         self.cv = cv
@@ -43,6 +48,7 @@ class BaseGridSearch(BaseForecaster):
         self.refit = refit
         self.scoring = scoring
         self.verbose = verbose
+        self.halving_factor = halving_factor
         super(BaseGridSearch, self).__init__()
 
     @if_delegate_has_method(delegate=("best_forecaster_", "forecaster"))
@@ -216,48 +222,27 @@ class BaseGridSearch(BaseForecaster):
         self : returns an instance of self.
         """
         y, X = check_y_X(y, X)
-        cv = check_cv(self.cv)
+        cv = check_cv(self.cv, enforce_start_with_window=True)
+        _check_strategy(self.strategy)
+        _check_halving_factor(self.halving_factor)
         scoring = check_scoring(self.scoring)
         scoring_name = f"test_{scoring.name}"
+        fh = check_fh(cv.fh)
 
-        parallel = Parallel(n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch)
-
-        def _fit_and_score(params):
-            # Clone forecaster.
-            forecaster = clone(self.forecaster)
-
-            # Set parameters.
-            forecaster.set_params(**params)
-
-            # Evaluate.
-            out = evaluate(
-                forecaster,
-                cv,
-                y,
-                X,
-                strategy=self.strategy,
-                scoring=scoring,
-                fit_params=fit_params,
-            )
-
-            # Filter columns.
-            out = out.filter(items=[scoring_name, "fit_time", "pred_time"], axis=1)
+        # The folds are split once and shared by all candidates. The tasks
+        # only receive the train and test indices of their folds, y and X are
+        # passed along as a whole, so that joblib dumps large arrays once and
+        # memory-maps them in the workers instead of pickling them per task.
+        folds = list(cv.split(y))
+        n_splits = len(folds)
 
-            # Aggregate results.
-            out = out.mean()
-            out = out.add_prefix("mean_")
-
-            # Add parameters to output table.
-            out["params"] = params
-
-            return out
+        parallel = Parallel(n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch)
 
         def evaluate_candidates(candidate_params):
             candidate_params = list(candidate_params)
+            n_candidates = len(candidate_params)
 
             if self.verbose > 0:
-                n_candidates = len(candidate_params)
-                n_splits = cv.get_n_splits(y)
                 print(  # noqa
                     "Fitting {0} folds for each of {1} candidates,"
                     " totalling {2} fits".format(
@@ -265,18 +250,77 @@ class BaseGridSearch(BaseForecaster):
                     )
                 )
 
-            out = parallel(
-                delayed(_fit_and_score)(params) for params in candidate_params
-            )
-
-            if len(out) < 1:
+            if n_candidates < 1 or n_splits < 1:
                 raise ValueError(
                     "No fits were performed. "
                     "Was the CV iterator empty? "
                     "Were there no candidates?"
                 )
 
-            return out
+            forecasters = [
+                clone(self.forecaster).set_params(**params)
+                for params in candidate_params
+            ]
+            fold_scores = [[] for _ in range(n_candidates)]
+            remaining = np.arange(n_candidates)
+
+            start = 0
+            for stop in _get_fold_schedule(n_candidates, n_splits, self.halving_factor):
+                if start > 0:
+                    remaining = _eliminate_candidates(
+                        remaining,
+                        fold_scores,
+                        self.halving_factor,
+                        scoring.greater_is_better,
+                    )
+
+                if self.strategy == "refit":
+                    # the folds are independent, each (candidate, fold) pair
+                    # is run as a separate task
+                    tasks = [
+                        (i, clone(forecasters[i]), [fold])
+                        for i in remaining
+                        for fold in folds[start:stop]
+                    ]
+                else:
+                    # with the update strategy, the folds of a candidate are
+                    # run in order on the same forecaster
+                    tasks = [(i, forecasters[i], folds[start:stop]) for i in remaining]
+
+                out = parallel(
+                    delayed(_fit_and_score)(
+                        forecaster,
+                        scoring,
+                        y,
+                        X,
+                        task_folds,
+                        fh,
+                        self.strategy,
+                        start == 0,
+                        fit_params,
+                    )
+                    for _, forecaster, task_folds in tasks
+                )
+
+                for (i, _, _), (forecaster, scores) in zip(tasks, out):
+                    fold_scores[i].extend(scores)
+                    if forecaster is not None:
+                        forecasters[i] = forecaster
+                start = stop
+
+            results = []
+            for params, scores in zip(candidate_params, fold_scores):
+                score, fit_time, pred_time = np.mean(scores, axis=0)
+                result = {
+                    f"mean_{scoring_name}": score,
+                    "mean_fit_time": fit_time,
+                    "mean_pred_time": pred_time,
+                    "params": params,
+                }
+                if self.halving_factor is not None:
+                    result["n_folds"] = len(scores)
+                results.append(result)
+            return results
 
         # Run grid-search cross-validation.
         results = self._run_search(evaluate_candidates)
@@ -284,9 +328,17 @@ class BaseGridSearch(BaseForecaster):
         results = pd.DataFrame(results)
 
         # Rank results, according to whether greater is better for the given scoring.
-        results[f"rank_{scoring_name}"] = results.loc[:, f"mean_{scoring_name}"].rank(
-            ascending=~scoring.greater_is_better
-        )
+        ascending = ~scoring.greater_is_better
+        if self.halving_factor is None:
+            ranks = results.loc[:, f"mean_{scoring_name}"].rank(ascending=ascending)
+        else:
+            # candidates which were eliminated early rank after the ones
+            # which were evaluated on more folds
+            n_folds = results.loc[:, "n_folds"]
+            ranks = results.groupby("n_folds")[f"mean_{scoring_name}"].rank(
+                ascending=ascending
+            ) + n_folds.map(lambda n: np.sum(n_folds > n))
+        results[f"rank_{scoring_name}"] = ranks
         self.cv_results_ = results
 
         # Select best parameters.
@@ -340,13 +392,20 @@ class ForecastingGridSearchCV(BaseGridSearch):
     scoring: function, optional (default=None)
         Function to score models for evaluation of optimal parameters
     n_jobs: int, optional (default=None)
-        Number of jobs to run in parallel.
+        Number of jobs to run in parallel over the candidates and, with the
+        "refit" strategy, over the folds.
         None means 1 unless in a joblib.parallel_backend context.
         -1 means using all processors.
     refit: bool, optional (default=True)
         Refit the forecaster with the best parameters on all the data
     verbose: int, optional (default=0)
     pre_dispatch: str, optional (default='2*n_jobs')
+    halving_factor: float or None, optional (default=None)
+        If given, poor candidates are eliminated early by successive halving:
+        all candidates are evaluated on the first folds, only the best
+        ``1 / halving_factor`` of them on the following folds, and so on,
+        until the remaining candidates are evaluated on all folds. Must be
+        greater than 1. If None, all candidates are evaluated on all folds.
     error_score: numeric value or the str 'raise', optional (default=np.nan)
         The test score returned when a forecaster fails to be fitted.
     return_train_score: bool, optional (default=False)
@@ -362,6 +421,8 @@ class ForecastingGridSearchCV(BaseGridSearch):
         Fitted estimator with the best parameters
     cv_results_ : dict
         Results from grid search cross validation
+        With successive halving, the column "n_folds" gives the number of
+        folds each candidate was evaluated on.
     n_splits_: int
         Number of splits in the data for cross validation}
     refit_time_ : float
@@ -407,6 +468,7 @@ class ForecastingGridSearchCV(BaseGridSearch):
         refit=True,
         verbose=0,
         pre_dispatch="2*n_jobs",
+        halving_factor=None,
     ):
         super(ForecastingGridSearchCV, self).__init__(
             forecaster=forecaster,
@@ -417,6 +479,7 @@ class ForecastingGridSearchCV(BaseGridSearch):
             strategy=strategy,
             verbose=verbose,
             pre_dispatch=pre_dispatch,
+            halving_factor=halving_factor,
         )
         self.param_grid = param_grid
 
@@ -460,7 +523,8 @@ class ForecastingRandomizedSearchCV(BaseGridSearch):
     scoring: function, optional (default=None)
         Function to score models for evaluation of optimal parameters
     n_jobs: int, optional (default=None)
-        Number of jobs to run in parallel.
+        Number of jobs to run in parallel over the candidates and, with the
+        "refit" strategy, over the folds.
         None means 1 unless in a joblib.parallel_backend context.
         -1 means using all processors.
     refit: bool, optional (default=True)
@@ -472,6 +536,12 @@ class ForecastingRandomizedSearchCV(BaseGridSearch):
         Pass an int for reproducible output across multiple
         function calls.
     pre_dispatch: str, optional (default='2*n_jobs')
+    halving_factor: float or None, optional (default=None)
+        If given, poor candidates are eliminated early by successive halving:
+        all candidates are evaluated on the first folds, only the best
+        ``1 / halving_factor`` of them on the following folds, and so on,
+        until the remaining candidates are evaluated on all folds. Must be
+        greater than 1. If None, all candidates are evaluated on all folds.
 
     Attributes
     ----------
@@ -484,6 +554,8 @@ class ForecastingRandomizedSearchCV(BaseGridSearch):
         Fitted estimator with the best parameters
     cv_results_ : dict
         Results from grid search cross validation
+        With successive halving, the column "n_folds" gives the number of
+        folds each candidate was evaluated on.
     """
 
     _required_parameters = ["forecaster", "cv", "param_distributions"]
@@ -501,6 +573,7 @@ class ForecastingRandomizedSearchCV(BaseGridSearch):
         verbose=0,
         random_state=None,
         pre_dispatch="2*n_jobs",
+        halving_factor=None,
     ):
         super(ForecastingRandomizedSearchCV, self).__init__(
             forecaster=forecaster,
@@ -511,6 +584,7 @@ class ForecastingRandomizedSearchCV(BaseGridSearch):
             cv=cv,
             verbose=verbose,
             pre_dispatch=pre_dispatch,
+            halving_factor=halving_factor,
         )
         self.param_distributions = param_distributions
         self.n_iter = n_iter
@@ -523,3 +597,60 @@ class ForecastingRandomizedSearchCV(BaseGridSearch):
                 self.param_distributions, self.n_iter, random_state=self.random_state
             )
         )
+
+
+def _fit_and_score(forecaster, scoring, y, X, folds, fh, strategy, first, fit_params):
+    """Evaluate a forecaster on the given folds
+
+    Returns the forecaster when using the update strategy, so that it can be
+    updated on the following folds, and the score, fit time and prediction
+    time of each fold.
+    """
+    scores = []
+    for i, (train, test) in enumerate(folds):
+        fit = strategy == "refit" or (first and i == 0)
+        score, fit_time, pred_time, *_ = _evaluate_fold(
+            forecaster,
+            scoring,
+            *_split(y, X, train, test, fh),
+            fit,
+            fit_params,
+            False,
+        )
+        scores.append((score, fit_time, pred_time))
+
+    if strategy == "refit":
+        forecaster = None
+    return forecaster, scores
+
+
+def _check_halving_factor(halving_factor):
+    if halving_factor is not None and not halving_factor > 1:
+        raise ValueError(
+            f"`halving_factor` must be greater than 1 or None, but found: "
+            f"{halving_factor}"
+        )
+
+
+def _get_fold_schedule(n_candidates, n_splits, halving_factor):
+    """Number of folds the remaining candidates are evaluated on after each
+    round of successive halving"""
+    if halving_factor is None or n_candidates < 2:
+        return [n_splits]
+
+    # number of rounds needed to eliminate all but one candidate, the number
+    # of folds grows by the halving factor in every round
+    n_rounds = int(np.ceil(np.log(n_candidates) / np.log(halving_factor))) + 1
+    powers = halving_factor ** np.arange(n_rounds - 1, -1, -1, dtype=float)
+    return np.unique(np.ceil(n_splits / powers).astype(int)).tolist()
+
+
+def _eliminate_candidates(remaining, fold_scores, halving_factor, greater_is_better):
+    """Keep the best of the remaining candidates, according to their mean
+    score on the folds evaluated so far"""
+    n_keep = max(1, int(np.ceil(len(remaining) / halving_factor)))
+    mean_scores = np.array([np.mean([s[0] for s in fold_scores[i]]) for i in remaining])
+    if greater_is_better:
+        mean_scores = -mean_scores
+    order = np.argsort(mean_scores, kind="stable")
+    return np.sort(remaining[order[:n_keep]])
@@ -3,7 +3,13 @@
 # copyright: sktime developers, BSD-3-Clause License (see LICENSE file)
 
 __author__ = ["Markus Löning"]
-__all__ = ["test_gscv", "test_rscv"]
+__all__ = [
+    "test_gscv",
+    "test_rscv",
+    "test_gscv_parallel",
+    "test_gscv_update",
+    "test_gscv_successive_halving",
+]
 
 import numpy as np
 import pytest
@@ -16,6 +22,7 @@ from sktime.datasets import load_longley
 from sktime.forecasting.arima import ARIMA
 from sktime.forecasting.compose import TransformedTargetForecaster
 from sktime.forecasting.model_evaluation import evaluate
+from sktime.forecasting.model_selection import ExpandingWindowSplitter
 from sktime.forecasting.model_selection import ForecastingGridSearchCV
 from sktime.forecasting.model_selection import ForecastingRandomizedSearchCV
 from sktime.forecasting.model_selection import SingleWindowSplitter
@@ -31,12 +38,12 @@ from sktime.performance_metrics.forecasting import MeanAbsolutePercentageError
 from sktime.transformations.series.detrend import Detrender
 
 
-def _get_expected_scores(forecaster, cv, param_grid, y, X, scoring):
+def _get_expected_scores(forecaster, cv, param_grid, y, X, scoring, strategy="refit"):
     scores = np.zeros(len(param_grid))
     for i, params in enumerate(param_grid):
         f = clone(forecaster)
         f.set_params(**params)
-        out = evaluate(f, cv, y, X=X, scoring=scoring)
+        out = evaluate(f, cv, y, X=X, scoring=scoring, strategy=strategy)
         scores[i] = out.loc[:, f"test_{scoring.name}"].mean()
     return scores
 
@@ -121,3 +128,64 @@ def test_rscv(forecaster, param_grid, cv, scoring, n_iter, random_state):
         ParameterSampler(param_grid, n_iter, random_state=random_state)
     )
     _check_cv(forecaster, rscv, cv, param_distributions, y, X, scoring)
+
+
+def test_gscv_parallel():
+    y, X = load_longley()
+    cv = SlidingWindowSplitter(fh=1, window_length=5)
+    gscv = ForecastingGridSearchCV(
+        NAIVE, param_grid=NAIVE_GRID, cv=cv, scoring=MSE, n_jobs=2
+    )
+    gscv.fit(y, X)
+
+    param_grid = ParameterGrid(NAIVE_GRID)
+    _check_cv(NAIVE, gscv, cv, param_grid, y, X, MSE)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_gscv_update(n_jobs):
+    y, X = load_longley()
+    cv = ExpandingWindowSplitter(fh=1, initial_window=10)
+    gscv = ForecastingGridSearchCV(
+        NAIVE,
+        param_grid=NAIVE_GRID,
+        cv=cv,
+        scoring=MSE,
+        strategy="update",
+        n_jobs=n_jobs,
+    )
+    gscv.fit(y, X)
+
+    param_grid = ParameterGrid(NAIVE_GRID)
+    expected = _get_expected_scores(NAIVE, cv, param_grid, y, X, MSE, "update")
+    np.testing.assert_array_equal(gscv.cv_results_[f"mean_test_{MSE.name}"], expected)
+
+
+@pytest.mark.parametrize("strategy", ["refit", "update"])
+def test_gscv_successive_halving(strategy):
+    y, X = load_longley()
+    cv = ExpandingWindowSplitter(fh=1, initial_window=8)
+    param_grid = {"window_length": [1, 2, 3, 4, 5, 6, 7, 8]}
+    gscv = ForecastingGridSearchCV(
+        NAIVE,
+        param_grid=param_grid,
+        cv=cv,
+        scoring=MSE,
+        strategy=strategy,
+        halving_factor=2,
+    )
+    gscv.fit(y, X)
+    results = gscv.cv_results_
+    n_splits = cv.get_n_splits(y)
+
+    # a single candidate is left to be evaluated on all folds
+    n_folds = results.loc[:, "n_folds"]
+    assert (n_folds == n_splits).sum() == 1
+    assert n_folds.min() < n_splits
+    assert n_folds[gscv.best_index_] == n_splits
+    assert results.loc[gscv.best_index_, f"rank_test_{MSE.name}"] == 1
+
+    # the best candidate is scored as in a full search
+    param_grid = ParameterGrid(param_grid)
+    expected = _get_expected_scores(NAIVE, cv, param_grid, y, X, MSE, strategy)
+    assert gscv.best_score_ == expected[gscv.best_index_]
@@ -47,6 +47,13 @@ class TimeSeriesForestRegressor(BaseTimeSeriesForest, ForestRegressor, BaseRegre
          The number of jobs to run in parallel for both `fit` and `predict`.
          ``-1`` means using all processors.
      random_state    : int, seed for random, optional (default = none)
+     bootstrap       : bool, whether each tree is built on a bootstrap sample
+     of the training cases, optional (default = False)
+     time_limit      : float, time contract in minutes, if greater than 0
+     trees are added until it expires and n_estimators is ignored, optional
+     (default = 0)
+     contract_max_n_estimators : int, maximum number of trees built under a
+     time contract, optional (default = 500)
 
      Attributes
      ----------
@@ -91,7 +98,7 @@ class TimeSeriesForestRegressor(BaseTimeSeriesForest, ForestRegressor, BaseRegre
             )
         y_pred = Parallel(n_jobs=self.n_jobs)(
             delayed(_predict)(X, self.estimators_[i], self.intervals_[i])
-            for i in range(self.n_estimators)
+            for i in range(len(self.estimators_))
         )
         return np.mean(y_pred, axis=0)
 
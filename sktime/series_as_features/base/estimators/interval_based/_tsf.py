@@ -13,11 +13,14 @@ __all__ = [
 ]
 
 import math
+import time
 
 import numpy as np
 from joblib import Parallel
 from joblib import delayed
+from joblib import effective_n_jobs
 from sklearn.base import clone
+from sklearn.ensemble._forest import _generate_sample_indices
 from sklearn.utils.multiclass import class_distribution
 from sklearn.utils.validation import check_random_state
 
@@ -41,16 +44,23 @@ class BaseTimeSeriesForest:
         n_estimators=200,
         n_jobs=1,
         random_state=None,
+        bootstrap=False,
+        time_limit=0.0,
+        contract_max_n_estimators=500,
     ):
         super(BaseTimeSeriesForest, self).__init__(
             base_estimator=self._base_estimator,
             n_estimators=n_estimators,
+            bootstrap=bootstrap,
         )
 
         self.random_state = random_state
         self.n_estimators = n_estimators
         self.min_interval = min_interval
         self.n_jobs = n_jobs
+        self.bootstrap = bootstrap
+        self.time_limit = time_limit
+        self.contract_max_n_estimators = contract_max_n_estimators
         # The following set in method fit
         self.n_classes = 0
         self.series_length = 0
@@ -99,25 +109,66 @@ class BaseTimeSeriesForest:
         if self.series_length < self.min_interval:
             self.min_interval = self.series_length
 
-        self.intervals_ = [
-            _get_intervals(self.n_intervals, self.min_interval, self.series_length, rng)
-            for _ in range(self.n_estimators)
-        ]
+        if self.time_limit <= 0:
+            self.intervals_ = [
+                _get_intervals(
+                    self.n_intervals, self.min_interval, self.series_length, rng
+                )
+                for _ in range(self.n_estimators)
+            ]
+            # seeds of the bootstrap samples, they are drawn after the intervals
+            # so that the intervals do not depend on bootstrap
+            self.sample_seeds_ = self._get_sample_seeds(self.n_estimators, rng)
+            self.estimators_ = self._fit_estimators(
+                X, y, self.intervals_, self.sample_seeds_
+            )
+        else:
+            # trees are added in batches of one per job until the time limit
+            # expires, n_estimators is ignored
+            start_time = time.time()
+            batch_size = effective_n_jobs(self.n_jobs)
+            self.intervals_ = []
+            self.sample_seeds_ = []
+            self.estimators_ = []
+            while (
+                len(self.estimators_) == 0
+                or time.time() - start_time < self.time_limit * 60
+            ) and len(self.estimators_) < self.contract_max_n_estimators:
+                n_trees = min(
+                    batch_size, self.contract_max_n_estimators - len(self.estimators_)
+                )
+                intervals = [
+                    _get_intervals(
+                        self.n_intervals, self.min_interval, self.series_length, rng
+                    )
+                    for _ in range(n_trees)
+                ]
+                sample_seeds = self._get_sample_seeds(n_trees, rng)
+                self.estimators_ += self._fit_estimators(X, y, intervals, sample_seeds)
+                self.intervals_ += intervals
+                self.sample_seeds_ += sample_seeds
+
+        self._is_fitted = True
+        return self
 
-        self.estimators_ = Parallel(n_jobs=self.n_jobs)(
+    def _get_sample_seeds(self, n_trees, rng):
+        if not self.bootstrap:
+            return [None] * n_trees
+        return list(rng.randint(np.iinfo(np.int32).max, size=n_trees))
+
+    def _fit_estimators(self, X, y, intervals, sample_seeds):
+        return Parallel(n_jobs=self.n_jobs)(
             delayed(_fit_estimator)(
                 X,
                 y,
                 self.base_estimator,
-                self.intervals_[i],
+                intervals[i],
                 self.random_state,
+                sample_seeds[i],
             )
-            for i in range(self.n_estimators)
+            for i in range(len(intervals))
         )
 
-        self._is_fitted = True
-        return self
-
 
 def _transform(X, intervals):
     """Compute the mean, standard deviation and slope for given intervals
@@ -159,14 +210,25 @@ def _get_intervals(n_intervals, min_interval, series_length, rng):
     return intervals
 
 
-def _fit_estimator(X, y, base_estimator, intervals, random_state=None):
+def _fit_estimator(
+    X, y, base_estimator, intervals, random_state=None, sample_seed=None
+):
     """
     Fit an estimator - a clone of base_estimator - on input data (X, y)
-    transformed using the randomly generated intervals.
+    transformed using the randomly generated intervals. If sample_seed is
+    given, the estimator is fit on the bootstrap sample drawn with it.
     """
 
     estimator = clone(base_estimator)
     estimator.set_params(random_state=random_state)
 
     transformed_x = _transform(X, intervals)
-    return estimator.fit(transformed_x, y)
+    if sample_seed is None:
+        return estimator.fit(transformed_x, y)
+
+    # the bootstrap sample is given as sample weights, so that each estimator
+    # knows all classes
+    n_instances = X.shape[0]
+    indices = _generate_sample_indices(sample_seed, n_instances, n_instances)
+    sample_weight = np.bincount(indices, minlength=n_instances)
+    return estimator.fit(transformed_x, y, sample_weight=sample_weight)
@@ -8,6 +8,9 @@ __all__ = ["Catch22"]
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel
+from joblib import delayed
+from joblib import effective_n_jobs
 from sktime.transformations.base import _PanelToTabularTransformer
 from sktime.utils.validation._dependencies import _check_soft_dependencies
 from sktime.utils.data_processing import from_nested_to_2d_array
@@ -51,9 +54,25 @@ class Catch22(_PanelToTabularTransformer):
     https://github.com/uea-machine-learning/tsml/blob/master/src/main/java
     /tsml/transformers/Catch22.java
 
+    Parameters
+    ----------
+    features : "all" or list of int or str, optional (default="all")
+        The catch22 features to compute, given by their IDs or names. Only
+        the given features are computed.
+    per_dimension : bool, optional (default=False)
+        If True, the features are computed for each dimension of
+        multivariate series, with the columns of the output ordered by
+        dimension and then by feature. If False, the dimensions are
+        concatenated into a single series.
+    n_jobs : int, optional (default=1)
+        The number of jobs to transform chunks of the instances in
+        parallel. ``-1`` means using all processors.
     """
 
-    def __init__(self):
+    def __init__(self, features="all", per_dimension=False, n_jobs=1):
+        self.features = features
+        self.per_dimension = per_dimension
+        self.n_jobs = n_jobs
         super(Catch22, self).__init__()
 
     def transform(self, X, y=None):
@@ -66,20 +85,33 @@ class Catch22(_PanelToTabularTransformer):
 
         Returns
         -------
-        Pandas dataframe containing 22 features for each input series
+        Pandas dataframe containing the catch22 features for each input series
         """
         self.check_is_fitted()
         X = check_X(X, enforce_univariate=False, coerce_to_numpy=True)
         n_instances = X.shape[0]
-        X = np.reshape(X, (n_instances, -1))
+        if not self.per_dimension:
+            X = np.reshape(X, (n_instances, 1, -1))
 
-        c22_list = []
-        for i in range(n_instances):
-            series = X[i, :]
-            c22_dict = catch22.catch22_all(series)
-            c22_list.append(c22_dict["values"])
+        if self.features == "all":
+            feature_ids = list(range(len(features)))
+        else:
+            feature_ids = [_check_feature(feature) for feature in self.features]
+
+        n_jobs = min(effective_n_jobs(self.n_jobs), max(n_instances, 1))
+        if n_jobs == 1:
+            Xt = _transform_chunk(X, feature_ids)
+        else:
+            Xt = np.concatenate(
+                Parallel(n_jobs=n_jobs)(
+                    delayed(_transform_chunk)(X_chunk, feature_ids)
+                    for X_chunk in np.array_split(X, n_jobs)
+                )
+            )
 
-        return pd.DataFrame(c22_list)
+        if self.per_dimension:
+            return pd.DataFrame(Xt)
+        return pd.DataFrame(Xt, columns=feature_ids)
 
     def _transform_single_feature(self, X, feature):
         """transforms data into the catch22 features
@@ -94,32 +126,60 @@ class Catch22(_PanelToTabularTransformer):
         -------
         Numpy array containing a catch22 feature for each input series
         """
-        if isinstance(feature, (int, np.integer)) or isinstance(
-            feature, (float, np.float)
-        ):
-            if feature > 21 or feature < 0:
-                raise ValueError("Invalid catch22 feature ID")
-        elif isinstance(feature, str):
-            if feature in feature_names:
-                feature = feature_names.index(feature)
-            else:
-                raise ValueError("Invalid catch22 feature name")
-        else:
-            raise ValueError("catch22 feature name or ID required")
+        feature = _check_feature(feature)
 
         if isinstance(X, pd.DataFrame):
             X = from_nested_to_2d_array(X, return_numpy=True)
 
         n_instances = X.shape[0]
-        X = np.reshape(X, (n_instances, -1))
+        X = np.reshape(X, (n_instances, 1, -1))
+
+        return _transform_chunk(X, [feature])[:, 0]
 
-        c22_list = []
-        for i in range(n_instances):
-            series = X[i, :].tolist()
-            c22_val = features[feature](series)
-            c22_list.append(c22_val)
 
-        return np.array(c22_list)
+def _check_feature(feature):
+    """Get the ID of a catch22 feature given by its ID or name"""
+    if isinstance(feature, (int, float, np.integer, np.floating)):
+        if feature > 21 or feature < 0:
+            raise ValueError("Invalid catch22 feature ID")
+        return int(feature)
+    elif isinstance(feature, str):
+        if feature in feature_names:
+            return feature_names.index(feature)
+        else:
+            raise ValueError("Invalid catch22 feature name")
+    else:
+        raise ValueError("catch22 feature name or ID required")
+
+
+def _transform_chunk(X, feature_ids):
+    """Compute the given catch22 features of each dimension of each instance
+
+    Parameters
+    ----------
+    X : np.ndarray of shape (n_instances, n_dims, series_length)
+    feature_ids : list of int
+
+    Returns
+    -------
+    Xt : np.ndarray of shape (n_instances, n_dims * len(feature_ids))
+    """
+    n_instances, n_dims, _ = X.shape
+    n_features = len(feature_ids)
+    # all features are computed together in a single call
+    compute_all = feature_ids == list(range(len(features)))
+
+    Xt = np.empty((n_instances, n_dims * n_features))
+    for i in range(n_instances):
+        for j in range(n_dims):
+            # the catch22 functions take lists
+            series = X[i, j].tolist()
+            if compute_all:
+                values = catch22.catch22_all(series)["values"]
+            else:
+                values = [features[feature](series) for feature in feature_ids]
+            Xt[i, j * n_features : (j + 1) * n_features] = values
+    return Xt
 
 
 feature_names = [
@@ -10,6 +10,7 @@ import numpy as np
 import pandas as pd
 from joblib import Parallel, delayed
 from numba import njit
+from scipy.sparse import csr_matrix
 from sklearn.feature_selection import f_classif
 from sklearn.tree import DecisionTreeClassifier
 from sktime.transformations.base import _PanelToPanelTransformer
@@ -93,6 +94,12 @@ class SFA(_PanelToPanelTransformer):
             setting to true reduces speed significantly but is required for
             automatic test.
 
+        return_sparse:       boolean, default = False
+            set to true to return the bags as a scipy CSR matrix of word
+            counts, with a column per word of the vocabulary, rather than as
+            a list of dictionaries. Takes precedence over
+            return_pandas_data_series.
+
         n_jobs:              int, optional, default = 1
             The number of jobs to run in parallel for both `transform`.
             ``-1`` means using all processors.
@@ -101,6 +108,10 @@ class SFA(_PanelToPanelTransformer):
     ----------
         words: []
         breakpoints: = []
+        vocabulary: dict mapping words to the columns of the sparse bags,
+            taken from the first data transformed after fitting. Words
+            missing from the vocabulary are given columns after it, which
+            are only valid within the returned matrix.
         num_insts = 0
         num_atts = 0
     """
@@ -123,10 +134,12 @@ class SFA(_PanelToPanelTransformer):
         save_words=False,
         save_binning_dft=False,
         return_pandas_data_series=False,
+        return_sparse=False,
         n_jobs=1,
     ):
         self.words = []
         self.breakpoints = []
+        self.vocabulary = None
 
         # we cannot select more than window_size many letters in a word
         offset = 2 if norm else 0
@@ -168,6 +181,7 @@ class SFA(_PanelToPanelTransformer):
         self.n_instances = 0
         self.series_length = 0
         self.return_pandas_data_series = return_pandas_data_series
+        self.return_sparse = return_sparse
 
         self.n_jobs = n_jobs
 
@@ -207,6 +221,7 @@ class SFA(_PanelToPanelTransformer):
 
         self.n_instances, self.series_length = X.shape
         self.breakpoints = self._binning(X, y)
+        self.vocabulary = None
 
         self._is_fitted = True
         return self
@@ -228,11 +243,53 @@ class SFA(_PanelToPanelTransformer):
         dim, words = zip(*transform)
         if self.save_words:
             self.words = list(words)
+        if self.return_sparse:
+            return [self._bags_to_sparse(dim, self.vocabulary is None)]
         bags = pd.DataFrame() if self.return_pandas_data_series else [None]
         bags[0] = list(dim)
 
         return bags
 
+    def _bags_to_sparse(self, bags, update_vocabulary):
+        """Convert bags of words to a CSR matrix of word counts
+
+        Words missing from the vocabulary are added to it if
+        update_vocabulary is True, and given columns after it in the
+        returned matrix otherwise.
+        """
+        if self.vocabulary is None:
+            self.vocabulary = {}
+        vocabulary = self.vocabulary
+        n_words = len(vocabulary)
+        unseen = {}
+
+        indptr = np.zeros(len(bags) + 1, dtype=np.int64)
+        indices = []
+        data = []
+        for i, bag in enumerate(bags):
+            for word, count in bag.items():
+                column = vocabulary.get(word)
+                if column is None:
+                    if update_vocabulary:
+                        column = vocabulary[word] = len(vocabulary)
+                    else:
+                        column = unseen.setdefault(word, n_words + len(unseen))
+                indices.append(column)
+                data.append(count)
+            indptr[i + 1] = len(indices)
+
+        n_columns = len(vocabulary) if update_vocabulary else n_words + len(unseen)
+        X = csr_matrix(
+            (
+                np.array(data, dtype=np.int32),
+                np.array(indices, dtype=np.int64),
+                indptr,
+            ),
+            shape=(len(bags), n_columns),
+        )
+        X.sort_indices()
+        return X
+
     def _transform_case(self, X, i, supplied_dft):
         if supplied_dft is None:
             dfts = self._mft(X[i, :])
@@ -597,6 +654,9 @@ class SFA(_PanelToPanelTransformer):
 
             dim.append(pd.Series(bag) if self.return_pandas_data_series else bag)
 
+        if self.return_sparse:
+            # the saved words are those of the training data
+            return [self._bags_to_sparse(dim, True)]
         new_bags[0] = dim
 
         return new_bags
@@ -185,6 +185,37 @@ def test_word_lengths():
         raise AssertionError("An unexpected exception {0} raised.".format(repr(err)))
 
 
+def test_sparse_bags():
+    X_train, y_train = load_gunpoint(split="train", return_X_y=True)
+    X_test, _ = load_gunpoint(split="test", return_X_y=True)
+    params = dict(window_size=20, levels=2, bigrams=True, remove_repeat_words=True)
+
+    p = SFA(**params).fit(X_train, y_train)
+    p_sparse = SFA(return_sparse=True, **params).fit(X_train, y_train)
+
+    bags = p.transform(X_train)[0]
+    sparse_bags = p_sparse.transform(X_train)[0]
+    assert sparse_bags.shape == (len(bags), len(p_sparse.vocabulary))
+    for bag, sparse_bag in zip(bags, sparse_bags):
+        assert sparse_bag.nnz == len(bag)
+        for word, count in bag.items():
+            assert sparse_bag[0, p_sparse.vocabulary[word]] == count
+
+    # words missing from the vocabulary of the training data get columns
+    # after it, without changing the vocabulary
+    vocabulary = dict(p_sparse.vocabulary)
+    bags = p.transform(X_test)[0]
+    sparse_bags = p_sparse.transform(X_test)[0]
+    assert p_sparse.vocabulary == vocabulary
+    for bag, sparse_bag in zip(bags, sparse_bags):
+        known = {w: c for w, c in bag.items() if w in vocabulary}
+        assert sparse_bag.sum() == sum(bag.values())
+        for word, count in known.items():
+            assert sparse_bag[0, vocabulary[word]] == count
+        unseen = sparse_bag.indices[sparse_bag.indices >= len(vocabulary)]
+        assert len(unseen) == len(bag) - len(known)
+
+
 # def test_reproducability():
 #     # load training data
 #     X, y = load_gunpoint(split="train", return_X_y=True)
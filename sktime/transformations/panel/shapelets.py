@@ -22,9 +22,15 @@ from operator import itemgetter
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel
+from joblib import delayed
+from joblib import effective_n_jobs
+from numba import njit
+from numba import prange
 from sklearn.utils import check_random_state
 from sklearn.utils.multiclass import class_distribution
 
+from sktime.distances.pairwise import _call_with_n_jobs
 from sktime.transformations.base import _PanelToTabularTransformer
 from sktime.utils.validation.panel import check_X
 from sktime.utils.validation.panel import check_X_y
@@ -80,6 +86,10 @@ class ShapeletTransform(_PanelToTabularTransformer):
     the console (for information only) (default = 0)
     remove_self_similar                 : boolean, remove overlapping
     "self-similar" shapelets from the final transform (default = True)
+    n_jobs                              : int, the number of jobs used to
+    search the candidate shapelets in parallel in fit and the number of
+    threads used to transform the series, -1 means using all processors
+    (default = 1)
 
     Attributes
     ----------
@@ -100,6 +110,7 @@ class ShapeletTransform(_PanelToTabularTransformer):
         random_state=None,
         verbose=0,
         remove_self_similar=True,
+        n_jobs=1,
     ):
 
         self.min_shapelet_length = min_shapelet_length
@@ -108,6 +119,7 @@ class ShapeletTransform(_PanelToTabularTransformer):
         self.random_state = random_state
         self.verbose = verbose
         self.remove_self_similar = remove_self_similar
+        self.n_jobs = n_jobs
         self.predefined_ig_rejection_level = 0.05
         self.shapelets = None
         self.is_fitted_ = False
@@ -136,24 +148,8 @@ class ShapeletTransform(_PanelToTabularTransformer):
         ):
             raise ValueError("Error: time limit cannot be equal to or less than 0")
 
-        X_lens = np.repeat(X.shape[-1], X.shape[0])
-        # note, assumes all dimensions of a case are the same
-        # length. A shapelet would not be well defined if indices do not match!
-        # may need to pad with nans here for uneq length,
-        # look at later
-
-        num_ins = len(y)
         distinct_class_vals = class_distribution(np.asarray(y).reshape(-1, 1))[0][0]
 
-        candidates_evaluated = 0
-
-        if type(self) is _RandomEnumerationShapeletTransform:
-            num_series_to_visit = min(self.num_cases_to_sample, len(y))
-        else:
-            num_series_to_visit = num_ins
-
-        shapelet_heaps_by_class = {i: ShapeletPQ() for i in distinct_class_vals}
-
         self._random_state = check_random_state(self.random_state)
 
         # Here we establish the order of cases to sample. We need to sample
@@ -200,6 +196,144 @@ class ShapeletTransform(_PanelToTabularTransformer):
             *[list(v) for k, v in case_ids_by_class.items()]
         )
         cases_to_visit = [(i, y[i]) for i in round_robin_case_order]
+
+        # the random transform extracts candidates from the first
+        # num_cases_to_sample series only, before they are split among jobs
+        cases_to_extract = cases_to_visit
+        if type(self) is _RandomEnumerationShapeletTransform:
+            cases_to_extract = cases_to_visit[: self.num_cases_to_sample]
+
+        # for timing the extraction when contracting
+        start_time = time.time()
+
+        # If several jobs are used, the series to extract candidates from are
+        # split in contiguous chunks of the round-robin order (so that each
+        # job visits all classes) and searched in parallel. Each job keeps
+        # its own heaps of shapelets, they are merged before removing the
+        # self-similar shapelets. The time contract is global, all jobs stop
+        # when it is reached.
+        n_jobs = min(effective_n_jobs(self.n_jobs), len(cases_to_extract))
+        if n_jobs > 1:
+            seeds = self._random_state.randint(np.iinfo(np.int32).max, size=n_jobs)
+            chunks = np.array_split(np.arange(len(cases_to_extract)), n_jobs)
+            heaps_by_job = Parallel(n_jobs=n_jobs)(
+                delayed(self._search_shapelets)(
+                    X,
+                    y,
+                    [cases_to_extract[i] for i in chunk],
+                    cases_to_visit,
+                    num_train_per_class,
+                    check_random_state(seed),
+                    start_time,
+                )
+                for chunk, seed in zip(chunks, seeds)
+            )
+            shapelet_heaps_by_class = {i: ShapeletPQ() for i in distinct_class_vals}
+            for heaps in heaps_by_job:
+                for class_val, heap in heaps.items():
+                    for _, _, shapelet in heap.get_array():
+                        shapelet_heaps_by_class[class_val].push(shapelet)
+        else:
+            shapelet_heaps_by_class = self._search_shapelets(
+                X,
+                y,
+                cases_to_extract,
+                cases_to_visit,
+                num_train_per_class,
+                self._random_state,
+                start_time,
+            )
+
+        # remove self similar here
+        # for each class value
+        #       get list of shapelets
+        #       sort by quality
+        #       remove self similar
+
+        self.shapelets = []
+        for class_val in distinct_class_vals:
+            by_class_descending_ig = sorted(
+                shapelet_heaps_by_class[class_val].get_array(),
+                key=itemgetter(0),
+                reverse=True,
+            )
+
+            if self.remove_self_similar and len(by_class_descending_ig) > 0:
+                by_class_descending_ig = (
+                    ShapeletTransform.remove_self_similar_shapelets(
+                        by_class_descending_ig
+                    )
+                )
+            else:
+                # need to extract shapelets from tuples
+                by_class_descending_ig = [x[2] for x in by_class_descending_ig]
+
+            # if we have more than max_shapelet_per_class, trim to that
+            # amount here
+            if len(by_class_descending_ig) > self.max_shapelets_to_store_per_class:
+                max_n = self.max_shapelets_to_store_per_class
+                by_class_descending_ig = by_class_descending_ig[:max_n]
+
+            self.shapelets.extend(by_class_descending_ig)
+
+        # final sort so that all shapelets from all classes are in
+        # descending order of information gain
+        self.shapelets.sort(key=lambda x: x.info_gain, reverse=True)
+        self.is_fitted_ = True
+
+        # warn the user if fit did not produce any valid shapelets
+        if len(self.shapelets) == 0:
+            warnings.warn(
+                "No valid shapelets were extracted from this dataset and "
+                "calling the transform method "
+                "will raise an Exception. Please re-fit the transform with "
+                "other data and/or "
+                "parameter options."
+            )
+
+        self._is_fitted = True
+        return self
+
+    def _search_shapelets(
+        self, X, y, cases, cases_to_visit, num_train_per_class, random_state, start_time
+    ):
+        """Search the candidate shapelets of the series in cases.
+
+        Parameters
+        ----------
+        X : np.ndarray of shape [n_instances, 1, series_length]
+        y : np.ndarray of shape [n_instances]
+        cases : list of (int, class value) tuples
+            The series to extract candidates from, in the order to visit them.
+        cases_to_visit : list of (int, class value) tuples
+            All series, the candidates are evaluated against them.
+        num_train_per_class : dict
+            Number of series of each class.
+        random_state : RandomState
+            Used to sample the candidates of each series.
+        start_time : float
+            Start of the search, for the time contract.
+
+        Returns
+        -------
+        shapelet_heaps_by_class : dict of ShapeletPQ
+            The best shapelets found for each class.
+        """
+        X_lens = np.repeat(X.shape[-1], X.shape[0])
+        # note, assumes all dimensions of a case are the same
+        # length. A shapelet would not be well defined if indices do not match!
+        # may need to pad with nans here for uneq length,
+        # look at later
+
+        num_ins = len(y)
+        distinct_class_vals = class_distribution(np.asarray(y).reshape(-1, 1))[0][0]
+
+        candidates_evaluated = 0
+
+        num_series_to_visit = len(cases)
+
+        shapelet_heaps_by_class = {i: ShapeletPQ() for i in distinct_class_vals}
+
         # this dictionary will be used to store all possible starting
         # positions and shapelet lengths for a give series length. This
         # is because we enumerate all possible candidates and sample without
@@ -218,22 +352,19 @@ class ShapeletTransform(_PanelToTabularTransformer):
         # a flag to indicate if extraction should stop (contract has ended)
         time_finished = False
 
-        # max time calculating a shapelet
-        # for timing the extraction when contracting
-        start_time = time.time()
-
         def time_taken():
             return time.time() - start_time
 
+        # max time calculating a shapelet
         max_time_calc_shapelet = -1
         time_last_shapelet = time_taken()
 
         # for every series
         case_idx = 0
-        while case_idx < len(cases_to_visit):
+        while case_idx < len(cases):
 
-            series_id = cases_to_visit[case_idx][0]
-            this_class_val = cases_to_visit[case_idx][1]
+            series_id = cases[case_idx][0]
+            this_class_val = cases[case_idx][1]
 
             # minus 1 to remove this candidate from sums
             binary_ig_this_class_count = num_train_per_class[this_class_val] - 1
@@ -310,7 +441,7 @@ class ShapeletTransform(_PanelToTabularTransformer):
                     self.num_candidates_to_sample_per_case, num_candidates_per_case
                 )
                 cand_idx = list(
-                    self._random_state.choice(
+                    random_state.choice(
                         list(range(0, len(candidate_starts_and_lens))),
                         num_candidates_per_case,
                         replace=False,
@@ -579,55 +710,7 @@ class ShapeletTransform(_PanelToTabularTransformer):
                     print("Stopping search")  # noqa
                 break
 
-        # remove self similar here
-        # for each class value
-        #       get list of shapelets
-        #       sort by quality
-        #       remove self similar
-
-        self.shapelets = []
-        for class_val in distinct_class_vals:
-            by_class_descending_ig = sorted(
-                shapelet_heaps_by_class[class_val].get_array(),
-                key=itemgetter(0),
-                reverse=True,
-            )
-
-            if self.remove_self_similar and len(by_class_descending_ig) > 0:
-                by_class_descending_ig = (
-                    ShapeletTransform.remove_self_similar_shapelets(
-                        by_class_descending_ig
-                    )
-                )
-            else:
-                # need to extract shapelets from tuples
-                by_class_descending_ig = [x[2] for x in by_class_descending_ig]
-
-            # if we have more than max_shapelet_per_class, trim to that
-            # amount here
-            if len(by_class_descending_ig) > self.max_shapelets_to_store_per_class:
-                max_n = self.max_shapelets_to_store_per_class
-                by_class_descending_ig = by_class_descending_ig[:max_n]
-
-            self.shapelets.extend(by_class_descending_ig)
-
-        # final sort so that all shapelets from all classes are in
-        # descending order of information gain
-        self.shapelets.sort(key=lambda x: x.info_gain, reverse=True)
-        self.is_fitted_ = True
-
-        # warn the user if fit did not produce any valid shapelets
-        if len(self.shapelets) == 0:
-            warnings.warn(
-                "No valid shapelets were extracted from this dataset and "
-                "calling the transform method "
-                "will raise an Exception. Please re-fit the transform with "
-                "other data and/or "
-                "parameter options."
-            )
-
-        self._is_fitted = True
-        return self
+        return shapelet_heaps_by_class
 
     @staticmethod
     def remove_self_similar_shapelets(shapelet_list):
@@ -704,35 +787,18 @@ class ShapeletTransform(_PanelToTabularTransformer):
                 "data and/or parameter settings."
             )
 
-        # may need to pad with nans here for uneq length, look at later
-        output = np.zeros(
-            [len(_X), len(self.shapelets)],
-            dtype=np.float32,
-        )
-
-        # for the i^th series to transform
-        for i in range(0, len(_X)):
-            this_series = _X[i]
-
-            # get the s^th shapelet
-            for s in range(0, len(self.shapelets)):
-                # find distance between this series and each shapelet
-                min_dist = np.inf
-                this_shapelet_length = self.shapelets[s].length
-
-                for start_pos in range(
-                    0, len(this_series[0]) - this_shapelet_length + 1
-                ):
-                    comparison = ShapeletTransform.zscore(
-                        this_series[:, start_pos : (start_pos + this_shapelet_length)]
-                    )
-
-                    dist = np.linalg.norm(self.shapelets[s].data - comparison)
-                    dist = dist * dist
-                    dist = 1.0 / this_shapelet_length * dist
-                    min_dist = min(min_dist, dist)
+        # the shapelets are packed into a single array for the compiled
+        # distance computation, as for the kernels of ROCKET
+        data = np.concatenate([shapelet.data[0] for shapelet in self.shapelets])
+        lengths = np.array([shapelet.length for shapelet in self.shapelets])
 
-                    output[i][s] = min_dist
+        output = _call_with_n_jobs(
+            _shapelet_distances,
+            self.n_jobs,
+            np.ascontiguousarray(_X[:, 0], dtype=np.float64),
+            data.astype(np.float64),
+            lengths.astype(np.int64),
+        ).astype(np.float32)
 
         return pd.DataFrame(output)
 
@@ -939,6 +1005,64 @@ class ShapeletTransform(_PanelToTabularTransformer):
         return sum_dist
 
 
+@njit(parallel=True, cache=True)
+def _shapelet_distances(X, data, lengths):
+    """Distance from each series to each shapelet.
+
+    The distance is the minimum over the windows of the series of the squared
+    Euclidean distance between the z-normalised window and the shapelet,
+    divided by the shapelet length. The means and standard deviations of the
+    windows are computed from running sums once per series, and each window
+    is abandoned as soon as it is further than the best window so far,
+    comparing the largest shapelet values first.
+    """
+    n_instances, n_timepoints = X.shape
+    n_shapelets = len(lengths)
+    output = np.zeros((n_instances, n_shapelets))
+
+    for i in prange(n_instances):
+        # centre the series to limit the cancellation in the running sums
+        x = X[i] - X[i].mean()
+        sums = np.zeros(n_timepoints + 1)
+        sums_sq = np.zeros(n_timepoints + 1)
+        for t in range(n_timepoints):
+            sums[t + 1] = sums[t] + x[t]
+            sums_sq[t + 1] = sums_sq[t] + x[t] * x[t]
+        # windows with a negligible variance relative to the series are flat
+        flat_var = 1e-12 * sums_sq[n_timepoints] / n_timepoints
+
+        a = 0
+        for s in range(n_shapelets):
+            length = lengths[s]
+            shapelet = data[a : a + length]
+            a += length
+            if n_timepoints < length:
+                continue
+
+            order = np.argsort(-np.abs(shapelet))
+            # the z-normalised version of a flat window is all zeros
+            flat_dist = np.sum(shapelet * shapelet)
+            min_dist = np.inf
+            for start in range(n_timepoints - length + 1):
+                mean = (sums[start + length] - sums[start]) / length
+                var = (sums_sq[start + length] - sums_sq[start]) / length - mean * mean
+                if var <= flat_var:
+                    dist = flat_dist
+                else:
+                    std = np.sqrt(var)
+                    dist = 0.0
+                    for j in order:
+                        diff = shapelet[j] - (x[start + j] - mean) / std
+                        dist += diff * diff
+                        if dist >= min_dist:
+                            break
+                if dist < min_dist:
+                    min_dist = dist
+            output[i, s] = min_dist / length
+
+    return output
+
+
 class ContractedShapeletTransform(ShapeletTransform):
     """Contracted Shapelet Transform.
     @incollection{bostrom2017binary,
@@ -971,6 +1095,10 @@ class ContractedShapeletTransform(ShapeletTransform):
     the console (for information only) (default = 0)
     remove_self_similar                 : boolean, remove overlapping
     "self-similar" shapelets from the final transform (default = True)
+    n_jobs                              : int, the number of jobs used to
+    search the candidate shapelets in parallel in fit and the number of
+    threads used to transform the series, -1 means using all processors
+    (default = 1)
 
     Attributes
     ----------
@@ -991,6 +1119,7 @@ class ContractedShapeletTransform(ShapeletTransform):
         random_state=None,
         verbose=0,
         remove_self_similar=True,
+        n_jobs=1,
     ):
         self.num_candidates_to_sample_per_case = num_candidates_to_sample_per_case
         self.time_contract_in_mins = time_contract_in_mins
@@ -1005,6 +1134,7 @@ class ContractedShapeletTransform(ShapeletTransform):
             random_state,
             verbose,
             remove_self_similar,
+            n_jobs,
         )
 
 
@@ -11,6 +11,7 @@ from sklearn.base import clone
 from sktime.transformations.base import _PanelToPanelTransformer
 from sktime.transformations.base import _PanelToTabularTransformer
 from sktime.transformations.panel.segment import RandomIntervalSegmenter
+from sktime.utils.slope_and_trend import _slope
 from sktime.utils.validation.panel import check_X
 
 
@@ -262,8 +263,25 @@ class RandomIntervalFeatureExtractor(_PanelToTabularTransformer):
         # for transformed data
         columns = []
 
+        # cumulative sums for the features which are computed for all
+        # intervals at once
+        cumsums = None
+        starts = np.array([start for start, _ in intervals])
+        ends = np.array([end for _, end in intervals])
+
         i = 0
         for func in features:
+            interval_feature = _INTERVAL_FEATURES.get(func)
+            if interval_feature is not None:
+                if cumsums is None:
+                    cumsums = _get_cumsums(X[:, 0, :])
+                Xt[:, i : i + n_intervals] = interval_feature(cumsums, starts, ends)
+                i += n_intervals
+                columns.extend(
+                    f"{start}_{end}_{func.__name__}" for start, end in intervals
+                )
+                continue
+
             # TODO generalise to series-to-series functions and function kwargs
             for start, end in intervals:
                 interval = X[:, :, start:end]
@@ -290,6 +308,62 @@ class RandomIntervalFeatureExtractor(_PanelToTabularTransformer):
         return Xt
 
 
+def _get_cumsums(X):
+    """Cumulative sums of the series in the rows of X, their squares and
+    their products with the time index, starting with 0
+
+    The series are centred first, to reduce the cancellation of the
+    differences of the sums.
+    """
+    X = X.astype(np.float64)
+    mean = X.mean(axis=1, keepdims=True)
+    X = X - mean
+    time_index = np.arange(X.shape[1])
+    cumsums = np.zeros((3, X.shape[0], X.shape[1] + 1))
+    np.cumsum(X, axis=1, out=cumsums[0, :, 1:])
+    np.cumsum(X ** 2, axis=1, out=cumsums[1, :, 1:])
+    np.cumsum(X * time_index, axis=1, out=cumsums[2, :, 1:])
+    return mean, cumsums
+
+
+def _interval_sums(cumsums, starts, ends):
+    """Sums over the intervals, of shape (3, n_instances, n_intervals)"""
+    return cumsums[:, :, ends] - cumsums[:, :, starts]
+
+
+def _interval_mean(cumsums, starts, ends):
+    mean, cumsums = cumsums
+    return _interval_sums(cumsums[:1], starts, ends)[0] / (ends - starts) + mean
+
+
+def _interval_std(cumsums, starts, ends):
+    _, cumsums = cumsums
+    lengths = ends - starts
+    sums, squares = _interval_sums(cumsums[:2], starts, ends)
+    var = squares / lengths - (sums / lengths) ** 2
+    return np.sqrt(np.maximum(var, 0))
+
+
+def _interval_slope(cumsums, starts, ends):
+    # slope of the least-squares line over time points 1, ..., length of
+    # each interval, as computed by _slope
+    _, cumsums = cumsums
+    lengths = ends - starts
+    sums, _, time_sums = _interval_sums(cumsums, starts, ends)
+    x_mean = (lengths + 1) / 2
+    xy_mean = (time_sums - (starts - 1) * sums) / lengths
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (xy_mean - x_mean * sums / lengths) / ((lengths ** 2 - 1) / 12)
+
+
+# features computed for all intervals at once from cumulative sums
+_INTERVAL_FEATURES = {
+    np.mean: _interval_mean,
+    np.std: _interval_std,
+    _slope: _interval_slope,
+}
+
+
 class FittedParamExtractor(_PanelToTabularTransformer):
     """
     Extract parameters of a fitted forecaster as features for a subsequent
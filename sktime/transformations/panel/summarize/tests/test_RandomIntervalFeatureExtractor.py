@@ -76,8 +76,29 @@ def test_results(n_instances, n_timepoints, n_intervals):
         actual_means = Xt.loc[:, f"{start}_{end}_mean"].to_numpy().ravel()
         actual_stds = Xt.loc[:, f"{start}_{end}_std"].to_numpy().ravel()
 
-        np.testing.assert_array_equal(actual_means, expected_mean)
-        np.testing.assert_array_equal(actual_stds, expected_std)
+        # features are computed from cumulative sums, which differ from
+        # numpy's results by rounding errors
+        np.testing.assert_array_almost_equal(actual_means, expected_mean)
+        np.testing.assert_array_almost_equal(actual_stds, expected_std)
+
+
+def test_results_of_long_series_with_offset():
+    X, _ = make_classification_problem(
+        n_instances=5, n_timepoints=500, return_numpy=True, random_state=1
+    )
+    X = X + 1000
+    transformer = RandomIntervalFeatureExtractor(
+        n_intervals=50, features=[np.mean, np.std, _slope], random_state=1
+    )
+    Xt = transformer.fit_transform(X)
+    expected = np.column_stack(
+        [
+            func(X[:, 0, start:end], axis=-1)
+            for func in [np.mean, np.std, _slope]
+            for start, end in transformer.intervals_
+        ]
+    )
+    np.testing.assert_allclose(Xt.to_numpy(), expected, rtol=1e-9, atol=1e-9)
 
 
 # Test against equivalent pipelines.
@@ -146,5 +167,5 @@ def test_different_pipelines():
         random_state=random_state,
     )
     b = tran.fit_transform(X_train)
-    np.testing.assert_array_equal(a, b)
+    np.testing.assert_array_almost_equal(a, b)
     np.testing.assert_array_equal(pipe.steps[0][1].intervals_, tran.intervals_)
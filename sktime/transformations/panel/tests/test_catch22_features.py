@@ -4,6 +4,7 @@ from numpy import testing
 
 from sktime.datasets import load_gunpoint, load_basic_motions
 from sktime.transformations.panel.catch22_features import Catch22
+from sktime.utils.data_processing import from_nested_to_3d_numpy
 
 
 def test_catch22_on_gunpoint():
@@ -48,6 +49,26 @@ def test_catch22_on_basic_motions():
     testing.assert_array_almost_equal(data, catch22_basic_motions_data)
 
 
+def test_catch22_feature_selection_per_dimension_and_n_jobs():
+    X_train, y_train = load_basic_motions(split="train", return_X_y=True)
+    X = X_train.iloc[:6]
+    X_3d = from_nested_to_3d_numpy(X)
+    feature_ids = [5, "DN_HistogramMode_10", 21]
+
+    c22 = Catch22(features=feature_ids, per_dimension=True, n_jobs=2)
+    data = c22.fit_transform(X).to_numpy()
+
+    # the features of each dimension match those of the univariate series
+    assert data.shape == (6, 3 * X_3d.shape[1])
+    single = Catch22(features=feature_ids)
+    for dim in range(X_3d.shape[1]):
+        expected = single.fit_transform(X_3d[:, dim : dim + 1]).to_numpy()
+        testing.assert_array_almost_equal(data[:, 3 * dim : 3 * (dim + 1)], expected)
+    testing.assert_array_almost_equal(
+        expected, Catch22().fit_transform(X_3d[:, -1:]).to_numpy()[:, [5, 1, 21]]
+    )
+
+
 catch22_gunpoint_data = np.array(
     [
         [
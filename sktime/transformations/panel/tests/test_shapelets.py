@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from sktime.transformations.panel.shapelets import ContractedShapeletTransform
+from sktime.transformations.panel.shapelets import ShapeletTransform
+from sktime.transformations.panel.shapelets import (
+    _RandomEnumerationShapeletTransform,
+)
+from sktime.utils._testing.panel import make_classification_problem
+
+
+def _reference_transform(shapelets, X):
+    # re-normalise every window and compare it with every shapelet
+    output = np.zeros((len(X), len(shapelets)))
+    for i, series in enumerate(X):
+        for s, shapelet in enumerate(shapelets):
+            output[i, s] = min(
+                np.sum(
+                    (
+                        shapelet.data
+                        - ShapeletTransform.zscore(
+                            series[:, start : start + shapelet.length]
+                        )
+                    )
+                    ** 2
+                )
+                / shapelet.length
+                for start in range(series.shape[1] - shapelet.length + 1)
+            )
+    return output
+
+
+def test_transform_matches_reference():
+    X, y = make_classification_problem(
+        n_instances=10, n_timepoints=30, return_numpy=True, random_state=1
+    )
+    # flat windows are z-normalised to zeros
+    X[0, 0, 5:15] = 1.0
+    st = ContractedShapeletTransform(
+        time_contract_in_mins=0.05,
+        max_shapelet_length=15,
+        random_state=0,
+    )
+    st.fit(X, y)
+
+    expected = _reference_transform(st.shapelets, X)
+    assert_array_almost_equal(st.transform(X).to_numpy(), expected, decimal=5)
+
+    st.n_jobs = 2
+    assert_array_almost_equal(st.transform(X).to_numpy(), expected, decimal=5)
+
+
+def test_parallel_search_matches_sequential_search():
+    X, y = make_classification_problem(
+        n_instances=10, n_timepoints=20, return_numpy=True, random_state=1
+    )
+    params = dict(
+        min_shapelet_length=8,
+        max_shapelet_length=10,
+        max_shapelets_to_store_per_class=5,
+        remove_self_similar=False,
+    )
+    sequential = ShapeletTransform(**params).fit(X, y)
+    parallel = ShapeletTransform(n_jobs=2, **params).fit(X, y)
+
+    # the full search evaluates the same candidates, the order of the
+    # shapelets with the same information gain may differ
+    assert_array_almost_equal(
+        [s.info_gain for s in sequential.shapelets],
+        [s.info_gain for s in parallel.shapelets],
+    )
+
+
+def test_parallel_contracted_search():
+    X, y = make_classification_problem(
+        n_instances=10, n_timepoints=20, return_numpy=True, random_state=1
+    )
+    st = ContractedShapeletTransform(
+        time_contract_in_mins=0.05, random_state=0, n_jobs=2
+    ).fit(X, y)
+
+    assert len(st.shapelets) > 0
+    assert st.transform(X).shape == (10, len(st.shapelets))
+
+
+def test_parallel_random_search_visits_same_cases():
+    X, y = make_classification_problem(
+        n_instances=12, n_timepoints=20, return_numpy=True, random_state=1
+    )
+
+    def series_ids(n_jobs):
+        st = _RandomEnumerationShapeletTransform(
+            min_shapelet_length=8,
+            max_shapelet_length=10,
+            remove_self_similar=False,
+            random_state=0,
+            n_jobs=n_jobs,
+        )
+        st.num_cases_to_sample = 4
+        st.num_candidates_to_sample_per_case = 5
+        st.fit(X, y)
+        return {shapelet.series_id for shapelet in st.shapelets}
+
+    sequential = series_ids(1)
+    assert len(sequential) == 4
+    assert series_ids(2) == sequential
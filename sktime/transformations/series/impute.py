@@ -6,8 +6,11 @@ __all__ = ["Imputer"]
 
 from sktime.transformations.base import _SeriesToSeriesTransformer
 from sktime.utils.validation.series import check_series
-from sktime.forecasting.trend import PolynomialTrendForecaster
+from sklearn.base import clone
+from sklearn.linear_model import LinearRegression
 from sklearn.utils import check_random_state
+from joblib import Parallel
+from joblib import delayed
 
 import numpy as np
 import pandas as pd
@@ -41,6 +44,11 @@ class Imputer(_SeriesToSeriesTransformer):
         as heuristic.
     random_state : int/float/str, optional
         Value to set random.seed() if method="random", default None
+    n_jobs : int or None, optional (default=None)
+        The number of jobs to fit the forecaster to the columns of a
+        pd.DataFrame in parallel if method="forecaster". ``None`` means 1
+        unless in a :obj:`joblib.parallel_backend` context. ``-1`` means
+        using all processors.
 
     Example
     ----------
@@ -64,6 +72,7 @@ class Imputer(_SeriesToSeriesTransformer):
         value=None,
         forecaster=None,
         missing_values=None,
+        n_jobs=None,
     ):
 
         self.method = method
@@ -71,6 +80,7 @@ class Imputer(_SeriesToSeriesTransformer):
         self.value = value
         self.forecaster = forecaster
         self.random_state = random_state
+        self.n_jobs = n_jobs
         super(Imputer, self).__init__()
 
     def transform(self, Z, X=None):
@@ -94,38 +104,24 @@ class Imputer(_SeriesToSeriesTransformer):
         if self.missing_values:
             Z = Z.replace(to_replace=self.missing_values, value=np.nan)
 
+        if not Z.isnull().values.any():
+            # check_series does not copy, the input is never returned
+            return Z.copy()
+
         if self.method == "random":
-            if isinstance(Z, pd.DataFrame):
-                for col in Z:
-                    Z[col] = Z[col].apply(
-                        lambda i: self._get_random(Z[col]) if np.isnan(i) else i
-                    )
-            else:
-                Z = Z.apply(lambda i: self._get_random(Z) if np.isnan(i) else i)
+            Z = Z.fillna(value=self._get_random(Z))
         elif self.method == "constant":
             Z = Z.fillna(value=self.value)
         elif self.method in ["backfill", "bfill", "pad", "ffill"]:
             Z = Z.fillna(method=self.method)
         elif self.method in ["drift", "forecaster"]:
-            if self.method == "forecaster":
-                forecaster = self.forecaster
-            else:
-                forecaster = PolynomialTrendForecaster(degree=1)
-            # in-sample forecasting horizon
-            fh_ins = -np.arange(len(Z))
             # fill NaN before fitting with ffill and backfill (heuristic)
-            Z = Z.fillna(method="ffill").fillna(method="backfill")
-            # multivariate
-            if isinstance(Z, pd.DataFrame):
-                for col in Z:
-                    forecaster.fit(y=Z[col])
-                    Z_pred = forecaster.predict(fh=fh_ins)
-                    Z[col] = Z[col].fillna(value=Z_pred)
-            # univariate
+            Z_filled = Z.fillna(method="ffill").fillna(method="backfill")
+            if self.method == "forecaster":
+                Z_pred = self._predict_in_sample(Z_filled)
             else:
-                forecaster.fit(y=Z)
-                Z_pred = forecaster.predict(fh=fh_ins)
-                Z = Z.fillna(value=Z_pred)
+                Z_pred = _predict_drift_in_sample(Z_filled)
+            Z = Z.fillna(value=Z_pred)
         elif self.method == "mean":
             Z = Z.fillna(value=Z.mean())
         elif self.method == "median":
@@ -136,7 +132,8 @@ class Imputer(_SeriesToSeriesTransformer):
             raise ValueError(f"method {self.method} not available")
         # fill first/last elements of series,
         # as some methods (e.g. "linear") cant impute those
-        Z = Z.fillna(method="ffill").fillna(method="backfill")
+        if Z.isnull().values.any():
+            Z = Z.fillna(method="ffill").fillna(method="backfill")
         return Z
 
     def _check_method(self):
@@ -164,16 +161,57 @@ class Imputer(_SeriesToSeriesTransformer):
             pass
 
     def _get_random(self, Z):
-        """Create a random int or float value
+        """Create random int or float values for the missing values
 
-        :param Z: Series
-        :type Z: pd.Series
-        :return: Random int or float between min and max of Z
-        :rtype: int/float
+        :param Z: Series or DataFrame
+        :type Z: pd.Series, pd.DataFrame
+        :return: Random int or float values between min and max of each
+            series at its missing values, and nan elsewhere
+        :rtype: pd.Series, pd.DataFrame
         """
         rng = check_random_state(self.random_state)
-        # check if series contains only int or int-like values (e.g. 3.0)
-        if (Z.dropna() % 1 == 0).all():
-            return rng.randint(Z.min(), Z.max())
-        else:
-            return rng.uniform(Z.min(), Z.max())
+        values = Z.to_numpy(dtype=np.float64).reshape(len(Z), -1)
+        mask = np.isnan(values)
+        random = np.full(values.shape, np.nan)
+        for i in np.flatnonzero(mask.any(axis=0) & ~mask.all(axis=0)):
+            series = values[~mask[:, i], i]
+            low, high = series.min(), series.max()
+            n_missing = len(values) - len(series)
+            # check if series contains only int or int-like values (e.g. 3.0)
+            if np.all(series % 1 == 0):
+                random[mask[:, i], i] = rng.randint(int(low), int(high), n_missing)
+            else:
+                random[mask[:, i], i] = rng.uniform(low, high, n_missing)
+
+        if isinstance(Z, pd.DataFrame):
+            return pd.DataFrame(random, index=Z.index, columns=Z.columns)
+        return pd.Series(random[:, 0], index=Z.index, name=Z.name)
+
+    def _predict_in_sample(self, Z):
+        """Fit the forecaster to each series and predict it in-sample"""
+        if isinstance(Z, pd.Series):
+            return _predict_in_sample(clone(self.forecaster), Z)
+
+        # fit the columns in parallel
+        Z_pred = Parallel(n_jobs=self.n_jobs)(
+            delayed(_predict_in_sample)(clone(self.forecaster), Z[col]) for col in Z
+        )
+        return pd.concat(Z_pred, axis=1, keys=Z.columns)
+
+
+def _predict_in_sample(forecaster, y):
+    # in-sample forecasting horizon
+    fh_ins = -np.arange(len(y))
+    forecaster.fit(y=y)
+    return forecaster.predict(fh=fh_ins)
+
+
+def _predict_drift_in_sample(Z):
+    """Fit a linear trend to all series at once and predict them in-sample,
+    as sktime.PolynomialTrendForecaster(degree=1) does for each series"""
+    values = Z.to_numpy(dtype=np.float64).reshape(len(Z), -1)
+    X = np.arange(len(Z)).reshape(-1, 1)
+    pred = LinearRegression().fit(X, values).predict(X)
+    if isinstance(Z, pd.DataFrame):
+        return pd.DataFrame(pred, index=Z.index, columns=Z.columns)
+    return pd.Series(pred[:, 0], index=Z.index, name=Z.name)
@@ -6,11 +6,12 @@ __all__ = ["HampelFilter"]
 
 from sktime.transformations.base import _SeriesToSeriesTransformer
 from sktime.utils.validation.series import check_series
-from sktime.forecasting.model_selection import SlidingWindowSplitter
 
 import numpy as np
 import warnings
 import pandas as pd
+from numba import njit
+from numba import prange
 
 
 class HampelFilter(_SeriesToSeriesTransformer):
@@ -74,26 +75,12 @@ class HampelFilter(_SeriesToSeriesTransformer):
         """
         self.check_is_fitted()
         Z = check_series(Z)
+        if len(Z) <= self.window_length:
+            raise ValueError(
+                f"The series must be longer than `window_length`, but found "
+                f"`window_length`={self.window_length} and len(Z)={len(Z)}."
+            )
 
-        # multivariate
-        if isinstance(Z, pd.DataFrame):
-            for col in Z:
-                Z[col] = self._transform_series(Z[col])
-        # univariate
-        else:
-            Z = self._transform_series(Z)
-        return Z
-
-    def _transform_series(self, Z):
-        """
-        Parameters
-        ----------
-        Z : pd.Series
-
-        Returns
-        -------
-        pd.Series
-        """
         # warn if nan values in Series, as user might mix them
         # up with outliers otherwise
         if Z.isnull().values.any():
@@ -102,63 +89,74 @@ class HampelFilter(_SeriesToSeriesTransformer):
                 added if there are outliers"""
             )
 
-        cv = SlidingWindowSplitter(
-            window_length=self.window_length, step_length=1, start_with_window=True
-        )
-        half_window_length = int(self.window_length / 2)
-
-        Z = _hampel_filter(
-            Z=Z,
-            cv=cv,
+        # filter all series at once, as columns of a copied 2d array
+        values = np.array(Z.to_numpy(dtype=np.float64).reshape(len(Z), -1), order="F")
+        values = _hampel_filter(
+            values,
+            window_length=self.window_length,
             n_sigma=self.n_sigma,
-            half_window_length=half_window_length,
+            half_window_length=int(self.window_length / 2),
             k=self.k,
         )
 
         # data post-processing
         if self.return_bool:
-            Z = Z.apply(lambda x: True if np.isnan(x) else False)
-
-        return Z
+            values = np.isnan(values)
 
+        # multivariate
+        if isinstance(Z, pd.DataFrame):
+            return pd.DataFrame(values, index=Z.index, columns=Z.columns)
+        # univariate
+        else:
+            return pd.Series(values[:, 0], index=Z.index, name=Z.name)
 
-def _hampel_filter(Z, cv, n_sigma, half_window_length, k):
-    for i in cv.split(Z):
-        cv_window = i[0]
-        cv_median = np.nanmedian(Z[cv_window])
-        cv_sigma = k * np.nanmedian(np.abs(Z[cv_window] - cv_median))
-
-        # find outliers at start and end of z
-        if (
-            cv_window[0] <= half_window_length
-            or cv_window[-1] >= len(Z) - half_window_length
-        ) and (cv_window[0] in [0, len(Z) - cv.window_length - 1]):
 
-            # first half of the first window
-            if cv_window[0] <= half_window_length:
-                idx_range = range(cv_window[0], half_window_length + 1)
+@njit(parallel=True, cache=True)
+def _hampel_filter(Z, window_length, n_sigma, half_window_length, k):
+    """Filter the columns of Z in place with a window sliding over them.
 
-            # last half of the last window
+    Outliers are replaced by nan as the window slides, so that they are
+    ignored in the windows which follow.
+    """
+    n_timepoints, n_columns = Z.shape
+    for c in prange(n_columns):
+        z = Z[:, c]
+        # windows of all but the last time point, with a step length of 1
+        for start in range(n_timepoints - window_length):
+            end = start + window_length - 1
+            window = z[start : end + 1]
+            cv_median = np.nanmedian(window)
+            cv_sigma = k * np.nanmedian(np.abs(window - cv_median))
+
+            # find outliers at start and end of z
+            if (
+                start <= half_window_length or end >= n_timepoints - half_window_length
+            ) and (start == 0 or start == n_timepoints - window_length - 1):
+                # first half of the first window
+                if start <= half_window_length:
+                    idx_start, idx_end = start, half_window_length + 1
+
+                # last half of the last window
+                else:
+                    idx_start, idx_end = (
+                        n_timepoints - half_window_length - 1,
+                        n_timepoints,
+                    )
             else:
-                idx_range = range(len(Z) - half_window_length - 1, len(Z))
-            for j in idx_range:
-                Z.iloc[j] = _compare(
-                    value=Z.iloc[j],
+                idx_start = start + half_window_length
+                idx_end = idx_start + 1
+
+            for j in range(idx_start, idx_end):
+                z[j] = _compare(
+                    value=z[j],
                     cv_median=cv_median,
                     cv_sigma=cv_sigma,
                     n_sigma=n_sigma,
                 )
-        else:
-            idx = cv_window[0] + half_window_length
-            Z.iloc[idx] = _compare(
-                value=Z.iloc[idx],
-                cv_median=cv_median,
-                cv_sigma=cv_sigma,
-                n_sigma=n_sigma,
-            )
     return Z
 
 
+@njit(cache=True)
 def _compare(value, cv_median, cv_sigma, n_sigma):
     """Function to identify an outlier
 
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3 -u
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sktime.forecasting.naive import NaiveForecaster
+from sktime.forecasting.trend import PolynomialTrendForecaster
+from sktime.transformations.series.impute import Imputer
+from sktime.utils._testing.forecasting import make_forecasting_problem
+
+
+def _make_data():
+    y = make_forecasting_problem(n_timepoints=50)
+    rng = np.random.RandomState(42)
+    X = pd.DataFrame(
+        {
+            "a": y,
+            "b": y.to_numpy()[::-1],
+            "c": rng.randint(0, 10, size=len(y)).astype(np.float64),
+            "d": np.arange(len(y)),
+        },
+        index=y.index,
+    )
+    X.iloc[[0, 5, 6, 20, 49], :3] = np.nan
+    X.iloc[[10, 30], 1] = np.nan
+    return X
+
+
+@pytest.mark.parametrize(
+    "method, forecaster",
+    [("drift", None), ("forecaster", NaiveForecaster(strategy="mean"))],
+)
+def test_impute_in_sample_predictions(method, forecaster):
+    X = _make_data()
+    Xt = Imputer(method=method, forecaster=forecaster).fit_transform(X)
+
+    # missing values are filled with the in-sample predictions of the
+    # forecaster fitted to each series filled with ffill and bfill, and
+    # remaining ones with ffill and bfill
+    if forecaster is None:
+        forecaster = PolynomialTrendForecaster(degree=1)
+    X_filled = X.fillna(method="ffill").fillna(method="bfill")
+    for col in X:
+        forecaster.fit(X_filled[col])
+        y_pred = forecaster.predict(fh=-np.arange(len(X)))
+        expected = X[col].fillna(y_pred).fillna(method="ffill").fillna(method="bfill")
+        np.testing.assert_allclose(Xt[col], expected)
+    assert Xt["d"].dtype == X["d"].dtype
+
+    if method == "forecaster":
+        imputer = Imputer(method=method, forecaster=forecaster, n_jobs=2)
+        pd.testing.assert_frame_equal(imputer.fit_transform(X), Xt)
+
+
+def test_impute_random():
+    X = _make_data()
+    Xt = Imputer(method="random", random_state=0).fit_transform(X)
+
+    assert not Xt.isnull().values.any()
+    pd.testing.assert_frame_equal(Xt[X.notnull()], X)
+    for col in X:
+        assert X[col].min() <= Xt[col].min() and Xt[col].max() <= X[col].max()
+    # int-like series are filled with int values
+    assert np.all(Xt["c"] % 1 == 0)
+
+
+def test_impute_without_missing_values_returns_copy():
+    y = make_forecasting_problem(n_timepoints=50)
+    yt = Imputer(method="mean").fit_transform(y)
+
+    assert yt is not y
+    pd.testing.assert_series_equal(yt, y)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3 -u
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sktime.transformations.series.outlier_detection import HampelFilter
+from sktime.utils._testing.forecasting import make_forecasting_problem
+
+
+def _reference_hampel_filter(z, window_length, n_sigma=3, k=1.4826):
+    # slide the window one time point at a time, outliers found in previous
+    # windows are ignored in the following ones
+    z = z.copy()
+    n_timepoints = len(z)
+    half = int(window_length / 2)
+    for start in range(n_timepoints - window_length):
+        window = z[start : start + window_length]
+        median = np.nanmedian(window)
+        sigma = k * np.nanmedian(np.abs(window - median))
+        if start == 0:
+            idx = range(0, half + 1)
+        elif start == n_timepoints - window_length - 1 and half >= 2:
+            idx = range(n_timepoints - half - 1, n_timepoints)
+        else:
+            idx = [start + half]
+        for j in idx:
+            if np.abs(z[j] - median) > n_sigma * sigma:
+                z[j] = np.nan
+    return z
+
+
+@pytest.mark.parametrize("window_length", [3, 4, 10])
+@pytest.mark.parametrize("return_bool", [True, False])
+def test_hampel_filter_against_reference(window_length, return_bool):
+    y = make_forecasting_problem(n_timepoints=50)
+    y.iloc[[0, 7, 20, 21, 48]] *= 10
+    y.iloc[30] = np.nan
+    X = pd.DataFrame({"a": y, "b": y.iloc[::-1].to_numpy()}, index=y.index)
+    X_copy = X.copy()
+
+    transformer = HampelFilter(window_length=window_length, return_bool=return_bool)
+    with pytest.warns(UserWarning, match="nan values"):
+        Xt = transformer.fit_transform(X)
+    expected = np.column_stack(
+        [
+            _reference_hampel_filter(X[col].to_numpy(), window_length)
+            for col in X.columns
+        ]
+    )
+    if return_bool:
+        expected = np.isnan(expected)
+    np.testing.assert_array_equal(Xt.to_numpy(), expected)
+
+    # the input is not modified and series are filtered as the columns of a
+    # data frame
+    pd.testing.assert_frame_equal(X, X_copy)
+    with pytest.warns(UserWarning, match="nan values"):
+        yt = transformer.fit_transform(y)
+    pd.testing.assert_series_equal(yt, Xt["a"], check_names=False)
@@ -2,6 +2,7 @@
 import itertools
 import os
 import textwrap
+import warnings
 
 import numpy as np
 import pandas as pd
@@ -740,6 +741,280 @@ def load_from_tsfile_to_dataframe(
         raise TsFileParseException("empty file")
 
 
+def load_from_tsfile_to_numpy(
+    full_file_path_and_name,
+    replace_missing_vals_with="NaN",
+    return_ragged=False,
+):
+    """Loads data from a .ts file into numpy arrays.
+
+    Unlike `load_from_tsfile_to_dataframe`, the values of all series are
+    parsed in bulk and stored directly in numpy arrays, without creating a
+    nested DataFrame. Files with timestamps are not supported.
+
+    Parameters
+    ----------
+    full_file_path_and_name: str
+        The full pathname of the .ts file to read.
+    replace_missing_vals_with: str
+       The value that missing values in the text file should be replaced
+       with prior to parsing.
+    return_ragged: bool
+        If False, the series must all have the same length and are returned
+        in a 3D numpy array. If True, the series are returned in ragged
+        format, which allows for series of unequal length.
+
+    Returns
+    -------
+    X : ndarray or tuple of ndarrays
+        If not return_ragged, a 3D numpy array of shape (n_instances,
+        n_dimensions, series_length). If return_ragged, a tuple (values,
+        offsets) of the values of all series concatenated in a 1D array and
+        a 2D array of shape (n_instances, n_dimensions + 1), so that dimension
+        j of instance i is given by values[offsets[i, j]:offsets[i, j + 1]].
+    y : ndarray
+        The class values, only returned if the file has class labels.
+    """
+    chunks = list(
+        _parse_tsfile_chunks(
+            full_file_path_and_name,
+            chunk_size=None,
+            replace_missing_vals_with=replace_missing_vals_with,
+        )
+    )
+    if len(chunks) == 0:
+        raise TsFileParseException("file contained metadata but no data")
+
+    values = np.concatenate([chunk[0] for chunk in chunks])
+    lengths = np.concatenate([chunk[1] for chunk in chunks])
+    X = _to_numpy_format(values, lengths, return_ragged)
+
+    if chunks[0][2] is None:
+        return X
+    return X, np.concatenate([chunk[2] for chunk in chunks])
+
+
+def iter_tsfile_chunks(
+    full_file_path_and_name,
+    chunk_size=1000,
+    replace_missing_vals_with="NaN",
+    return_ragged=False,
+):
+    """Iterates over the data of a .ts file in chunks of instances.
+
+    Only one chunk of instances is held in memory at a time, which allows to
+    process files which are too large to be loaded at once. Files with
+    timestamps are not supported.
+
+    Parameters
+    ----------
+    full_file_path_and_name: str
+        The full pathname of the .ts file to read.
+    chunk_size: int
+        The number of instances in each chunk, the last chunk may contain
+        fewer instances.
+    replace_missing_vals_with: str
+       The value that missing values in the text file should be replaced
+       with prior to parsing.
+    return_ragged: bool
+        If False, the series of a chunk must all have the same length and are
+        returned in a 3D numpy array. If True, the series are returned in
+        ragged format, as in `load_from_tsfile_to_numpy`.
+
+    Yields
+    ------
+    X : ndarray or tuple of ndarrays
+        The series of the instances of the chunk, as returned by
+        `load_from_tsfile_to_numpy`.
+    y : ndarray or None
+        The class values of the instances of the chunk, None if the file
+        has no class labels.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"`chunk_size` must be positive, but found: {chunk_size}")
+
+    for values, lengths, y in _parse_tsfile_chunks(
+        full_file_path_and_name, chunk_size, replace_missing_vals_with
+    ):
+        yield _to_numpy_format(values, lengths, return_ragged), y
+
+
+def _parse_tsfile_chunks(
+    full_file_path_and_name, chunk_size, replace_missing_vals_with
+):
+    """Parse the data of a .ts file in chunks of instances, yielding the
+    concatenated values of the series, their lengths with shape (n_instances,
+    n_dimensions) and the class values (or None) of each chunk."""
+    with open(full_file_path_and_name, "r", encoding="utf-8") as file:
+        class_labels, line_num = _read_tsfile_header(file)
+
+        num_dimensions = None
+        lines = []
+        for line in file:
+            line_num += 1
+            line = line.strip().lower()
+            if not line:
+                continue
+            if line.startswith("@"):
+                raise TsFileParseException("metadata must come before data")
+            lines.append((line_num, line))
+
+            if chunk_size is not None and len(lines) == chunk_size:
+                chunk = _parse_tsfile_lines(
+                    lines,
+                    num_dimensions,
+                    class_labels,
+                    replace_missing_vals_with,
+                )
+                num_dimensions = chunk[1].shape[1]
+                yield chunk
+                lines = []
+
+        if lines:
+            yield _parse_tsfile_lines(
+                lines,
+                num_dimensions,
+                class_labels,
+                replace_missing_vals_with,
+            )
+
+
+def _read_tsfile_header(file):
+    """Read the metadata of a .ts file up to the "@data" tag, returning
+    whether the file has class labels and the number of lines read."""
+    required_tags = ("@problemname", "@timestamps", "@univariate", "@classlabel")
+    tags = set()
+    class_labels = False
+    line_num = 0
+    for line in file:
+        line_num += 1
+        line = line.strip().lower()
+        # comments and lines of unsupported metadata are ignored
+        if not line.startswith("@"):
+            continue
+
+        tokens = line.split(" ")
+        tag = next((tag for tag in required_tags if line.startswith(tag)), None)
+        if tag == "@problemname":
+            if len(tokens) == 1:
+                raise TsFileParseException(
+                    "problemname tag requires an associated value"
+                )
+
+        elif tag in ("@timestamps", "@univariate"):
+            if len(tokens) != 2:
+                raise TsFileParseException(
+                    tag[1:] + " tag requires an associated Boolean value"
+                )
+            if tokens[1] not in ("true", "false"):
+                raise TsFileParseException("invalid " + tag[1:] + " value")
+            if tag == "@timestamps" and tokens[1] == "true":
+                raise NotImplementedError(
+                    "Files with timestamps are not supported, use "
+                    "`load_from_tsfile_to_dataframe` instead."
+                )
+
+        elif tag == "@classlabel":
+            if len(tokens) == 1:
+                raise TsFileParseException(
+                    "classlabel tag requires an associated Boolean value"
+                )
+            if tokens[1] not in ("true", "false"):
+                raise TsFileParseException("invalid classLabel value")
+            class_labels = tokens[1] == "true"
+            if len(tokens) == 2 and class_labels:
+                raise TsFileParseException(
+                    "if the classlabel tag is true then class values must be supplied"
+                )
+
+        elif line.startswith("@data"):
+            if line != "@data":
+                raise TsFileParseException(
+                    "data tag should not have an associated value"
+                )
+            if len(tags) < len(required_tags):
+                raise TsFileParseException("metadata incomplete")
+            return class_labels, line_num
+
+        if tag is not None:
+            tags.add(tag)
+
+    if line_num == 0:
+        raise TsFileParseException("empty file")
+    raise TsFileParseException("metadata incomplete")
+
+
+def _parse_tsfile_lines(lines, num_dimensions, class_labels, replace_missing_vals_with):
+    """Parse lines of data of a .ts file without timestamps"""
+    dimensions = []
+    lengths = []
+    class_vals = []
+    for line_num, line in lines:
+        line_dimensions = line.replace("?", replace_missing_vals_with).split(":")
+        if class_labels:
+            class_vals.append(line_dimensions.pop().strip())
+
+        if num_dimensions is None:
+            num_dimensions = len(line_dimensions)
+        if len(line_dimensions) != num_dimensions:
+            raise TsFileParseException(
+                "inconsistent number of dimensions. "
+                "Expecting "
+                + str(num_dimensions)
+                + " but have read "
+                + str(len(line_dimensions))
+            )
+
+        for dimension in line_dimensions:
+            dimension = dimension.strip()
+            if dimension:
+                dimensions.append(dimension)
+                lengths.append(dimension.count(",") + 1)
+            else:
+                lengths.append(0)
+
+    # tokenize the values of all series of the chunk at once, numpy warns
+    # about and stops at the first value it cannot parse
+    lengths = np.array(lengths, dtype=np.int64).reshape(len(lines), num_dimensions)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            values = np.fromstring(",".join(dimensions), dtype=np.float64, sep=",")
+        except (DeprecationWarning, ValueError):
+            values = None
+    if values is None or len(values) != lengths.sum():
+        raise TsFileParseException(
+            "invalid value in the data on lines "
+            + str(lines[0][0])
+            + " to "
+            + str(lines[-1][0])
+        )
+    y = np.asarray(class_vals) if class_labels else None
+    return values, lengths, y
+
+
+def _to_numpy_format(values, lengths, return_ragged):
+    """Convert the concatenated values and lengths of series into a 3D numpy
+    array or into ragged format."""
+    if return_ragged:
+        offsets = np.zeros(lengths.size + 1, dtype=np.int64)
+        np.cumsum(lengths.ravel(), out=offsets[1:])
+        n_instances, n_dimensions = lengths.shape
+        # the end of the last dimension of an instance is the start of the
+        # first dimension of the next one
+        index = np.arange(n_instances)[:, np.newaxis] * n_dimensions + np.arange(
+            n_dimensions + 1
+        )
+        return values, offsets[index]
+
+    if np.any(lengths != lengths.flat[0]):
+        raise TsFileParseException(
+            "the series have unequal lengths, use return_ragged=True to load "
+            "series of unequal length"
+        )
+    return values.reshape(lengths.shape + (lengths.flat[0],))
+
+
 def load_from_arff_to_dataframe(
     full_file_path_and_name,
     has_class_labels=True,
@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
 
+import weakref
+from collections import OrderedDict
+
 import numpy as np
 import pandas as pd
 
@@ -43,7 +46,14 @@ def are_columns_nested(X):
         If True, at least one column is nested.
         If False, no nested columns.
     """
-    any_nested = _nested_cell_mask(X).any().values
+    # stop checking a column at its first nested cell
+    any_nested = np.array(
+        [
+            any(_cell_is_series_or_array(cell) for cell in X.iloc[:, i].to_numpy())
+            for i in range(X.shape[1])
+        ],
+        dtype=bool,
+    )
     return any_nested
 
 
@@ -770,11 +780,23 @@ def _convert_series_cell_to_numpy(cell):
         return cell
 
 
+# 3d NumPy arrays converted from nested DataFrames, by id of the DataFrame,
+# so that repeated conversions of the same data, e.g. by the components of
+# an ensemble, do not convert it again
+_NESTED_TO_3D_NUMPY_CACHE = OrderedDict()
+_NESTED_TO_3D_NUMPY_CACHE_SIZE = 8
+
+
 def from_nested_to_3d_numpy(X):
     """Convert nested pandas DataFrame (with time series as pandas Series
     in cells) into NumPy ndarray with shape
     (n_instances, n_columns, n_timepoints).
 
+    The converted array of a DataFrame is cached as long as the DataFrame
+    exists, and is re-used while the DataFrame has the same shape and
+    cells. Values of cells must therefore not be modified in place between
+    conversions.
+
     Parameters
     ----------
     X : pd.DataFrame
@@ -785,15 +807,22 @@ def from_nested_to_3d_numpy(X):
     X_3d : np.ndarrray
         3-dimensional NumPy array
     """
-    # n_instances, n_columns = X.shape
-    # n_timepoints = X.iloc[0, 0].shape[0]
-    # array = np.empty((n_instances, n_columns, n_timepoints))
-    # for column in range(n_columns):
-    #     array[:, column, :] = X.iloc[:, column].tolist()
-    # return array
+    cells = X.to_numpy() if isinstance(X, pd.DataFrame) else None
+    if cells is not None:
+        X_3d = _get_cached_3d_numpy(X, cells)
+        if X_3d is not None:
+            return X_3d.copy()
+
     if not is_nested_dataframe(X):
         raise ValueError("Input DataFrame is not a nested DataFrame")
 
+    # If all cells are series of the same length, copy them into the
+    # array in a single pass
+    X_3d = _from_equal_length_cells_to_3d_numpy(cells)
+    if X_3d is not None:
+        _cache_3d_numpy(X, cells, X_3d)
+        return X_3d.copy()
+
     # n_columns = X.shape[1]
     nested_col_mask = [*are_columns_nested(X)]
 
@@ -818,6 +847,60 @@ def from_nested_to_3d_numpy(X):
     return X_3d
 
 
+def _from_equal_length_cells_to_3d_numpy(cells):
+    """Convert cells to 3d NumPy array, or return None if not all cells are
+    1d series of the same length"""
+    n_instances, n_columns = cells.shape
+    arrays = [_convert_series_cell_to_numpy(cell) for cell in cells.ravel()]
+    if len(arrays) == 0 or not all(
+        isinstance(a, np.ndarray) and a.ndim == 1 for a in arrays
+    ):
+        return None
+    n_timepoints = arrays[0].shape[0]
+    if any(a.shape[0] != n_timepoints for a in arrays):
+        return None
+
+    dtype = np.result_type(*{a.dtype for a in arrays})
+    X_3d = np.empty((n_instances, n_columns, n_timepoints), dtype=dtype)
+    np.concatenate(arrays, out=X_3d.reshape(-1))
+    return X_3d
+
+
+def _get_cached_3d_numpy(X, cells):
+    entry = _NESTED_TO_3D_NUMPY_CACHE.get(id(X))
+    if entry is None:
+        return None
+    ref, shape, cell_ids, X_3d = entry
+    if ref() is not X or shape != X.shape or cell_ids != _get_ids(cells):
+        return None
+    _NESTED_TO_3D_NUMPY_CACHE.move_to_end(id(X))
+    return X_3d
+
+
+def _cache_3d_numpy(X, cells, X_3d):
+    key = id(X)
+
+    def _remove(ref):
+        # remove the entry when the DataFrame is garbage collected
+        entry = _NESTED_TO_3D_NUMPY_CACHE.get(key)
+        if entry is not None and entry[0] is ref:
+            del _NESTED_TO_3D_NUMPY_CACHE[key]
+
+    _NESTED_TO_3D_NUMPY_CACHE[key] = (
+        weakref.ref(X, _remove),
+        X.shape,
+        _get_ids(cells),
+        X_3d,
+    )
+    _NESTED_TO_3D_NUMPY_CACHE.move_to_end(key)
+    while len(_NESTED_TO_3D_NUMPY_CACHE) > _NESTED_TO_3D_NUMPY_CACHE_SIZE:
+        _NESTED_TO_3D_NUMPY_CACHE.popitem(last=False)
+
+
+def _get_ids(cells):
+    return list(map(id, cells.ravel()))
+
+
 def from_3d_numpy_to_nested(X, column_names=None, cells_as_numpy=False):
     """Convert NumPy ndarray with shape (n_instances, n_columns, n_timepoints)
     into nested pandas DataFrame (with time series as pandas Series in cells)
@@ -839,12 +922,9 @@ def from_3d_numpy_to_nested(X, column_names=None, cells_as_numpy=False):
     -------
     df : pd.DataFrame
     """
-    df = pd.DataFrame()
     # n_instances, n_variables, _ = X.shape
     n_instances, n_columns, n_timepoints = X.shape
 
-    container = np.array if cells_as_numpy else pd.Series
-
     if column_names is None:
         column_names = _make_column_names(n_columns)
 
@@ -858,8 +938,27 @@ def from_3d_numpy_to_nested(X, column_names=None, cells_as_numpy=False):
             )
             raise ValueError(msg)
 
-    for j, column in enumerate(column_names):
-        df[column] = [container(X[instance, j, :]) for instance in range(n_instances)]
+    if cells_as_numpy:
+        # cells are views on a single copy of the array
+        X = np.array(X)
+
+        def container(values):
+            return values
+
+    else:
+        # cells share the same time index
+        index = pd.RangeIndex(n_timepoints)
+
+        def container(values):
+            return pd.Series(values, index=index, copy=False)
+
+    df = pd.DataFrame(
+        {
+            column: [container(X[instance, j, :]) for instance in range(n_instances)]
+            for j, column in enumerate(column_names)
+        },
+        columns=column_names,
+    )
     return df
 
 
@@ -4,11 +4,15 @@ import tempfile
 import pytest
 import numpy as np
 import pandas as pd
+import sktime
 from sktime.utils.data_io import TsFileParseException
+from sktime.utils.data_io import iter_tsfile_chunks
 from sktime.utils.data_io import load_from_tsfile_to_dataframe
+from sktime.utils.data_io import load_from_tsfile_to_numpy
 from sktime.utils.data_io import load_from_long_to_dataframe
 from sktime.utils.data_io import LongFormatDataParseException
 from sktime.utils.data_io import generate_example_long_table
+from sktime.utils.data_processing import from_nested_to_3d_numpy
 
 
 def test_load_from_tsfile_to_dataframe():
@@ -975,6 +979,78 @@ def test_load_from_tsfile_to_dataframe():
         os.remove(path)
 
 
+def _get_ts_path(name, split):
+    return os.path.join(
+        os.path.dirname(sktime.__file__),
+        "datasets",
+        "data",
+        name,
+        f"{name}_{split}.ts",
+    )
+
+
+@pytest.mark.parametrize("name", ["ArrowHead", "BasicMotions"])
+def test_load_from_tsfile_to_numpy(name):
+    path = _get_ts_path(name, "TRAIN")
+    X_expected, y_expected = load_from_tsfile_to_dataframe(path)
+
+    X, y = load_from_tsfile_to_numpy(path)
+    np.testing.assert_array_equal(X, from_nested_to_3d_numpy(X_expected))
+    np.testing.assert_array_equal(y, y_expected)
+
+    # chunks of instances
+    chunks = list(iter_tsfile_chunks(path, chunk_size=7))
+    assert [len(X_chunk) for X_chunk, _ in chunks[:-1]] == [7] * (len(chunks) - 1)
+    np.testing.assert_array_equal(np.concatenate([c[0] for c in chunks]), X)
+    np.testing.assert_array_equal(np.concatenate([c[1] for c in chunks]), y)
+
+
+def test_load_from_tsfile_to_numpy_unequal_length():
+    path = _get_ts_path("PLAID", "TRAIN")
+    X_expected, y_expected = load_from_tsfile_to_dataframe(path)
+
+    with pytest.raises(TsFileParseException):
+        load_from_tsfile_to_numpy(path)
+
+    (values, offsets), y = load_from_tsfile_to_numpy(path, return_ragged=True)
+    np.testing.assert_array_equal(y, y_expected)
+    assert offsets.shape == (len(X_expected), 2)
+    for i, series in enumerate(X_expected.iloc[:, 0]):
+        np.testing.assert_array_equal(
+            values[offsets[i, 0] : offsets[i, 1]], series.to_numpy()
+        )
+
+
+def _write_ts_data(tmpdir, data):
+    path = tmpdir.join("test.ts")
+    path.write(
+        "@problemName Test\n@timeStamps false\n@univariate false\n"
+        "@classLabel true a b\n@data\n" + data
+    )
+    return str(path)
+
+
+def test_load_from_tsfile_to_numpy_missing_values(tmpdir):
+    path = _write_ts_data(tmpdir, "1,2,3:4,5,6:a\n1,?,3:4,5,6:b\n")
+    X, y = load_from_tsfile_to_numpy(path)
+    assert np.isnan(X[1, 0, 1])
+    np.testing.assert_array_equal(y, ["a", "b"])
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "1,2,3:4,5:a\n",
+        "1,2,3:4,5,6:a\n1,2,3:a\n",
+        "1,2,x:4,5,6:a\n",
+    ],
+)
+def test_load_from_tsfile_to_numpy_invalid_data(tmpdir, data):
+    path = _write_ts_data(tmpdir, data)
+    with pytest.raises(TsFileParseException):
+        load_from_tsfile_to_numpy(path)
+
+
 def test_load_from_long_to_dataframe(tmpdir):
     # create and save a example long-format file to csv
     test_dataframe = generate_example_long_table()
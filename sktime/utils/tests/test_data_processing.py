@@ -224,3 +224,24 @@ def test_from_nested_to_long(n_instances, n_columns, n_timepoints):
     assert isinstance(X_long, pd.DataFrame)
     assert X_long.shape == (n_instances * n_timepoints * n_columns, 4)
     assert (X_long.columns == ["case_id", "reading_id", "dim_id", "value"]).all()
+
+
+def test_from_nested_to_3d_numpy_cache():
+    nested, _ = make_classification_problem(5, 2, 10)
+    expected = from_nested_to_3d_numpy(nested)
+
+    # returned arrays can be modified without changing cached ones
+    array = from_nested_to_3d_numpy(nested)
+    np.testing.assert_array_equal(array, expected)
+    array[:] = 0
+    np.testing.assert_array_equal(from_nested_to_3d_numpy(nested), expected)
+
+    # replaced cells are converted again
+    nested.iat[1, 0] = nested.iat[1, 0] * 2
+    expected[1, 0] *= 2
+    np.testing.assert_array_equal(from_nested_to_3d_numpy(nested), expected)
+
+    # unequal-length cells are not converted
+    nested.iat[2, 1] = nested.iat[2, 1].iloc[:5]
+    with pytest.raises(ValueError):
+        from_nested_to_3d_numpy(nested)